@@ -0,0 +1,45 @@
+"""Add crawl watermarks
+
+Revision ID: 5c1e8a2f9d34
+Revises: 12ae92657f7b
+Create Date: 2026-10-19 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8a2f9d34'
+down_revision: Union[str, Sequence[str], None] = '12ae92657f7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('crawl_watermarks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('query', sa.Text(), nullable=False),
+    sa.Column('last_published_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_article_url', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('company_id', 'query', name='uq_crawl_watermark_company_query')
+    )
+    op.create_index(op.f('ix_crawl_watermarks_company_id'), 'crawl_watermarks', ['company_id'], unique=False)
+    op.create_index(op.f('ix_crawl_watermarks_created_at'), 'crawl_watermarks', ['created_at'], unique=False)
+    op.create_index(op.f('ix_crawl_watermarks_id'), 'crawl_watermarks', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_crawl_watermarks_id'), table_name='crawl_watermarks')
+    op.drop_index(op.f('ix_crawl_watermarks_created_at'), table_name='crawl_watermarks')
+    op.drop_index(op.f('ix_crawl_watermarks_company_id'), table_name='crawl_watermarks')
+    op.drop_table('crawl_watermarks')
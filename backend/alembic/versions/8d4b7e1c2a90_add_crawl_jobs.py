@@ -0,0 +1,60 @@
+"""Add persistent crawl job queue
+
+Revision ID: 8d4b7e1c2a90
+Revises: 5c1e8a2f9d34
+Create Date: 2026-10-19 11:20:07.284615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4b7e1c2a90'
+down_revision: Union[str, Sequence[str], None] = '5c1e8a2f9d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('crawl_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('run_id', sa.String(length=64), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('max_articles', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('lease_owner', sa.String(length=64), nullable=True),
+    sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('checkpoint', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('articles_saved', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id', 'company_id', name='uq_crawl_job_run_company')
+    )
+    op.create_index(op.f('ix_crawl_jobs_company_id'), 'crawl_jobs', ['company_id'], unique=False)
+    op.create_index(op.f('ix_crawl_jobs_created_at'), 'crawl_jobs', ['created_at'], unique=False)
+    op.create_index(op.f('ix_crawl_jobs_id'), 'crawl_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_crawl_jobs_run_id'), 'crawl_jobs', ['run_id'], unique=False)
+    op.create_index('ix_crawl_jobs_status_next_attempt', 'crawl_jobs', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_crawl_jobs_status_next_attempt', table_name='crawl_jobs')
+    op.drop_index(op.f('ix_crawl_jobs_run_id'), table_name='crawl_jobs')
+    op.drop_index(op.f('ix_crawl_jobs_id'), table_name='crawl_jobs')
+    op.drop_index(op.f('ix_crawl_jobs_created_at'), table_name='crawl_jobs')
+    op.drop_index(op.f('ix_crawl_jobs_company_id'), table_name='crawl_jobs')
+    op.drop_table('crawl_jobs')
@@ -0,0 +1,39 @@
+"""Add ingest-time company mention classification to articles
+
+Revision ID: a3f6c9d18e52
+Revises: 8d4b7e1c2a90
+Create Date: 2026-10-19 11:48:55.910372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f6c9d18e52'
+down_revision: Union[str, Sequence[str], None] = '8d4b7e1c2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('is_company_mention', sa.Boolean(), nullable=True))
+    op.add_column('articles', sa.Column('mention_rule_hash', sa.String(length=16), nullable=True))
+    # 기존 기사는 NULL(미분류)로 두고 스케줄러 백필 작업이 채운다
+    op.create_index(
+        'ix_articles_company_mention_published',
+        'articles',
+        ['company_id', 'published_at'],
+        unique=False,
+        postgresql_where=sa.text('is_company_mention IS true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_company_mention_published', table_name='articles')
+    op.drop_column('articles', 'mention_rule_hash')
+    op.drop_column('articles', 'is_company_mention')
@@ -0,0 +1,30 @@
+"""Add merkle content tree to document versions for hash-based diffs
+
+Revision ID: a4e9c2f7b813
+Revises: f1d8b6a3c970
+Create Date: 2026-10-19 19:32:08.417925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9c2f7b813'
+down_revision: Union[str, Sequence[str], None] = 'f1d8b6a3c970'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 버전은 비교 시 스냅샷에서 계산, scripts/db/compact_document_versions.py 실행 시 채워진다
+    op.add_column('document_versions', sa.Column('content_tree', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('document_versions', 'content_tree')
@@ -0,0 +1,58 @@
+"""Add keyset pagination indexes on articles
+
+Revision ID: b71e2d4c9f08
+Revises: a3f6c9d18e52
+Create Date: 2026-10-19 12:15:32.047718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e2d4c9f08'
+down_revision: Union[str, Sequence[str], None] = 'a3f6c9d18e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 피드/목록: ORDER BY published_at DESC NULLS LAST, id DESC
+    op.create_index(
+        'ix_articles_published_at_id',
+        'articles',
+        [sa.text('published_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_articles_crawled_at_id',
+        'articles',
+        [sa.text('crawled_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    # 회사별 언급 기사: 키셋 순서와 일치하도록 id 포함하여 재생성
+    op.drop_index('ix_articles_company_mention_published', table_name='articles')
+    op.create_index(
+        'ix_articles_company_mention_published',
+        'articles',
+        ['company_id', sa.text('published_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_company_mention IS true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_company_mention_published', table_name='articles')
+    op.create_index(
+        'ix_articles_company_mention_published',
+        'articles',
+        ['company_id', 'published_at'],
+        unique=False,
+        postgresql_where=sa.text('is_company_mention IS true'),
+    )
+    op.drop_index('ix_articles_crawled_at_id', table_name='articles')
+    op.drop_index('ix_articles_published_at_id', table_name='articles')
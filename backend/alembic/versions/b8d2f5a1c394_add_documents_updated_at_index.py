@@ -0,0 +1,36 @@
+"""Add (updated_at, id) index for keyset document listing
+
+Revision ID: b8d2f5a1c394
+Revises: a4e9c2f7b813
+Create Date: 2026-10-19 20:14:37.902164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f5a1c394'
+down_revision: Union[str, Sequence[str], None] = 'a4e9c2f7b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_documents_updated_at_id',
+            'documents',
+            ['updated_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_documents_updated_at_id', table_name='documents', postgresql_concurrently=True)
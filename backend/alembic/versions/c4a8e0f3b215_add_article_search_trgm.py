@@ -0,0 +1,38 @@
+"""Add trigram search index on article title + summary
+
+Revision ID: c4a8e0f3b215
+Revises: b71e2d4c9f08
+Create Date: 2026-10-19 12:41:18.663290
+
+저장 생성 컬럼은 articles 전체를 ACCESS EXCLUSIVE 잠금으로 재작성하므로 컬럼 없이
+(coalesce(title, '') || ' ' || coalesce(summary, '')) 식에 GIN 인덱스를 CONCURRENTLY 로 만든다.
+검색 쿼리는 models.ARTICLE_SEARCH_TEXT 로 같은 식을 사용해야 인덱스를 탄다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e0f3b215'
+down_revision: Union[str, Sequence[str], None] = 'b71e2d4c9f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # 운영 중 쓰기 차단 없이 인덱스 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_articles_search_text_trgm ON articles "
+            "USING gin ((coalesce(title, '') || ' ' || coalesce(summary, '')) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_articles_search_text_trgm', table_name='articles', postgresql_concurrently=True)
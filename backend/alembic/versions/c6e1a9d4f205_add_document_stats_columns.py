@@ -0,0 +1,96 @@
+"""Add denormalized document/section stats columns
+
+Revision ID: c6e1a9d4f205
+Revises: b8d2f5a1c394
+Create Date: 2026-10-19 21:02:11.417529
+
+기존 행의 통계는 upgrade 안에서 SQL 로 계산해 채운다 (목록/버전/복제가 컬럼을 바로 읽고,
+증분 갱신 x = x + delta 가 0 이 아닌 실제 값에서 시작하도록).
+계산 규칙은 src/documents/document_stats.py 와 같다. 단어 수는 정규식 \S+ 토큰 수로 세므로
+Python str.split() 과 공백 문자 판정이 다를 수 있으며, 정확히 맞추려면 scripts/db/backfill_document_stats.py 로 재계산한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1a9d4f205'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f5a1c394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DOCUMENT_COLUMNS = ('section_count', 'block_count', 'char_count', 'word_count', 'gri_reference_count')
+SECTION_COLUMNS = ('block_count', 'char_count', 'word_count', 'gri_reference_count')
+
+# 섹션 통계: 블록 수 / 블록 inline 텍스트(content[].text 연결) 문자 수와 단어 수 / GRI 참조 코드 수
+SECTION_STATS_SQL = r"""
+UPDATE sections SET
+    (block_count, char_count, word_count) = (
+        SELECT
+            count(*),
+            coalesce(sum(length(block_text.text)), 0),
+            coalesce(sum((SELECT count(*) FROM regexp_matches(block_text.text, '\S+', 'g'))), 0)
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(sections.blocks) = 'array' THEN sections.blocks ELSE '[]'::jsonb END
+        ) AS block
+        CROSS JOIN LATERAL (
+            SELECT coalesce(string_agg(item.value ->> 'text', '' ORDER BY item.ordinality), '') AS text
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(block.value -> 'content') = 'array' THEN block.value -> 'content' ELSE '[]'::jsonb END
+            ) WITH ORDINALITY AS item
+            WHERE jsonb_typeof(item.value) = 'object'
+        ) AS block_text
+    ),
+    gri_reference_count = (
+        SELECT coalesce(sum(
+            CASE
+                WHEN jsonb_typeof(ref.value -> 'code') = 'array' THEN jsonb_array_length(ref.value -> 'code')
+                WHEN ref.value -> 'code' IS NULL
+                    OR ref.value -> 'code' IN ('null'::jsonb, '""'::jsonb, 'false'::jsonb, '0'::jsonb, '{}'::jsonb) THEN 0
+                ELSE 1
+            END
+        ), 0)
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(sections.gri_reference) = 'array' THEN sections.gri_reference ELSE '[]'::jsonb END
+        ) AS ref
+        WHERE jsonb_typeof(ref.value) = 'object'
+    )
+"""
+
+# 문서 통계: 섹션 수 + 섹션 통계 합계
+DOCUMENT_STATS_SQL = """
+UPDATE documents SET
+    (section_count, block_count, char_count, word_count, gri_reference_count) = (
+        SELECT
+            count(*),
+            coalesce(sum(sections.block_count), 0),
+            coalesce(sum(sections.char_count), 0),
+            coalesce(sum(sections.word_count), 0),
+            coalesce(sum(sections.gri_reference_count), 0)
+        FROM sections
+        WHERE sections.document_id = documents.id
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 상수 기본값 컬럼 추가는 테이블 재작성 없이 메타데이터만 변경 (PostgreSQL 11+)
+    for name in DOCUMENT_COLUMNS:
+        op.add_column('documents', sa.Column(name, sa.Integer(), server_default='0', nullable=False))
+    for name in SECTION_COLUMNS:
+        op.add_column('sections', sa.Column(name, sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 행 통계 채우기 (같은 트랜잭션 - 배포된 코드가 0 에서 시작하는 카운터를 읽지 않도록)
+    op.execute(SECTION_STATS_SQL)
+    op.execute(DOCUMENT_STATS_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in SECTION_COLUMNS:
+        op.drop_column('sections', name)
+    for name in DOCUMENT_COLUMNS:
+        op.drop_column('documents', name)
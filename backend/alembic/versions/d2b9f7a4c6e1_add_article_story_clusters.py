@@ -0,0 +1,47 @@
+"""Add near-duplicate story clusters to articles and story counts to daily rollups
+
+Revision ID: d2b9f7a4c6e1
+Revises: c4a8e0f3b215
+Create Date: 2026-10-19 14:05:32.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b9f7a4c6e1'
+down_revision: Union[str, Sequence[str], None] = 'c4a8e0f3b215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('simhash', sa.BigInteger(), nullable=True))
+    op.add_column('articles', sa.Column('story_cluster_id', sa.Integer(), nullable=True))
+    op.add_column(
+        'mention_trends_daily',
+        sa.Column('story_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    # 기존 집계는 스토리 백필 전까지 기사 수 = 스토리 수
+    op.execute("UPDATE mention_trends_daily SET story_count = mention_count")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_articles_story_cluster_id'),
+            'articles',
+            ['story_cluster_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_articles_story_cluster_id'), table_name='articles', postgresql_concurrently=True)
+    op.drop_column('mention_trends_daily', 'story_count')
+    op.drop_column('articles', 'story_cluster_id')
+    op.drop_column('articles', 'simhash')
@@ -0,0 +1,49 @@
+"""Add zstd-compressed version payload storage
+
+Revision ID: d3f7b2e8a416
+Revises: c6e1a9d4f205
+Create Date: 2026-10-19 21:47:05.288143
+
+기존 행은 JSONB 형식 그대로 두고, scripts/db/compress_document_versions.py 로 배치 변환한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f7b2e8a416'
+down_revision: Union[str, Sequence[str], None] = 'c6e1a9d4f205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'version_compression_dicts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.add_column('document_versions', sa.Column('payload_zstd', sa.LargeBinary(), nullable=True))
+    op.add_column('document_versions', sa.Column('payload_dict_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_document_versions_payload_dict_id',
+        'document_versions', 'version_compression_dicts',
+        ['payload_dict_id'], ['id']
+    )
+    # 이미 zstd 로 압축된 값이므로 TOAST pglz 재압축 시도 없이 바로 외부 저장
+    op.execute("ALTER TABLE document_versions ALTER COLUMN payload_zstd SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_document_versions_payload_dict_id', 'document_versions', type_='foreignkey')
+    op.drop_column('document_versions', 'payload_dict_id')
+    op.drop_column('document_versions', 'payload_zstd')
+    op.drop_table('version_compression_dicts')
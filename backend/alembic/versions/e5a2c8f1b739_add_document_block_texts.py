@@ -0,0 +1,53 @@
+"""Add document block search texts with trigram index
+
+Revision ID: e5a2c8f1b739
+Revises: d3f7b2e8a416
+Create Date: 2026-10-19 22:31:52.640318
+
+기존 섹션은 scripts/db/reindex_document_search.py 로 색인한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a2c8f1b739'
+down_revision: Union[str, Sequence[str], None] = 'd3f7b2e8a416'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        'document_block_texts',
+        sa.Column('section_id', sa.Integer(), nullable=False),
+        sa.Column('block_id', sa.String(length=255), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('block_type', sa.String(length=50), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['section_id'], ['sections.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('section_id', 'block_id')
+    )
+    # 새 테이블이므로 CONCURRENTLY 없이 생성
+    op.create_index(op.f('ix_document_block_texts_document_id'), 'document_block_texts', ['document_id'], unique=False)
+    op.create_index(
+        'ix_document_block_texts_text_trgm',
+        'document_block_texts',
+        ['text'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_document_block_texts_text_trgm', table_name='document_block_texts')
+    op.drop_index(op.f('ix_document_block_texts_document_id'), table_name='document_block_texts')
+    op.drop_table('document_block_texts')
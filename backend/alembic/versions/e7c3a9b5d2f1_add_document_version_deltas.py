@@ -0,0 +1,44 @@
+"""Store document versions as keyframes plus structural deltas
+
+Revision ID: e7c3a9b5d2f1
+Revises: d2b9f7a4c6e1
+Create Date: 2026-10-19 16:22:08.573940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3a9b5d2f1'
+down_revision: Union[str, Sequence[str], None] = 'd2b9f7a4c6e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 버전은 모두 키프레임 (base_version_number = NULL)
+    op.add_column('document_versions', sa.Column('delta_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('document_versions', sa.Column('base_version_number', sa.Integer(), nullable=True))
+    op.alter_column('document_versions', 'snapshot_data', existing_type=postgresql.JSONB(astext_type=sa.Text()), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 델타 버전은 전체 스냅샷이 없으므로 자동으로 되돌릴 수 없다
+    bind = op.get_bind()
+    delta_count = bind.execute(
+        sa.text("SELECT count(*) FROM document_versions WHERE base_version_number IS NOT NULL")
+    ).scalar()
+    if delta_count:
+        raise RuntimeError(
+            f"{delta_count} delta-encoded document versions exist; "
+            "run scripts/db/compact_document_versions.py --keyframe-interval 1 before downgrading"
+        )
+    op.alter_column('document_versions', 'snapshot_data', existing_type=postgresql.JSONB(astext_type=sa.Text()), nullable=False)
+    op.drop_column('document_versions', 'base_version_number')
+    op.drop_column('document_versions', 'delta_data')
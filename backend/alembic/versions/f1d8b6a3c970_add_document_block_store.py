@@ -0,0 +1,64 @@
+"""Add content-addressed document block store referenced by versions
+
+Revision ID: f1d8b6a3c970
+Revises: e7c3a9b5d2f1
+Create Date: 2026-10-19 18:47:51.206334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d8b6a3c970'
+down_revision: Union[str, Sequence[str], None] = 'e7c3a9b5d2f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('document_blocks',
+    sa.Column('hash', sa.String(length=32), nullable=False),
+    sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.create_index(op.f('ix_document_blocks_last_used_at'), 'document_blocks', ['last_used_at'], unique=False)
+
+    # 기존 버전은 블록이 인라인 (block_hashes = NULL), scripts/db/compact_document_versions.py 로 전환
+    op.add_column('document_versions', sa.Column('block_hashes', postgresql.ARRAY(sa.String(length=32)), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_document_versions_block_hashes',
+            'document_versions',
+            ['block_hashes'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 해시 참조 버전은 블록 저장소 없이 복원할 수 없다
+    # (이전 리비전 downgrade 의 델타 검사까지 한 번에 통과하도록 전체 스냅샷 + 인라인 블록으로 되돌림)
+    bind = op.get_bind()
+    packed_count = bind.execute(
+        sa.text("SELECT count(*) FROM document_versions WHERE block_hashes IS NOT NULL")
+    ).scalar()
+    if packed_count:
+        raise RuntimeError(
+            f"{packed_count} document versions reference the block store; "
+            "run scripts/db/compact_document_versions.py --keyframe-interval 1 --inline-blocks before downgrading"
+        )
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_document_versions_block_hashes', table_name='document_versions', postgresql_concurrently=True)
+    op.drop_column('document_versions', 'block_hashes')
+    op.drop_index(op.f('ix_document_blocks_last_used_at'), table_name='document_blocks')
+    op.drop_table('document_blocks')
@@ -0,0 +1,79 @@
+"""
+문서 통계 재계산 스크립트 (섹션 통계 + 문서 합계)
+
+기존 행 통계는 마이그레이션(c6e1a9d4f205)이 SQL 로 채우므로, 이 스크립트는 통계가 어긋난 문서
+(SQL 단어 수 판정 차이, 수동 데이터 수정 등)의 섹션 blocks 를 읽어 Python 규칙으로 전체 재계산할 때 사용한다.
+문서 묶음 하나 = 트랜잭션 하나로 처리하므로 중간에 중단해도 처리된 문서는 유지된다.
+
+사용법:
+    python scripts/db/backfill_document_stats.py
+    python scripts/db/backfill_document_stats.py --document-id 12
+    python scripts/db/backfill_document_stats.py --batch-size 100
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for local execution
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sqlalchemy import select, update
+
+from src.core.database import AsyncSessionLocal
+from src.documents.document_stats import document_totals, section_stats
+from src.documents.models import Document, Section
+
+
+async def backfill_document_stats(document_id: int = None, batch_size: int = 200):
+    """문서 ID 순 묶음별로 섹션/문서 통계 재계산"""
+    after = 0
+    total_documents = total_sections = 0
+
+    while True:
+        async with AsyncSessionLocal() as session:
+            stmt = select(Document.id).where(Document.id > after).order_by(Document.id).limit(batch_size)
+            if document_id is not None:
+                stmt = stmt.where(Document.id == document_id)
+            document_ids = (await session.execute(stmt)).scalars().all()
+            if not document_ids:
+                break
+            after = document_ids[-1]
+
+            result = await session.execute(
+                select(Section.id, Section.document_id, Section.blocks, Section.gri_reference)
+                .where(Section.document_id.in_(document_ids))
+            )
+            sections = {doc_id: [] for doc_id in document_ids}
+            section_rows = []
+            for section_id, doc_id, blocks, gri_reference in result.all():
+                stats = section_stats({"blocks": blocks, "gri_reference": gri_reference})
+                sections[doc_id].append(stats)
+                section_rows.append({"id": section_id, **stats})
+
+            # ORM 기본키 기준 bulk UPDATE (executemany)
+            if section_rows:
+                await session.execute(update(Section), section_rows)
+            await session.execute(
+                update(Document),
+                [{"id": doc_id, **document_totals(stats)} for doc_id, stats in sections.items()]
+            )
+            await session.commit()
+
+        total_documents += len(document_ids)
+        total_sections += len(section_rows)
+        print(f"✅ 문서 {document_ids[0]}~{after}: {len(document_ids)}개, 섹션 {len(section_rows)}개")
+
+    print(f"\n📊 전체: 문서 {total_documents}개, 섹션 {total_sections}개 통계 재계산")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서/섹션 통계 컬럼 재계산")
+    parser.add_argument("--document-id", type=int, default=None, help="특정 문서만 처리")
+    parser.add_argument("--batch-size", type=int, default=200, help="트랜잭션당 문서 수")
+    args = parser.parse_args()
+    asyncio.run(backfill_document_stats(args.document_id, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
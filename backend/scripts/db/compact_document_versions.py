@@ -0,0 +1,75 @@
+"""
+문서 버전 재인코딩 스크립트 (전체 스냅샷 → 키프레임 + 델타 + 블록 해시 참조)
+
+델타/블록 저장소 도입 이전에 쌓인 전체 스냅샷 버전을 문서 단위로 다시 인코딩한다.
+문서 하나 = 트랜잭션 하나로 처리하므로 중간에 중단해도 처리된 문서는 유지된다.
+버전 비교용 머클 트리(content_tree)가 없거나 블록 ID 가 없는 이전 형식이면 트리도 함께 다시 채운다.
+
+사용법:
+    python scripts/db/compact_document_versions.py
+    python scripts/db/compact_document_versions.py --document-id 12
+    python scripts/db/compact_document_versions.py --keyframe-interval 1 --inline-blocks   # 전체 스냅샷으로 되돌리기
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for local execution
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sqlalchemy import select
+
+from src.core.database import AsyncSessionLocal
+from src.documents.constants import VERSION_KEYFRAME_INTERVAL
+from src.documents.models import DocumentVersion
+from src.documents.version_service import VersionService
+
+
+async def compact_document_versions(
+    document_id: int = None,
+    keyframe_interval: int = VERSION_KEYFRAME_INTERVAL,
+    inline_blocks: bool = False
+):
+    """버전이 있는 문서별로 재인코딩"""
+    async with AsyncSessionLocal() as session:
+        stmt = select(DocumentVersion.document_id).distinct().order_by(DocumentVersion.document_id)
+        if document_id is not None:
+            stmt = stmt.where(DocumentVersion.document_id == document_id)
+        document_ids = (await session.execute(stmt)).scalars().all()
+
+    print(f"📖 대상 문서 {len(document_ids)}개 (키프레임 간격 {keyframe_interval}, 블록 {'인라인' if inline_blocks else '해시 참조'})")
+
+    total_before = total_after = total_versions = 0
+    for doc_id in document_ids:
+        async with AsyncSessionLocal() as session:
+            try:
+                stats = await VersionService(session).compact_versions(doc_id, keyframe_interval, inline_blocks)
+            except Exception as e:
+                await session.rollback()
+                print(f"❌ 문서 {doc_id} 재인코딩 실패: {e}")
+                continue
+
+        total_versions += stats["versions"]
+        total_before += stats["bytes_before"]
+        total_after += stats["bytes_after"]
+        print(
+            f"✅ 문서 {doc_id}: 버전 {stats['versions']}개, "
+            f"{stats['bytes_before']:,} → {stats['bytes_after']:,} bytes"
+        )
+
+    ratio = total_before / total_after if total_after else 0
+    print(f"\n🗜️ 전체: 버전 {total_versions}개, {total_before:,} → {total_after:,} bytes ({ratio:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 버전 키프레임 + 델타 재인코딩")
+    parser.add_argument("--document-id", type=int, default=None, help="특정 문서만 처리")
+    parser.add_argument("--keyframe-interval", type=int, default=VERSION_KEYFRAME_INTERVAL, help="키프레임 간격 (1 = 전체 스냅샷)")
+    parser.add_argument("--inline-blocks", action="store_true", help="블록을 버전 행에 그대로 저장 (블록 저장소 미사용)")
+    args = parser.parse_args()
+    asyncio.run(compact_document_versions(args.document_id, args.keyframe_interval, args.inline_blocks))
+
+
+if __name__ == "__main__":
+    main()
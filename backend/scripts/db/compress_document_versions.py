@@ -0,0 +1,103 @@
+"""
+문서 버전 저장 형식 변환 스크립트 (JSONB ↔ zstd 압축 bytea)
+
+버전 행의 payload(블록 해시 참조 형태의 키프레임/델타)만 다시 저장하며 스냅샷 복원이나 블록 저장은 하지 않는다.
+버전 ID 순 배치 하나 = 트랜잭션 하나로 처리하므로 중간에 중단해도 처리된 배치는 유지된다.
+새로 쓰는 버전의 형식은 settings.VERSION_COMPRESSION_ENABLED 로 정한다.
+
+사용법:
+    python scripts/db/compress_document_versions.py --train-dict          # 표본으로 공유 사전 학습 후 압축
+    python scripts/db/compress_document_versions.py                       # 압축 (최근 사전 사용)
+    python scripts/db/compress_document_versions.py --recompress          # 이미 압축된 행도 최근 사전으로 재압축
+    python scripts/db/compress_document_versions.py --decompress          # JSONB 형식으로 되돌리기
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for local execution
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sqlalchemy import select
+
+from src.core.database import AsyncSessionLocal
+from src.documents.constants import (
+    VERSION_COMPRESSION_BATCH_SIZE, VERSION_COMPRESSION_DICT_SAMPLES, VERSION_COMPRESSION_DICT_SIZE,
+)
+from src.documents.models import DocumentVersion
+from src.documents.version_compression import _zstd_available
+from src.documents.version_service import VersionService
+
+
+async def compress_document_versions(
+    document_id: int = None,
+    decompress: bool = False,
+    recompress: bool = False,
+    train_dict: bool = False,
+    dict_size: int = VERSION_COMPRESSION_DICT_SIZE,
+    samples: int = VERSION_COMPRESSION_DICT_SAMPLES,
+    batch_size: int = VERSION_COMPRESSION_BATCH_SIZE
+):
+    """버전 ID 순 배치로 저장 형식 변환"""
+    if not _zstd_available:
+        print("❌ zstandard 패키지가 필요합니다 (pip install zstandard)")
+        return
+
+    if train_dict:
+        async with AsyncSessionLocal() as session:
+            dict_id, size = await VersionService(session).train_compression_dictionary(samples, dict_size)
+        print(f"📚 사전 {dict_id} 학습 완료 ({size:,} bytes, 표본 최대 {samples}개)")
+
+    compress = not decompress
+    total_before = total_after = total_versions = 0
+    after = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            stmt = (
+                select(DocumentVersion)
+                .where(DocumentVersion.id > after)
+                .order_by(DocumentVersion.id)
+                .limit(batch_size)
+            )
+            if document_id is not None:
+                stmt = stmt.where(DocumentVersion.document_id == document_id)
+            if decompress:
+                stmt = stmt.where(DocumentVersion.payload_zstd.is_not(None))
+            elif not recompress:
+                stmt = stmt.where(DocumentVersion.payload_zstd.is_(None))
+            versions = (await session.execute(stmt)).scalars().all()
+            if not versions:
+                break
+            after = versions[-1].id
+
+            bytes_before, bytes_after = await VersionService(session).convert_payload_storage(versions, compress)
+            await session.commit()
+
+        total_versions += len(versions)
+        total_before += bytes_before
+        total_after += bytes_after
+        print(f"✅ 버전 ~{after}: {len(versions)}개, {bytes_before:,} → {bytes_after:,} bytes")
+
+    ratio = total_before / total_after if total_after else 0
+    print(f"\n🗜️ 전체: 버전 {total_versions}개, {total_before:,} → {total_after:,} bytes ({ratio:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 버전 payload 저장 형식 변환 (zstd)")
+    parser.add_argument("--document-id", type=int, default=None, help="특정 문서만 처리")
+    parser.add_argument("--decompress", action="store_true", help="JSONB 형식으로 되돌리기")
+    parser.add_argument("--recompress", action="store_true", help="이미 압축된 행도 최근 사전으로 재압축")
+    parser.add_argument("--train-dict", action="store_true", help="변환 전에 표본으로 공유 사전 학습")
+    parser.add_argument("--dict-size", type=int, default=VERSION_COMPRESSION_DICT_SIZE, help="사전 크기 (bytes)")
+    parser.add_argument("--samples", type=int, default=VERSION_COMPRESSION_DICT_SAMPLES, help="사전 학습 표본 수")
+    parser.add_argument("--batch-size", type=int, default=VERSION_COMPRESSION_BATCH_SIZE, help="트랜잭션당 버전 수")
+    args = parser.parse_args()
+    asyncio.run(compress_document_versions(
+        args.document_id, args.decompress, args.recompress, args.train_dict,
+        args.dict_size, args.samples, args.batch_size
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+문서 블록 검색 색인 재구축 스크립트 (document_block_texts)
+
+검색 색인 도입 이전 섹션이나 색인이 어긋난 문서의 섹션 blocks 를 읽어 섹션 단위로 다시 색인한다.
+바뀌지 않은 블록 행은 갱신하지 않으므로 이미 색인된 문서를 다시 돌려도 인덱스 쓰기는 거의 없다.
+문서 묶음 하나 = 트랜잭션 하나로 처리하므로 중간에 중단해도 처리된 문서는 유지된다.
+
+사용법:
+    python scripts/db/reindex_document_search.py
+    python scripts/db/reindex_document_search.py --document-id 12
+    python scripts/db/reindex_document_search.py --batch-size 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add src to path for local execution
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sqlalchemy import select
+
+from src.core.database import AsyncSessionLocal
+from src.documents.models import Document, Section
+from src.documents.search_index import index_sections
+
+
+async def reindex_document_search(document_id: int = None, batch_size: int = 100):
+    """문서 ID 순 묶음별로 섹션 검색 행 재구축"""
+    after = 0
+    total_documents = total_sections = 0
+
+    while True:
+        async with AsyncSessionLocal() as session:
+            stmt = select(Document.id).where(Document.id > after).order_by(Document.id).limit(batch_size)
+            if document_id is not None:
+                stmt = stmt.where(Document.id == document_id)
+            document_ids = (await session.execute(stmt)).scalars().all()
+            if not document_ids:
+                break
+            after = document_ids[-1]
+
+            result = await session.execute(
+                select(Section.document_id, Section.id, Section.blocks)
+                .where(Section.document_id.in_(document_ids))
+                .order_by(Section.document_id)
+            )
+            sections = {}
+            for doc_id, section_id, blocks in result.all():
+                sections.setdefault(doc_id, []).append((section_id, blocks))
+            for doc_id, doc_sections in sections.items():
+                await index_sections(session, doc_id, doc_sections)
+            await session.commit()
+
+        section_count = sum(len(doc_sections) for doc_sections in sections.values())
+        total_documents += len(document_ids)
+        total_sections += section_count
+        print(f"✅ 문서 {document_ids[0]}~{after}: {len(document_ids)}개, 섹션 {section_count}개")
+
+    print(f"\n🔎 전체: 문서 {total_documents}개, 섹션 {total_sections}개 색인")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 블록 검색 색인 재구축")
+    parser.add_argument("--document-id", type=int, default=None, help="특정 문서만 처리")
+    parser.add_argument("--batch-size", type=int, default=100, help="트랜잭션당 문서 수")
+    args = parser.parse_args()
+    asyncio.run(reindex_document_search(args.document_id, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
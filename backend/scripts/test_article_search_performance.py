@@ -0,0 +1,199 @@
+"""
+기사 검색 성능 비교 테스트: 제목 ILIKE (trgm 인덱스 없음) vs 제목+요약 식 pg_trgm GIN 인덱스
+
+운영 articles 테이블은 건드리지 않고, 같은 형태의 임시 테이블(bench_article_search)에
+가상 기사 N건을 서버 측 generate_series 로 적재한 뒤 검색어별 p50/p95 지연을 측정한다.
+- 페이지 쿼리: 기존 제목 최신순 / 신규 최신순 / 신규 관련도 순(최신 매칭 K건 후보)
+- 총 개수 쿼리: 페이지 모드에서 매 요청 함께 실행되는 count
+
+사용법:
+    python scripts/test_article_search_performance.py --rows 1000000 --runs 30
+    python scripts/test_article_search_performance.py --keep   # 테이블 유지 (재실행 시 적재 생략)
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.articles.constants import SEARCH_RELEVANCE_CANDIDATES
+from src.core.database import AsyncSessionLocal
+
+TABLE = "bench_article_search"
+
+# 검색 문서 식 (models.ARTICLE_SEARCH_TEXT / ix_articles_search_text_trgm 과 같은 식)
+SEARCH_TEXT = "(coalesce(title, '') || ' ' || coalesce(summary, ''))"
+
+# 최신순 정렬 / 발행일 인덱스 (운영 ix_articles_published_at_id, shared.pagination.keyset_order 와 같은 순서)
+PUBLISHED_KEY = "published_at DESC NULLS LAST, id DESC"
+PUBLISHED_ORDER = f"({PUBLISHED_KEY})"
+
+# 가상 기사 생성용 어휘 (회사명 / ESG 용어 / 일반 단어)
+COMPANIES = ["그리너리", "엔츠", "에코매니지", "탄소중립랩", "클라이밋테크", "Greenery", "AENTS", "ESGPlus"]
+ESG_TERMS = ["탄소회계", "배출권", "넷제로", "재생에너지", "LCA", "공급망 실사", "지속가능경영", "ESG 공시", "스코프3", "친환경"]
+COMMON = ["기업", "플랫폼", "투자", "출시", "협약", "솔루션", "서비스", "시장", "확대", "발표", "도입", "지원", "사업", "성장"]
+
+# 측정 검색어: 회사명 / ESG 용어 / 2단어 / 희귀어
+QUERIES = ["그리너리", "탄소회계", "넷제로 투자", "공급망 실사", "스코프3 플랫폼", "존재하지않는검색어"]
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _sql_array(words):
+    return "ARRAY[" + ",".join(_sql_literal(w) for w in words) + "]"
+
+
+async def seed(rows: int):
+    """임시 테이블 생성 + 가상 기사 적재 + 인덱스 생성 (운영 articles 와 같은 발행일 / trgm 인덱스)"""
+    async with AsyncSessionLocal() as session:
+        exists = (await session.execute(text(f"SELECT to_regclass('{TABLE}') IS NOT NULL"))).scalar()
+        if exists:
+            count = (await session.execute(text(f"SELECT count(*) FROM {TABLE}"))).scalar()
+            if count >= rows:
+                # 이전 버전 스크립트로 만든 테이블에는 발행일 인덱스가 없을 수 있음
+                await session.execute(text(f"CREATE INDEX IF NOT EXISTS {TABLE}_published ON {TABLE} {PUBLISHED_ORDER}"))
+                await session.execute(text(f"ANALYZE {TABLE}"))
+                await session.commit()
+                print(f"✓ Reusing {TABLE} ({count:,} rows)")
+                return
+            await session.execute(text(f"DROP TABLE {TABLE}"))
+
+        await session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await session.execute(text(f"""
+            CREATE TABLE {TABLE} (
+                id bigserial PRIMARY KEY,
+                title text NOT NULL,
+                summary text,
+                published_at timestamptz
+            )
+        """))
+
+        pick = lambda arr: f"({arr})[1 + floor(random() * array_length({arr}, 1))::int]"
+        companies, esg, common = _sql_array(COMPANIES), _sql_array(ESG_TERMS), _sql_array(COMMON)
+
+        seed_start = time.time()
+        await session.execute(text(f"""
+            INSERT INTO {TABLE} (title, summary, published_at)
+            SELECT
+                {pick(companies)} || ', ' || {pick(esg)} || ' ' || {pick(common)} || ' ' || {pick(common)},
+                {pick(companies)} || '는 ' || {pick(esg)} || ' ' || {pick(common)} || '을 ' || {pick(common)} || '했다. '
+                    || {pick(esg)} || ' ' || {pick(common)} || ' ' || {pick(common)} || ' ' || md5(g::text),
+                now() - (random() * interval '730 days')
+            FROM generate_series(1, :rows) AS g
+        """), {"rows": rows})
+        print(f"✓ Seeded {rows:,} rows: {time.time() - seed_start:.1f}s")
+
+        # 운영 ix_articles_published_at_id 와 같은 발행일 인덱스 (기존 최신순 검색이 사용)
+        await session.execute(text(f"CREATE INDEX {TABLE}_published ON {TABLE} {PUBLISHED_ORDER}"))
+        index_start = time.time()
+        await session.execute(text(f"CREATE INDEX {TABLE}_trgm ON {TABLE} USING gin ({SEARCH_TEXT} gin_trgm_ops)"))
+        await session.execute(text(f"ANALYZE {TABLE}"))
+        print(f"✓ GIN trigram index built: {time.time() - index_start:.1f}s")
+        await session.commit()
+
+
+async def measure(sql: str, params: dict, runs: int):
+    """동일 쿼리 반복 실행 후 (p50, p95, 결과 수) 반환 (ms)"""
+    timings = []
+    result = None
+    async with AsyncSessionLocal() as session:
+        for _ in range(runs):
+            start = time.perf_counter()
+            rows = (await session.execute(text(sql), params)).all()
+            timings.append((time.perf_counter() - start) * 1000)
+            result = len(rows)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))]
+    return statistics.median(timings), p95, result
+
+
+def search_queries(terms):
+    """
+    검색어별 SQL (서비스와 같은 의미: 검색어별 ILIKE 를 AND)
+
+    - old: 기존 /articles/search - 제목만 ILIKE, 최신순 20건 (발행일 인덱스)
+    - date: 신규 sort=published_at - 제목+요약 식 ILIKE, 최신순 20건
+    - relevance: 신규 기본 정렬 - 최신 매칭 SEARCH_RELEVANCE_CANDIDATES 건 후보 → word_similarity + 제목 가중치 정렬
+    - *_count: 페이지 모드 총 개수 (관련도 순은 후보 수)
+    신규 경로의 검색 패턴은 서비스(_search_conditions)처럼 SQL 에 값으로 넣는다 (generic plan 방지).
+    기존 경로는 기존 서비스처럼 바인드 변수로 둔다.
+    """
+    patterns = [_sql_literal(f"%{term}%") for term in terms]
+    title_where = " AND ".join(f"title ILIKE :p{i}" for i in range(len(terms)))
+    text_where = " AND ".join(f"{SEARCH_TEXT} ILIKE {pattern}" for pattern in patterns)
+    title_hits = " + ".join(f"(CASE WHEN title ILIKE :p{i} THEN 1.0 ELSE 0.0 END)" for i in range(len(terms)))
+    candidates = f"SELECT id FROM {TABLE} WHERE {text_where} ORDER BY {PUBLISHED_KEY} LIMIT {SEARCH_RELEVANCE_CANDIDATES}"
+    return {
+        "old": f"SELECT id FROM {TABLE} WHERE {title_where} ORDER BY {PUBLISHED_KEY} LIMIT 21",
+        "date": f"SELECT id FROM {TABLE} WHERE {text_where} ORDER BY {PUBLISHED_KEY} LIMIT 21",
+        "relevance": f"""
+            WITH candidates AS ({candidates})
+            SELECT id, word_similarity(:q, {SEARCH_TEXT}) + {title_hits} AS rank FROM {TABLE}
+            WHERE id IN (SELECT id FROM candidates)
+            ORDER BY rank DESC, {PUBLISHED_KEY}
+            LIMIT 20
+        """,
+        "old_count": f"SELECT count(*) FROM {TABLE} WHERE {title_where}",
+        "date_count": f"SELECT count(*) FROM {TABLE} WHERE {text_where}",
+        "relevance_count": f"SELECT count(*) FROM ({candidates}) AS candidates",
+    }
+
+
+def _cell(p50: float, p95: float) -> str:
+    return f"{p50:>9.1f} / {p95:<9.1f}"
+
+
+async def run_benchmark(rows: int, runs: int, keep: bool):
+    print("=" * 100)
+    print(f"Article Search Performance Test ({rows:,} rows, {runs} runs per query, p50 / p95 ms)")
+    print("=" * 100)
+
+    await seed(rows)
+
+    results = {}
+    for q in QUERIES:
+        terms = q.split()
+        sqls = search_queries(terms)
+        params = {"q": q, **{f"p{i}": f"%{t}%" for i, t in enumerate(terms)}}
+        results[q] = {name: await measure(sql, params, runs) for name, sql in sqls.items()}
+
+    print(f"\n[page query] {'':<8} {'title ILIKE (old)':>21} {'title+summary date':>21} {'relevance (top K)':>21}")
+    print("-" * 100)
+    for q, r in results.items():
+        print(f"{q:<20} {_cell(*r['old'][:2])} {_cell(*r['date'][:2])} {_cell(*r['relevance'][:2])}")
+
+    print(f"\n[count query] {'':<7} {'title ILIKE (old)':>21} {'title+summary':>21} {'relevance (≤ K)':>21}")
+    print("-" * 100)
+    for q, r in results.items():
+        print(f"{q:<20} {_cell(*r['old_count'][:2])} {_cell(*r['date_count'][:2])} {_cell(*r['relevance_count'][:2])}")
+
+    if not keep:
+        async with AsyncSessionLocal() as session:
+            await session.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+            await session.commit()
+        print(f"\n✓ Dropped {TABLE}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 검색 성능 비교 (ILIKE vs pg_trgm)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="적재할 가상 기사 수")
+    parser.add_argument("--runs", type=int, default=30, help="검색어별 반복 횟수")
+    parser.add_argument("--keep", action="store_true", help="측정 후 임시 테이블 유지")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.runs, args.keep))
+
+
+if __name__ == "__main__":
+    main()
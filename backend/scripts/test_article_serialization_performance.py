@@ -0,0 +1,147 @@
+"""
+기사 목록 응답 직렬화 성능 비교 테스트: ORM + Pydantic 검증 + 기본 JSONResponse vs Core 행 + dict + orjson
+
+DB 없이 같은 형태의 가상 기사 페이지를 두 경로로 만들어 ASGI 앱에 직접 요청하고 초당 요청 수를 측정한다.
+(DB 왕복/ORM 하이드레이션 차이는 포함되지 않으며, 응답 생성 CPU 비용만 비교한다)
+
+사용법:
+    python scripts/test_article_serialization_performance.py --size 100 --requests 2000
+"""
+import argparse
+import asyncio
+import io
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.engine.result import result_tuple
+
+from src.articles.models import Article
+from src.companies.models import Company
+from src.articles.schemas import ArticleListResponse, ArticleResponse
+from src.articles.service import ARTICLE_LIST_COLUMNS, COMPANY_LIST_COLUMNS, article_list_item
+from src.shared.responses import LeanJSONResponse, _orjson_available
+
+
+def make_page(size: int):
+    """가상 기사 한 페이지: (ORM 엔티티 쌍 목록, Core 행 목록)"""
+    now = datetime.now(timezone.utc)
+    company = Company(id=1, company_name="그리너리", company_name_en="Greenery", is_active=True)
+    article_fields = [c.key for c in ARTICLE_LIST_COLUMNS]
+    make_row = result_tuple(article_fields + [c.key for c in COMPANY_LIST_COLUMNS])
+
+    entities, rows = [], []
+    for i in range(size):
+        values = dict(
+            id=100000 - i,
+            title=f"그리너리, 탄소회계 플랫폼 고도화 {i}",
+            source_name="한국경제",
+            article_url=f"https://news.example.com/article/{i}",
+            published_at=now - timedelta(minutes=i),
+            crawled_at=now,
+            summary="그리너리는 스코프3 배출량 산정 기능을 추가한 탄소회계 플랫폼을 출시했다. " * 3,
+            language="ko",
+            is_verified=False,
+            image_url=f"https://img.example.com/{i}.jpg",
+            company_id=company.id,
+            # 4건씩 같은 스토리 (첫 기사가 대표)
+            story_cluster_id=100000 - i // 4 * 4 if i % 4 else None,
+        )
+        entities.append((Article(**values), company))
+        rows.append(make_row([values[f] for f in article_fields] + [company.company_name, company.company_name_en]))
+    return entities, rows
+
+
+def build_app(entities, rows) -> FastAPI:
+    app = FastAPI()
+    size = len(rows)
+
+    @app.get("/before", response_model=ArticleListResponse)
+    async def before():
+        # 기존 경로: 필드별 복사 + 검증 → FastAPI response_model 재검증 + jsonable_encoder
+        articles = []
+        for article, company in entities:
+            articles.append(ArticleResponse(
+                id=article.id,
+                title=article.title,
+                source_name=article.source_name,
+                article_url=article.article_url,
+                published_at=article.published_at,
+                crawled_at=article.crawled_at,
+                summary=article.summary,
+                language=article.language,
+                is_verified=article.is_verified,
+                image_url=article.image_url,
+                company_id=company.id,
+                story_cluster_id=article.story_cluster_id,
+                company_name=company.company_name,
+                company_name_en=company.company_name_en
+            ))
+        return ArticleListResponse(
+            articles=articles, total=10000, page=1, size=size, has_next=True, has_prev=False
+        )
+
+    @app.get("/after", response_model=ArticleListResponse)
+    async def after():
+        # 신규 경로: Core 행 → dict (검증 생략) → orjson
+        return LeanJSONResponse(ArticleListResponse.model_construct(
+            articles=[article_list_item(row) for row in rows],
+            total=10000, page=1, size=size, has_next=True, has_prev=False, next_cursor=None
+        ))
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    """순차 요청 후 초당 요청 수 반환"""
+    for _ in range(min(50, requests)):  # 워밍업
+        await client.get(path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - start)
+
+
+async def run_benchmark(size: int, requests: int):
+    print("=" * 80)
+    print(f"Article List Serialization Test ({size} items/page, {requests} requests, orjson={_orjson_available})")
+    print("=" * 80)
+
+    entities, rows = make_page(size)
+    app = build_app(entities, rows)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        before_body = (await client.get("/before")).json()
+        after_body = (await client.get("/after")).json()
+        print(f"✓ Same payload: {before_body == after_body}")
+
+        before_rps = await measure(client, "/before", requests)
+        after_rps = await measure(client, "/after", requests)
+
+    print(f"\n{'path':<50} {'req/s':>10}")
+    print("-" * 62)
+    print(f"{'ORM + Pydantic validation + JSONResponse':<50} {before_rps:>10.0f}")
+    print(f"{'Core rows + dicts + orjson':<50} {after_rps:>10.0f}")
+    print(f"\n✓ Speedup: {after_rps / before_rps:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 목록 직렬화 성능 비교")
+    parser.add_argument("--size", type=int, default=100, help="페이지당 기사 수")
+    parser.add_argument("--requests", type=int, default=2000, help="경로별 요청 수")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.size, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+유사 기사(스토리) SimHash 허용 거리 보정 테스트
+
+보도자료 하나를 여러 매체가 전재한 기사(제목 머리말, 기자 바이라인, 요약 절단 길이, 제목 일부 수정)와
+같은 회사의 다른 보도자료 기사를 가상으로 만들어 64비트 지문 해밍 거리 분포를 측정하고,
+허용 거리별 전재 기사 묶임 비율(재현율)과 다른 기사가 잘못 묶이는 비율(오병합)을 표시한다.
+StoryIndex.find 는 창 안의 모든 기사와 비교하므로, 앞서 들어온 사본 중 하나라도 허용 거리 안이면
+같은 스토리로 묶이는 비율(묶음 재현율)을 쌍 단위 재현율과 함께 표시한다.
+constants.STORY_SIMHASH_MAX_DISTANCE 를 바꿀 때 이 표로 근거를 확인한다.
+
+사용법:
+    python scripts/test_story_simhash_threshold.py --stories 300 --copies 8
+"""
+import argparse
+import io
+import random
+import sys
+from itertools import combinations
+from pathlib import Path
+
+# UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.crawler.constants import STORY_SIMHASH_MAX_DISTANCE
+from src.crawler.story_cluster import hamming_distance, simhash
+
+COMPANIES = ["그리너리", "엔츠", "에코매니지", "탄소중립랩", "클라이밋테크"]
+SUBJECTS = ["탄소회계 플랫폼", "스코프3 배출량 산정 솔루션", "LCA 자동화 서비스", "ESG 공시 대응 툴", "공급망 실사 시스템",
+            "재생에너지 전력구매계약", "넷제로 로드맵 컨설팅", "배출권 거래 중개", "친환경 물류 데이터", "기후 리스크 분석"]
+ACTIONS = ["출시", "도입", "업무협약 체결", "투자 유치", "수주", "고도화", "해외 진출", "공동 개발", "무상 지원", "실증 완료"]
+PARTNERS = ["현대건설", "SK이노베이션", "포스코", "LG화학", "한국전력", "신한은행", "CJ대한통운", "롯데케미칼", "KT", "한화솔루션"]
+DETAILS = [
+    "이번 협력으로 협력사 {n}곳의 온실가스 배출량을 실시간으로 관리할 수 있게 됐다",
+    "회사는 올해 매출 {n}억원을 목표로 국내외 고객사를 확대할 계획이다",
+    "{n}개 사업장의 에너지 사용 데이터를 자동으로 수집해 보고서를 작성한다",
+    "시범 사업 결과 탄소 배출량을 {n}% 줄인 것으로 나타났다",
+    "정부의 공시 의무화 일정에 맞춰 {n}개 기업이 도입을 검토하고 있다",
+    "대표는 기업들이 규제에 대응할 수 있도록 지원하겠다고 밝혔다",
+    "전문 인력 {n}명을 추가 채용해 기술 지원 조직을 강화한다",
+]
+OUTLETS = ["연합뉴스", "뉴스1", "뉴시스", "이데일리", "머니투데이", "전자신문", "아시아경제", "헤럴드경제", "파이낸셜뉴스", "환경일보"]
+REPORTERS = ["김민수", "이서연", "박지훈", "최유진", "정하늘", "강도윤"]
+
+
+def make_story(rng: random.Random, company: str) -> dict:
+    """보도자료 1건 (제목 + 본문 문장 목록)"""
+    subject, action, partner = rng.choice(SUBJECTS), rng.choice(ACTIONS), rng.choice(PARTNERS)
+    title = f"{company}, {partner}와 {subject} {action}"
+    sentences = [f"{company}가 {partner}와 {subject} {action}했다고 {rng.randint(1, 28)}일 밝혔다"]
+    sentences += [detail.format(n=rng.randint(2, 500)) for detail in rng.sample(DETAILS, 4)]
+    return {"title": title, "sentences": sentences}
+
+
+def syndicate(rng: random.Random, story: dict) -> tuple:
+    """매체별 전재 기사 (제목, 요약): 머리말/꼬리말, 바이라인, 요약 절단 길이, 제목 일부 수정"""
+    outlet, reporter = rng.choice(OUTLETS), rng.choice(REPORTERS)
+    title = story["title"]
+    if rng.random() < 0.3:
+        title = title.replace(", ", " ").replace("와 ", " ")
+    if rng.random() < 0.3:
+        title = f"[{rng.choice(['ESG', '기업', '경제', '단독'])}] {title}"
+    if rng.random() < 0.2:
+        title = title + " 나서"
+    lead = rng.choice([
+        f"({rng.choice(['서울', '세종', '부산'])}={outlet}) {reporter} 기자 = ",
+        f"[{outlet} {reporter} 기자] ",
+        f"{outlet} {reporter} 기자 ",
+        "",
+    ])
+    body = ". ".join(story["sentences"]) + "."
+    summary = (lead + body)[:rng.randint(110, 160)]
+    return title, summary
+
+
+def distance_table(stories: int, copies: int, seed: int):
+    """전재 기사 쌍 / 같은 회사 다른 기사 쌍의 해밍 거리 목록, 사본별 앞선 사본과의 최소 거리"""
+    rng = random.Random(seed)
+    same, different, nearest = [], [], []
+    by_company = {company: [] for company in COMPANIES}
+    for _ in range(stories):
+        company = rng.choice(COMPANIES)
+        story = make_story(rng, company)
+        fingerprints = [fp for fp in (simhash(*syndicate(rng, story)) for _ in range(copies)) if fp is not None]
+        same.extend(hamming_distance(a, b) for a, b in combinations(fingerprints, 2))
+        nearest.extend(
+            min(hamming_distance(fingerprints[i], earlier) for earlier in fingerprints[:i])
+            for i in range(1, len(fingerprints))
+        )
+        if fingerprints:
+            by_company[company].append(fingerprints[0])
+    for fingerprints in by_company.values():
+        different.extend(hamming_distance(a, b) for a, b in combinations(fingerprints, 2))
+    return same, different, nearest
+
+
+def percentile(values, q: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run(stories: int, copies: int, seed: int):
+    print("=" * 80)
+    print(f"Story SimHash Threshold ({stories} stories x {copies} copies, current threshold {STORY_SIMHASH_MAX_DISTANCE})")
+    print("=" * 80)
+    same, different, nearest = distance_table(stories, copies, seed)
+
+    print(f"\n{'pairs':<28} {'count':>8} {'min':>5} {'p50':>5} {'p95':>5} {'p99':>5} {'max':>5}")
+    print("-" * 66)
+    for name, values in (("syndicated copies", same), ("same company, other story", different)):
+        print(f"{name:<28} {len(values):>8} {min(values):>5} {percentile(values, 0.5):>5} "
+              f"{percentile(values, 0.95):>5} {percentile(values, 0.99):>5} {max(values):>5}")
+
+    print(f"\n{'threshold':<10} {'pair recall':>12} {'story recall':>13} {'false merge':>12}  bands x bits")
+    print("-" * 66)
+    for threshold in range(8, 17):
+        recall = sum(d <= threshold for d in same) / len(same)
+        story_recall = sum(d <= threshold for d in nearest) / len(nearest)
+        false_merge = sum(d <= threshold for d in different) / len(different)
+        bands = threshold + 1
+        marker = "  ← current" if threshold == STORY_SIMHASH_MAX_DISTANCE else ""
+        print(f"{threshold:<10} {recall:>11.2%} {story_recall:>12.2%} {false_merge:>11.3%}  {bands:>5} x {64 // bands}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스토리 SimHash 허용 거리 보정")
+    parser.add_argument("--stories", type=int, default=300, help="가상 보도자료 수")
+    parser.add_argument("--copies", type=int, default=8, help="보도자료당 전재 기사 수")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.stories, args.copies, args.seed)
+
+
+if __name__ == "__main__":
+    main()
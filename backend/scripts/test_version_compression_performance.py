@@ -0,0 +1,143 @@
+"""
+문서 버전 payload 저장 형식 비교: JSONB(정규 JSON) vs zstd vs zstd + 공유 사전
+
+가상 보고서를 연속 편집하며 키프레임 + 델타 체인을 만들고, 블록 저장소에 넣을 때와 같은 형태(블록 해시 참조)의
+payload 로 바꿔 저장 크기와 1건당 압축/해제 시간을 측정한다.
+- 사전은 앞쪽 절반 버전으로 학습하고 뒤쪽 절반으로 측정한다 (학습에 쓰지 않은 payload 기준)
+- 블록 저장소 쪽 블록 내용은 형식과 무관하므로 제외한다
+
+사용법:
+    python scripts/test_version_compression_performance.py --versions 400 --blocks 600
+"""
+import argparse
+import copy
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+# UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.documents.block_store import pack_payload
+from src.documents.constants import VERSION_COMPRESSION_DICT_SIZE, VERSION_COMPRESSION_LEVEL, VERSION_KEYFRAME_INTERVAL
+from src.documents.version_compression import _zstd_available, canonical_json
+from src.documents.version_delta import encode_version
+
+WORDS = "탄소 배출량 스코프3 공급망 협력사 재생에너지 감축 목표 지배구조 이사회 인권 실사 기후 리스크".split()
+
+
+def make_snapshot(block_count: int, section_count: int, rng: random.Random):
+    """가상 보고서 스냅샷 (섹션마다 블록 균등 분배)"""
+    per_section = block_count // section_count
+    sections = []
+    for s in range(section_count):
+        blocks = [{
+            "id": f"block-{s}-{b}",
+            "blockType": "paragraph",
+            "attributes": {},
+            "content": [{"id": f"inline-{s}-{b}", "type": "inline", "marks": [],
+                         "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))}],
+        } for b in range(per_section)]
+        sections.append({
+            "id": str(s + 1),
+            "title": f"섹션 {s + 1}",
+            "description": None,
+            "order": s,
+            "blocks": blocks,
+            "griReference": [{"code": [f"30{s % 9}-1"], "framework": "GRI"}],
+            "metadata": {"category": "ESG"[s % 3], "status": "draft"},
+        })
+    return {"id": "1", "title": "지속가능경영보고서", "sections": sections}
+
+
+def edit(snapshot, rng: random.Random):
+    """임의 블록 1~3개의 단어 하나씩 수정한 사본"""
+    target = copy.deepcopy(snapshot)
+    for _ in range(rng.randint(1, 3)):
+        section = rng.choice(target["sections"])
+        block = rng.choice(section["blocks"])
+        words = block["content"][0]["text"].split(" ")
+        words[rng.randrange(len(words))] = "개정"
+        block["content"][0]["text"] = " ".join(words)
+    return target
+
+
+def build_payloads(version_count: int, block_count: int):
+    """키프레임 + 델타 체인 payload (블록 해시 참조 형태)"""
+    rng = random.Random(7)
+    snapshot = make_snapshot(block_count, max(1, block_count // 15), rng)
+    payloads = []
+    previous = None
+    for number in range(version_count):
+        delta = None
+        if previous is not None and number % VERSION_KEYFRAME_INTERVAL:
+            delta = encode_version(previous, snapshot)
+        payloads.append(pack_payload(snapshot if delta is None else delta)[0])
+        previous, snapshot = snapshot, edit(snapshot, rng)
+    return payloads
+
+
+def timed(fn, items, repeat: int) -> float:
+    """1건당 평균 소요 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (repeat * len(items)) * 1_000_000
+
+
+def run_benchmark(version_count: int, block_count: int, repeat: int):
+    import zstandard
+
+    print("=" * 80)
+    print(f"Version Payload Compression Test ({version_count} versions / {block_count} blocks, zstd level {VERSION_COMPRESSION_LEVEL})")
+    print("=" * 80)
+
+    payloads = build_payloads(version_count, block_count)
+    half = len(payloads) // 2
+    train, measure = payloads[:half], payloads[half:]
+    raw = [canonical_json(p) for p in measure]
+
+    dictionary = zstandard.train_dictionary(VERSION_COMPRESSION_DICT_SIZE, [canonical_json(p) for p in train])
+    print(f"✓ Dictionary: {len(dictionary.as_bytes()):,} bytes from {len(train)} payloads")
+
+    modes = {
+        "zstd": (zstandard.ZstdCompressor(level=VERSION_COMPRESSION_LEVEL), zstandard.ZstdDecompressor()),
+        "zstd + dict": (
+            zstandard.ZstdCompressor(level=VERSION_COMPRESSION_LEVEL, dict_data=dictionary),
+            zstandard.ZstdDecompressor(dict_data=dictionary),
+        ),
+    }
+
+    total_raw = sum(len(r) for r in raw)
+    print(f"\n{'format':<14} {'total bytes':>14} {'ratio':>8} {'compress (µs)':>15} {'decompress (µs)':>17}")
+    print("-" * 72)
+    print(f"{'JSON':<14} {total_raw:>14,} {1.0:>7.1f}x {'-':>15} {'-':>17}")
+    for name, (compressor, decompressor) in modes.items():
+        compressed = [compressor.compress(r) for r in raw]
+        assert all(decompressor.decompress(c) == r for c, r in zip(compressed, raw))
+        total = sum(len(c) for c in compressed)
+        compress_us = timed(compressor.compress, raw, repeat)
+        decompress_us = timed(decompressor.decompress, compressed, repeat)
+        print(f"{name:<14} {total:>14,} {total_raw / total:>7.1f}x {compress_us:>15.1f} {decompress_us:>17.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 버전 payload 압축 성능 비교")
+    parser.add_argument("--versions", type=int, default=400, help="버전 수")
+    parser.add_argument("--blocks", type=int, default=600, help="문서 블록 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+    if not _zstd_available:
+        print("❌ zstandard 패키지가 필요합니다 (pip install zstandard)")
+        return
+    run_benchmark(args.versions, args.blocks, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+문서 버전 비교 성능 테스트: 전체 스냅샷 블록 순회 vs 머클 해시 트리 비교
+
+2,000개 블록 문서의 두 버전을 만들어 변경 규모별로 비교 시간을 측정한다.
+- 기존: 두 스냅샷의 모든 섹션/블록을 dict 비교 (스냅샷 복원 비용 제외)
+- 신규: 저장된 트리(version_diff.build_content_tree)끼리 비교 후 바뀐 블록만 내용 조회 + 단어 diff
+  (트리는 버전 저장 시 한 번 계산되므로 비교 시간에 포함하지 않고 따로 표시)
+- 해시 비교(plan) 시간과 기존 경로에 없던 단어 diff 를 포함한 전체 시간을 나눠 표시한다
+- 편집 유형별(수정 / 순서 변경 / ID 교체 / 삽입 / 삭제 / 섹션 추가·삭제) 결과 수치가 기존과 같은지 확인한다
+
+사용법:
+    python scripts/test_version_diff_performance.py --blocks 2000 --sections 40 --repeat 200
+"""
+import argparse
+import copy
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+# UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.documents.version_diff import (
+    blocks_equal, build_content_tree, count_block_chars, plan_diff, render_diff, section_key,
+)
+
+WORDS = "탄소 배출량 스코프3 공급망 협력사 재생에너지 감축 목표 지배구조 이사회 인권 실사 기후 리스크".split()
+
+
+def make_snapshot(block_count: int, section_count: int, seed: int = 7):
+    """가상 보고서 스냅샷 (섹션마다 블록 균등 분배)"""
+    rng = random.Random(seed)
+    per_section = block_count // section_count
+    sections = []
+    for s in range(section_count):
+        blocks = []
+        for b in range(per_section):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+            blocks.append({
+                "id": f"block-{s}-{b}",
+                "blockType": "heading" if b == 0 else "paragraph",
+                "attributes": {"level": 2} if b == 0 else {},
+                "content": [{"type": "text", "text": text}],
+            })
+        sections.append({
+            "id": str(s + 1),
+            "title": f"섹션 {s + 1}",
+            "description": None,
+            "order": s,
+            "blocks": blocks,
+            "griReference": [{"code": f"GRI 30{s % 9}-1"}],
+            "metadata": {},
+        })
+    return {"id": "1", "title": "지속가능경영보고서", "sections": sections}
+
+
+def mutate(snapshot, changed_blocks: int, seed: int = 11):
+    """임의 블록 changed_blocks 개의 단어 하나씩 수정한 사본"""
+    rng = random.Random(seed)
+    target = copy.deepcopy(snapshot)
+    positions = [(s, b) for s, section in enumerate(target["sections"]) for b in range(len(section["blocks"]))]
+    for s, b in rng.sample(positions, changed_blocks):
+        block = target["sections"][s]["blocks"][b]
+        words = block["content"][0]["text"].split(" ")
+        words[rng.randrange(len(words))] = "개정"
+        block["content"] = [{"type": "text", "text": " ".join(words)}]
+    return target
+
+
+def legacy_diff(source, target):
+    """기존 VersionService._calculate_diff / _compare_blocks 와 같은 전체 순회 비교 (블록은 ID 로 짝지음)"""
+    source_sections = {section_key(s): s for s in source.get("sections", [])}
+    target_sections = {section_key(s): s for s in target.get("sections", [])}
+    result = {"blocks_added": 0, "blocks_removed": 0, "blocks_modified": 0, "chars_changed": 0}
+    for key in set(source_sections) | set(target_sections):
+        source_section, target_section = source_sections.get(key), target_sections.get(key)
+        if not source_section:
+            result["blocks_added"] += len(target_section["blocks"])
+            continue
+        if not target_section:
+            result["blocks_removed"] += len(source_section["blocks"])
+            continue
+        source_blocks, target_blocks = source_section["blocks"], target_section["blocks"]
+        if source_blocks == target_blocks:
+            continue
+        source_ids = {b.get("id"): b for b in source_blocks}
+        target_ids = {b.get("id"): b for b in target_blocks}
+        for block_id in set(source_ids) | set(target_ids):
+            a, b = source_ids.get(block_id), target_ids.get(block_id)
+            if not a:
+                result["blocks_added"] += 1
+                result["chars_changed"] += count_block_chars(b)
+            elif not b:
+                result["blocks_removed"] += 1
+                result["chars_changed"] += count_block_chars(a)
+            elif not blocks_equal(a, b):
+                result["blocks_modified"] += 1
+                result["chars_changed"] += abs(count_block_chars(b) - count_block_chars(a))
+    return result
+
+
+def edit_cases(snapshot):
+    """편집 유형별 (이름, 대상 스냅샷)"""
+    def edited(fn):
+        target = copy.deepcopy(snapshot)
+        fn(target["sections"])
+        return target
+
+    def reorder(sections):
+        blocks = sections[0]["blocks"]
+        blocks[1], blocks[2] = blocks[2], blocks[1]
+
+    def replace(sections):
+        block = copy.deepcopy(sections[1]["blocks"][3])
+        block["id"] = "replacement"
+        block["content"] = [{"type": "text", "text": "새 블록"}]
+        sections[1]["blocks"][3] = block
+
+    def reorder_and_edit(sections):
+        blocks = sections[2]["blocks"]
+        blocks.append(blocks.pop(1))
+        blocks[-1] = {**blocks[-1], "content": [{"type": "text", "text": "순서와 내용 변경"}]}
+
+    def insert(sections):
+        sections[3]["blocks"].insert(2, {"id": "inserted", "blockType": "paragraph",
+                                         "content": [{"type": "text", "text": "삽입된 블록"}]})
+
+    def delete(sections):
+        del sections[4]["blocks"][5]
+
+    def swap_sections(sections):
+        removed = sections.pop(5)
+        sections.append({**copy.deepcopy(removed), "id": "new-section", "title": "새 섹션"})
+
+    return [
+        ("edit 20 blocks", mutate(snapshot, 20)),
+        ("reorder", edited(reorder)),
+        ("replace (new id)", edited(replace)),
+        ("reorder + edit", edited(reorder_and_edit)),
+        ("insert", edited(insert)),
+        ("delete", edited(delete)),
+        ("section add/remove", edited(swap_sections)),
+    ]
+
+
+def check_equivalence(source, source_tree, source_blocks) -> bool:
+    """편집 유형별로 기존 전체 순회와 트리 비교의 수치가 같은지"""
+    print(f"\n{'edit':<20} {'added':>6} {'removed':>8} {'modified':>9} {'chars':>7}  same counts")
+    print("-" * 64)
+    all_same = True
+    for name, target in edit_cases(source):
+        target_tree, target_blocks = build_content_tree(target)
+        before = legacy_diff(source, target)
+        after = merkle_diff(source_tree, target_tree, {**source_blocks, **target_blocks})
+        same = all(before[key] == after[key] for key in before)
+        all_same = all_same and same
+        print(f"{name:<20} {after['blocks_added']:>6} {after['blocks_removed']:>8} "
+              f"{after['blocks_modified']:>9} {after['chars_changed']:>7}  {same}")
+    return all_same
+
+
+def merkle_diff(source_tree, target_tree, block_lookup):
+    """저장된 트리 비교 + 필요한 블록만 조회 (블록 저장소 조회를 dict 조회로 대체)"""
+    plan = plan_diff(source_tree, target_tree)
+    blocks = {digest: block_lookup[digest] for digest in plan.needed}
+    return render_diff(plan, blocks)
+
+
+def timed(fn, repeat: int) -> float:
+    """1회 평균 소요 시간 (ms)"""
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run_benchmark(block_count: int, section_count: int, repeat: int):
+    print("=" * 80)
+    print(f"Version Diff Test ({block_count} blocks / {section_count} sections, {repeat} runs)")
+    print("=" * 80)
+
+    source = make_snapshot(block_count, section_count)
+    start = time.perf_counter()
+    source_tree, source_blocks = build_content_tree(source)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"✓ Tree build at snapshot time: {build_ms:.2f} ms (once per version)")
+
+    print(f"\n{'changed blocks':<16} {'full scan (ms)':>16} {'hash plan (ms)':>16} {'speedup':>9} "
+          f"{'+ word diff (ms)':>18}  same counts")
+    print("-" * 92)
+    for changed in (0, 1, 20, block_count // 10):
+        target = mutate(source, changed)
+        target_tree, target_blocks = build_content_tree(target)
+        lookup = {**source_blocks, **target_blocks}
+
+        before = legacy_diff(source, target)
+        after = merkle_diff(source_tree, target_tree, lookup)
+        same = all(before[key] == after[key] for key in before)
+
+        before_ms = timed(lambda: legacy_diff(source, target), repeat)
+        plan_ms = timed(lambda: plan_diff(source_tree, target_tree), repeat)
+        after_ms = timed(lambda: merkle_diff(source_tree, target_tree, lookup), repeat)
+        print(f"{changed:<16} {before_ms:>16.3f} {plan_ms:>16.3f} {before_ms / plan_ms:>8.1f}x "
+              f"{after_ms:>18.3f}  {same}")
+
+    if not check_equivalence(source, source_tree, source_blocks):
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 버전 비교 성능 비교")
+    parser.add_argument("--blocks", type=int, default=2000, help="문서 블록 수")
+    parser.add_argument("--sections", type=int, default=40, help="섹션 수")
+    parser.add_argument("--repeat", type=int, default=200, help="변경 규모별 반복 횟수")
+    args = parser.parse_args()
+    run_benchmark(args.blocks, args.sections, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
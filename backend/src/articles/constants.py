@@ -0,0 +1,9 @@
+"""
+기사 도메인 상수
+"""
+
+# 대량 내보내기: 서버 측 커서에서 한 번에 받아 인코딩할 행 수 (Parquet 은 row group 크기)
+EXPORT_CHUNK_SIZE: int = 5000
+
+# 관련도 순 검색: 최신 매칭 기사 N건만 후보로 유사도 정렬 (흔한 검색어도 유사도 계산량 고정)
+SEARCH_RELEVANCE_CANDIDATES: int = 1000
@@ -0,0 +1,174 @@
+"""
+기사 대량 내보내기 인코더 (CSV / NDJSON / Parquet)
+
+서버 측 커서에서 받은 행 묶음(partition)을 바로 바이트로 변환한다.
+행 단위 Pydantic 모델을 만들지 않으며, 묶음마다 출력하므로 메모리는 내보내기 크기와 무관하다.
+Parquet 은 pyarrow 가 설치된 경우에만 지원 (묶음 1개 = row group 1개).
+"""
+import codecs
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    orjson = None
+    _orjson_available = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _pyarrow_available = True
+except ImportError:
+    pa = None
+    pq = None
+    _pyarrow_available = False
+
+# 형식 → (Content-Type, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def is_format_available(fmt: str) -> bool:
+    return fmt in EXPORT_FORMATS and (fmt != "parquet" or _pyarrow_available)
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+class CsvEncoder:
+    """CSV (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)"""
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = list(fields)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def begin(self) -> bytes:
+        self._writer.writerow(self.fields)
+        return codecs.BOM_UTF8 + self._drain()
+
+    def encode(self, rows: List[Sequence[Any]]) -> bytes:
+        self._writer.writerows([_isoformat(value) for value in row] for row in rows)
+        return self._drain()
+
+    def end(self) -> bytes:
+        return b""
+
+
+class NdjsonEncoder:
+    """줄 단위 JSON (행마다 한 객체)"""
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = list(fields)
+
+    def begin(self) -> bytes:
+        return b""
+
+    def encode(self, rows: List[Sequence[Any]]) -> bytes:
+        fields = self.fields
+        if _orjson_available:
+            option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+            return b"".join(orjson.dumps(dict(zip(fields, row)), option=option) for row in rows)
+        return "".join(
+            json.dumps({f: _isoformat(v) for f, v in zip(fields, row)}, ensure_ascii=False) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+    def end(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 출력 버퍼: 누적 오프셋(tell)은 유지하면서 쓰인 바이트를 묶음마다 비워 낸다"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """Parquet (묶음마다 row group 1개 기록)"""
+
+    def __init__(self, fields: Sequence[str], schema: "pa.Schema"):
+        self.fields = list(fields)
+        self.schema = schema
+        self._sink = _ChunkSink()
+        self._writer: Optional["pq.ParquetWriter"] = None
+
+    def begin(self) -> bytes:
+        self._writer = pq.ParquetWriter(self._sink, self.schema, compression="zstd")
+        return self._sink.drain()
+
+    def encode(self, rows: List[Sequence[Any]]) -> bytes:
+        columns = list(zip(*rows))
+        table = pa.Table.from_arrays(
+            [pa.array(columns[i], type=self.schema.field(i).type) for i in range(len(self.fields))],
+            schema=self.schema,
+        )
+        self._writer.write_table(table)
+        return self._sink.drain()
+
+    def end(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def make_encoder(fmt: str, columns: Sequence[Any]):
+    """
+    내보내기 형식별 인코더 생성
+
+    Args:
+        columns: 조회 컬럼 (이름은 .key, Parquet 스키마는 컬럼 타입에서 유추)
+    """
+    fields = [column.key for column in columns]
+    if fmt == "csv":
+        return CsvEncoder(fields)
+    if fmt == "ndjson":
+        return NdjsonEncoder(fields)
+    if fmt == "parquet" and _pyarrow_available:
+        return ParquetEncoder(fields, pa.schema([(column.key, _arrow_type(column)) for column in columns]))
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def _arrow_type(column) -> "pa.DataType":
+    """SQLAlchemy 컬럼 타입 → Arrow 타입"""
+    python_type = column.type.python_type
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is datetime:
+        return pa.timestamp("us", tz="UTC") if getattr(column.type, "timezone", False) else pa.timestamp("us")
+    return pa.string()
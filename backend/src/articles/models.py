@@ -1,8 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, Boolean, ForeignKey, Index, literal_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.shared.models import Base, TimestampMixin
 
+
+def _search_document(title, summary):
+    """검색 문서 식 (제목 + 요약) - 식 인덱스와 검색 쿼리가 같은 식(상수 포함)을 써야 인덱스를 사용한다"""
+    return func.coalesce(title, literal_column("''")) + literal_column("' '") + func.coalesce(summary, literal_column("''"))
+
+
 class Article(Base, TimestampMixin):
     """수집된 기사 정보 테이블"""
     __tablename__ = "articles"
@@ -23,8 +29,38 @@ class Article(Base, TimestampMixin):
     language = Column(String(10), default='ko', nullable=True)
     is_verified = Column(Boolean, default=False, nullable=False)
     
+    # 회사 언급 판정 (수집 시점 계산, NULL = 미분류 → 백필 대상)
+    is_company_mention = Column(Boolean, nullable=True)
+    mention_rule_hash = Column(String(16), nullable=True)  # 판정 당시 규칙 지문 (키워드 변경 시 재분류)
+    
+    # 유사 기사(스토리) 클러스터: 제목+요약 SimHash 지문, 대표 기사 id (NULL = 미처리 → 백필 대상)
+    simhash = Column(BigInteger, nullable=True)
+    story_cluster_id = Column(Integer, nullable=True, index=True)
+    
     # 관계 설정
     company = relationship("Company", back_populates="articles")
     
+    __table_args__ = (
+        # 키셋 페이지네이션: (published_at DESC NULLS LAST, id DESC)
+        Index('ix_articles_published_at_id', published_at.desc().nulls_last(), id.desc()),
+        Index('ix_articles_crawled_at_id', crawled_at.desc(), id.desc()),
+        # 제목/요약 부분 문자열 검색 (한글은 형태소 분석 없이 trigram 으로 처리)
+        # 저장 컬럼 없이 식 인덱스 - 추가 시 테이블 재작성 없음
+        Index(
+            'ix_articles_search_text_trgm', _search_document(title, summary).label('search_text'),
+            postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'},
+        ),
+        # 회사별 언급 기사 최신순 페이지네이션
+        Index(
+            'ix_articles_company_mention_published',
+            'company_id', published_at.desc().nulls_last(), id.desc(),
+            postgresql_where=is_company_mention.is_(True),
+        ),
+    )
+    
     def __repr__(self):
         return f"<Article(id={self.id}, title={self.title[:50]}...)>"
+
+
+# 검색 문서 식 (ix_articles_search_text_trgm 과 같은 식)
+ARTICLE_SEARCH_TEXT = _search_document(Article.title, Article.summary)
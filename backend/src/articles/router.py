@@ -1,8 +1,15 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from datetime import datetime
 
 from .service import ArticleService
+from ..shared.pagination import InvalidCursorError
+from ..shared.cache import cached_response
+from ..shared.responses import LeanJSONResponse
+from .export import EXPORT_FORMATS, is_format_available
+from ..companies.service import company_profile_cache
+from ..companies.category_matrix import company_category_matrix
 from .schemas import (
     ArticleListResponse, 
     FeedResponse, 
@@ -25,9 +32,10 @@ async def get_articles(
     company_id: Optional[int] = Query(default=None, description="회사 ID 필터"),
     sort: str = Query(default="published_at", description="정렬 기준 (published_at, crawled_at, title)"),
     order: str = Query(default="desc", pattern="^(asc|desc)$", description="정렬 순서"),
-    search: Optional[str] = Query(default=None, max_length=100, description="제목 검색어"),
+    search: Optional[str] = Query(default=None, max_length=100, description="검색어 (제목 + 요약)"),
     date_from: Optional[datetime] = Query(default=None, description="시작 날짜 (ISO 8601)"),
-    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)")
+    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)")
 ):
     """
     기사 목록 조회
@@ -37,9 +45,10 @@ async def get_articles(
     - **company_id**: 특정 회사의 기사만 조회
     - **sort**: 정렬 기준 (published_at, crawled_at, title)
     - **order**: 정렬 순서 (asc, desc)
-    - **search**: 제목 검색어
+    - **search**: 검색어 (제목 + 요약)
     - **date_from**: 시작 날짜
     - **date_to**: 종료 날짜
+    - **cursor**: 커서 페이지네이션 (published_at/crawled_at 정렬에서 지원)
     """
     try:
         params = ArticleQueryParams(
@@ -50,21 +59,28 @@ async def get_articles(
             order=order,
             search=search,
             date_from=date_from,
-            date_to=date_to
+            date_to=date_to,
+            cursor=cursor
         )
         
-        return await article_service.get_articles(params)
+        # ✅ [Perf] 서비스에서 만든 응답 그대로 orjson 직렬화 (response_model 재검증 생략)
+        return LeanJSONResponse(await article_service.get_articles(params))
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get articles: {str(e)}")
 
 
 @router.get("/feed", response_model=FeedResponse)
 async def get_feed(
+    request: Request,
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     size: int = Query(default=20, ge=1, le=100, description="페이지 크기"),
     date_from: Optional[datetime] = Query(default=None, description="시작 날짜 (ISO 8601)"),
-    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)")
+    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)"),
+    collapse: bool = Query(default=False, description="유사 기사(같은 보도자료 전재)를 대표 기사 1건으로 묶기")
 ):
     """
     통합 뉴스 피드 조회
@@ -73,15 +89,25 @@ async def get_feed(
     - **size**: 페이지당 기사 수 (최대 100개)
     - **date_from**: 시작 날짜 (선택)
     - **date_to**: 종료 날짜 (선택)
+    - **collapse**: 유사 기사 묶기 (각 기사에 story_size 포함)
     """
     try:
-        return await article_service.get_feed(
-            page=page, 
-            size=size,
-            date_from=date_from,
-            date_to=date_to
+        return await cached_response(
+            request,
+            "feed",
+            {"page": page, "size": size, "date_from": date_from, "date_to": date_to, "cursor": cursor, "collapse": collapse},
+            lambda: article_service.get_feed(
+                page=page, 
+                size=size,
+                date_from=date_from,
+                date_to=date_to,
+                cursor=cursor,
+                collapse_stories=collapse
+            )
         )
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get feed: {str(e)}")
 
@@ -92,7 +118,8 @@ async def get_company_articles(
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     size: int = Query(default=20, ge=1, le=100, description="페이지 크기"),
     date_from: Optional[datetime] = Query(default=None, description="시작 날짜 (ISO 8601)"),
-    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)")
+    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)")
 ):
     """
     특정 회사의 기사 목록 조회 (스마트 필터링 적용)
@@ -104,14 +131,17 @@ async def get_company_articles(
     - **date_to**: 종료 날짜 (선택)
     """
     try:
-        return await article_service.get_company_articles(
+        return LeanJSONResponse(await article_service.get_company_articles(
             company_id=company_id,
             page=page,
             size=size,
             date_from=date_from,
-            date_to=date_to
-        )
+            date_to=date_to,
+            cursor=cursor
+        ))
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get company articles: {str(e)}")
 
@@ -120,33 +150,93 @@ async def get_company_articles(
 async def search_articles(
     q: str = Query(..., min_length=1, max_length=100, description="검색어"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
-    size: int = Query(default=20, ge=1, le=100, description="페이지 크기")
+    size: int = Query(default=20, ge=1, le=100, description="페이지 크기"),
+    sort: str = Query(default="relevance", pattern="^(relevance|published_at)$", description="정렬 기준 (relevance, published_at)"),
+    cursor: Optional[str] = Query(default=None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)")
 ):
-    """기사 제목 검색"""
+    """
+    기사 검색 (제목 + 요약)
+    
+    - **q**: 검색어 (공백으로 구분된 모든 단어 포함)
+    - **sort**: relevance(관련도순) 또는 published_at(최신순, 커서 지원)
+    - 각 기사에 검색어 하이라이트 스니펫(highlight) 포함
+    """
     try:
-        return await article_service.search_articles(
+        return LeanJSONResponse(await article_service.search_articles(
             query=q,
             page=page,
-            size=size
-        )
+            size=size,
+            cursor=cursor,
+            sort=sort
+        ))
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to search articles: {str(e)}")
 
 
+@router.get("/export")
+async def export_articles(
+    format: str = Query(default="csv", pattern="^(csv|ndjson|parquet)$", description="내보내기 형식 (csv, ndjson, parquet)"),
+    company_id: Optional[int] = Query(default=None, description="회사 ID 필터"),
+    sort: str = Query(default="published_at", description="정렬 기준 (published_at, crawled_at, title)"),
+    order: str = Query(default="desc", pattern="^(asc|desc)$", description="정렬 순서"),
+    search: Optional[str] = Query(default=None, max_length=100, description="검색어 (제목 + 요약)"),
+    date_from: Optional[datetime] = Query(default=None, description="시작 날짜 (ISO 8601)"),
+    date_to: Optional[datetime] = Query(default=None, description="종료 날짜 (ISO 8601)"),
+    collapse: bool = Query(default=False, description="유사 기사를 대표 기사 1건으로 묶기")
+):
+    """
+    기사 대량 내보내기 (스트리밍)
+    
+    - **format**: csv (UTF-8 BOM), ndjson, parquet (pyarrow 설치 시)
+    - 필터/정렬은 기사 목록 조회와 동일 (페이지 구분 없이 전체)
+    - 서버 측 커서로 묶음 단위 전송 → 내보내기 크기와 무관하게 일정한 메모리 사용
+    """
+    if not is_format_available(format):
+        raise HTTPException(status_code=400, detail=f"Export format '{format}' is not available on this server")
+    
+    params = ArticleQueryParams(
+        company_id=company_id,
+        sort=sort,
+        order=order,
+        search=search,
+        date_from=date_from,
+        date_to=date_to,
+        collapse_stories=collapse
+    )
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    
+    return StreamingResponse(
+        article_service.export_articles(params, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.get("/trends", response_model=MentionTrendsResponse)
 async def get_mention_trends(
-    period_days: int = Query(default=30, ge=1, le=365, description="분석 기간 (일)")
+    request: Request,
+    period_days: int = Query(default=30, ge=1, le=365, description="분석 기간 (일)"),
+    count_by: str = Query(default="articles", pattern="^(articles|stories)$", description="집계 기준 (articles: 기사 수, stories: 유사 기사 묶음 수)")
 ):
     """
     회사별 언급량 트렌드 분석 (상위 10개)
     
     - **period_days**: 분석 기간 (기본값: 30일, 최대: 365일)
+    - **count_by**: 전재 기사를 한 건으로 셀지 여부 (stories)
     - 직전 동일 기간 대비 증감률 계산
     - 현재 언급량 기준으로 상위 10개 회사 반환
     """
     try:
-        return await article_service.get_mention_trends(period_days=period_days)
+        return await cached_response(
+            request,
+            "trends",
+            {"period_days": period_days, "count_by": count_by, "matrix_version": company_category_matrix.version},
+            lambda: article_service.get_mention_trends(period_days=period_days, count_by=count_by)
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get mention trends: {str(e)}")
@@ -183,17 +273,25 @@ async def get_company_mention_stats(
 
 @router.get("/trends/categories", response_model=CategoryTrendsResponse)
 async def get_category_trends(
-    period_days: int = Query(default=30, ge=1, le=90, description="분석 기간 (일)")
+    request: Request,
+    period_days: int = Query(default=30, ge=1, le=90, description="분석 기간 (일)"),
+    count_by: str = Query(default="articles", pattern="^(articles|stories)$", description="집계 기준 (articles: 기사 수, stories: 유사 기사 묶음 수)")
 ):
     """
     ESG 서비스 카테고리별 언급량 트렌드 분석
     
     - **period_days**: 분석 기간 (기본값: 30일)
+    - **count_by**: 전재 기사를 한 건으로 셀지 여부 (stories)
     - 카테고리별 총 언급량과 증감률 분석
     - 각 카테고리의 상위 언급량 회사 목록 포함
     """
     try:
-        return await article_service.get_category_trends(period_days=period_days)
+        return await cached_response(
+            request,
+            "category_trends",
+            {"period_days": period_days, "count_by": count_by, "matrix_version": company_category_matrix.version},
+            lambda: article_service.get_category_trends(period_days=period_days, count_by=count_by)
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get category trends: {str(e)}")
@@ -217,9 +315,9 @@ async def get_article(article_id: int):
 
 
 @router.get("/companies/list")
-async def get_companies():
+async def get_companies(request: Request):
     """활성화된 회사 목록 조회"""
-    try:
+    async def build():
         companies = await article_service.get_companies()
         
         return {
@@ -236,6 +334,15 @@ async def get_companies():
             ],
             "count": len(companies)
         }
+    
+    try:
+        # 회사 목록은 크롤이 아닌 회사 쓰기로 바뀌므로 프로필 캐시 버전을 키에 포함
+        return await cached_response(
+            request,
+            "companies",
+            {"company_version": company_profile_cache.version},
+            build
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get companies: {str(e)}")
@@ -19,6 +19,11 @@ class ArticleResponse(BaseModel):
     company_id: int
     company_name: str
     company_name_en: Optional[str] = None
+    # 검색 결과일 때만: 검색어 주변 스니펫 (<mark> 하이라이트, HTML 이스케이프됨)
+    highlight: Optional[str] = None
+    # 유사 기사(스토리) 클러스터: 대표 기사 id, 스토리 묶기 조회일 때만 묶인 기사 수
+    story_cluster_id: Optional[int] = None
+    story_size: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -32,6 +37,7 @@ class ArticleListResponse(BaseModel):
     size: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (cursor 파라미터로 전달)
 
 
 class CompanyResponse(BaseModel):
@@ -54,6 +60,7 @@ class FeedResponse(BaseModel):
     page: int
     size: int
     has_next: bool
+    next_cursor: Optional[str] = None
     companies_count: int
     latest_crawl: Optional[datetime] = None
 
@@ -68,6 +75,8 @@ class ArticleQueryParams(BaseModel):
     search: Optional[str] = Field(default=None, max_length=100, description="제목 검색어")
     date_from: Optional[datetime] = Field(default=None, description="시작 날짜")
     date_to: Optional[datetime] = Field(default=None, description="종료 날짜")
+    cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (지정 시 page 무시)")
+    collapse_stories: bool = Field(default=False, description="유사 기사(스토리)를 대표 기사 1건으로 묶기")
 
 
 class MentionTrendItem(BaseModel):
@@ -95,6 +104,7 @@ class MentionTrendsResponse(BaseModel):
     """언급량 트렌드 응답 스키마"""
     trends: List[MentionTrendItem] = Field(description="상위 10개 회사 트렌드")
     period_days: int = Field(default=30, description="분석 기간 (일)")
+    count_by: Literal["articles", "stories"] = Field(default="articles", description="집계 기준 (기사 수 / 유사 기사 묶음 수)")
     analysis_date: datetime = Field(description="분석 실행 시점")
     total_companies: int = Field(description="분석 대상 회사 수")
 
@@ -131,5 +141,6 @@ class CategoryTrendsResponse(BaseModel):
     """카테고리별 트렌드 응답 스키마"""
     trends: List[CategoryTrendItem] = Field(description="카테고리별 트렌드")
     period_days: int = Field(default=30, description="분석 기간 (일)")
+    count_by: Literal["articles", "stories"] = Field(default="articles", description="집계 기준 (기사 수 / 유사 기사 묶음 수)")
     analysis_date: datetime = Field(description="분석 실행 시점")
     total_categories: int = Field(description="분석 대상 카테고리 수")
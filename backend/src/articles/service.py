@@ -1,183 +1,302 @@
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, asc, and_, or_, text
+from sqlalchemy import String, bindparam, select, update, delete, exists, func, desc, asc, and_, or_, text, case, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
-from datetime import datetime, timedelta
+from loguru import logger
+from datetime import date, datetime, time, timedelta
+import numpy as np
 
 from .schemas import (
     ArticleResponse, ArticleListResponse, FeedResponse, ArticleQueryParams,
     MentionTrendsResponse, MentionTrendItem, CompanyMentionStats,
     CategoryTrendsResponse, CategoryTrendItem
 )
-from ..articles.models import Article
-from ..companies.models import Company, ESGServiceCategory, CompanyServiceMapping
+from ..articles.models import ARTICLE_SEARCH_TEXT, Article
+from ..companies.models import Company, MentionTrendDaily
 from ..core.database import AsyncSessionLocal
+from ..companies.service import company_profile_cache
+from ..companies.category_matrix import company_category_matrix
+from ..shared.cache import response_cache
+from ..shared.utils import split_search_terms, escape_like, build_highlight
+from .export import make_encoder
+from .constants import EXPORT_CHUNK_SIZE, SEARCH_RELEVANCE_CANDIDATES
+from ..shared.pagination import (
+    CountCache, InvalidCursorError, decode_cursor, encode_cursor,
+    keyset_condition, keyset_order,
+)
+
+# 커서 페이지네이션을 지원하는 정렬 기준 (값이 datetime 인 컬럼만)
+CURSOR_SORT_COLUMNS = {
+    "published_at": Article.published_at,
+    "crawled_at": Article.crawled_at,
+}
+
+# ✅ [Perf] 목록 응답에 필요한 컬럼만 Core 행으로 조회 (ORM 엔티티 생성/상태 추적 생략)
+ARTICLE_LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.source_name,
+    Article.article_url,
+    Article.published_at,
+    Article.crawled_at,
+    Article.summary,
+    Article.language,
+    Article.is_verified,
+    Article.image_url,
+    Article.company_id,
+    Article.story_cluster_id,
+)
+COMPANY_LIST_COLUMNS = (Company.company_name, Company.company_name_en)
+
+
+def article_list_item(row, **company_fields) -> Dict[str, Any]:
+    """
+    목록 행 → ArticleResponse 형태의 dict (검증 생략)
+    
+    DB 컬럼 타입이 이미 스키마와 일치하므로 모델 인스턴스를 만들지 않고 dict 로 바로 직렬화한다.
+    (100건 기준 model_construct 대비 수 배 빠름, scripts/test_article_serialization_performance.py)
+    """
+    return dict(zip(row._fields, row), highlight=None, story_size=None, **company_fields)
+
+
+# 스토리 대표 기사 (클러스터 미처리 기사는 단독 스토리로 간주)
+IS_STORY_ROOT = func.coalesce(Article.story_cluster_id, Article.id) == Article.id
+
+# 일별 집계 기준 날짜 (UTC 벽시계 기준, 기존 통계의 date(published_at) 과 동일)
+ARTICLE_DAY = func.date(func.timezone(literal_column("'UTC'"), Article.published_at))
+
+
+async def increment_mention_rollups(
+    session: AsyncSession,
+    counts: Dict[Tuple[int, date], int],
+    story_counts: Optional[Dict[Tuple[int, date], int]] = None,
+) -> None:
+    """
+    일별 언급량 집계 증분 반영 (기사 저장과 같은 트랜잭션에서 호출)
+    
+    Args:
+        counts: {(company_id, 날짜): 신규 기사 수}
+        story_counts: {(company_id, 날짜): 신규 스토리 수 (기존 스토리에 편입되지 않은 기사)}
+    """
+    if not counts:
+        return
+    story_counts = story_counts or {}
+    stmt = pg_insert(MentionTrendDaily).values([
+        {"company_id": company_id, "date": day, "mention_count": count, "story_count": story_counts.get((company_id, day), 0)}
+        for (company_id, day), count in counts.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_mention_trends_daily_company_date",
+        set_={
+            "mention_count": MentionTrendDaily.mention_count + stmt.excluded.mention_count,
+            "story_count": MentionTrendDaily.story_count + stmt.excluded.story_count,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+def rollup_windows(today: date, period_days: int) -> Tuple[date, date]:
+    """(현재 기간 시작일, 이전 기간 시작일) - 현재 기간은 오늘 포함 period_days 일"""
+    current_start = today - timedelta(days=period_days - 1)
+    previous_start = current_start - timedelta(days=period_days)
+    return current_start, previous_start
 
 
 class ArticleService:
     """기사 조회 서비스"""
     
-    def _has_exact_word_match(self, text: str, keyword: str) -> bool:
-        """정확한 단어 경계 매칭"""
-        import re
-        if not text or not keyword:
-            return False
-        
-        # 단어 경계를 고려한 정확한 매칭
-        pattern = r'\b' + re.escape(keyword.strip()) + r'\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
+    def __init__(self):
+        # 커서 모드에서 사용하는 총 개수 캐시 (필터 조합별)
+        self._count_cache = CountCache(ttl_seconds=60.0)
     
-    def _calculate_context_score(self, title: str, summary: str) -> float:
-        """비즈니스/ESG 컨텍스트 점수 계산"""
-        full_text = f"{title} {summary}".lower()
-        
-        # 비즈니스 컨텍스트 키워드
-        business_keywords = [
-            "기업", "회사", "솔루션", "플랫폼", "서비스", "CEO", "대표",
-            "스타트업", "기업가", "창업", "투자", "사업", "경영"
-        ]
+    async def _paginate(
+        self,
+        session,
+        query,
+        count_query,
+        count_key: tuple,
+        page: int,
+        size: int,
+        cursor: Optional[str],
+        sort: str,
+        descending: bool,
+        get_article=lambda row: row,
+    ) -> Tuple[list, int, bool, Optional[str]]:
+        """
+        공통 페이지네이션 (커서 우선, 없으면 OFFSET)
         
-        # ESG 컨텍스트 키워드 (2배 가중치)
-        esg_keywords = [
-            "ESG", "탄소", "환경", "지속가능", "친환경", "녹색", "기후",
-            "배출권", "넷제로", "탄소중립", "재생에너지", "LCA"
-        ]
+        - 커서 모드: (정렬 값, id) 이후 행만 조회 → 깊은 페이지도 첫 페이지와 같은 비용,
+          총 개수는 필터 조합별로 잠시 캐시된 값을 사용
+        - 페이지 모드: 기존 OFFSET + 정확한 count (하위 호환)
         
-        business_score = sum(1 for kw in business_keywords if kw in full_text)
-        esg_score = sum(2 for kw in esg_keywords if kw in full_text)
+        Returns:
+            (행 목록, 총 개수, 다음 페이지 존재 여부, 다음 페이지 커서)
+        """
+        sort_col = CURSOR_SORT_COLUMNS.get(sort)
         
-        # 정규화 (최대 7점)
-        max_score = 7.0
-        total_score = min(business_score + esg_score, max_score)
+        if cursor:
+            if sort_col is None:
+                raise InvalidCursorError(f"cursor pagination is not supported for sort={sort}")
+            value, row_id = decode_cursor(cursor, sort)
+            query = query.where(keyset_condition(sort_col, Article.id, value, row_id, descending))
+            total = self._count_cache.get(count_key)
+            if total is None:
+                total = (await session.execute(count_query)).scalar()
+                self._count_cache.set(count_key, total)
+        else:
+            query = query.offset((page - 1) * size)
+            total = (await session.execute(count_query)).scalar()
+            self._count_cache.set(count_key, total)
         
-        return total_score / max_score
-
-    def _has_company_mention(self, article: Article, company_name: str, positive_keywords: List[str] = None) -> bool:
-        """개선된 회사 관련성 판단 (정확한 매칭 + 컨텍스트 고려)"""
-        if not company_name:
-            return True
-        
-        title = article.title or ''
-        summary = article.summary or ''
-        full_text = f"{title} {summary}"
-        
-        # 1. 정확한 회사명 매칭
-        if self._has_exact_word_match(full_text, company_name):
-            return True
-        
-        # 2. 정확한 positive keywords 매칭
-        if positive_keywords:
-            for keyword in positive_keywords:
-                if self._has_exact_word_match(full_text, keyword):
-                    # 키워드 매칭된 경우, 컨텍스트 점수도 고려
-                    context_score = self._calculate_context_score(title, summary)
-                    
-                    # 컨텍스트 점수가 0.3 이상이면 관련성 있다고 판단
-                    if context_score >= 0.3:
-                        return True
+        # size + 1 건 조회로 다음 페이지 존재 여부 판단 (별도 count 불필요)
+        result = await session.execute(query.limit(size + 1))
+        rows = result.all()
+        has_next = len(rows) > size
+        rows = rows[:size]
+        
+        next_cursor = None
+        if has_next and sort_col is not None and rows:
+            last = get_article(rows[-1])
+            next_cursor = encode_cursor(sort, getattr(last, sort), last.id)
+        
+        return rows, total, has_next, next_cursor
+    
+    @staticmethod
+    async def _story_sizes(session, root_ids: List[int]) -> Dict[int, int]:
+        """대표 기사 id → 스토리에 묶인 기사 수"""
+        result = await session.execute(
+            select(Article.story_cluster_id, func.count(Article.id))
+            .where(Article.story_cluster_id.in_(root_ids))
+            .group_by(Article.story_cluster_id)
+        )
+        return dict(result.all())
+    
+    @staticmethod
+    def _search_conditions(terms: List[str]) -> list:
+        """
+        검색어별 부분 문자열 조건 (AND)
         
-        return False
+        패턴은 실행 시 SQL 에 값으로 펼친다 (literal_execute). 바인드 변수로 두면 prepared statement 가
+        5회 이후 generic plan 으로 바뀌며 LIKE 선택도를 기본값으로 추정해, 다중 검색어가 발행일 인덱스 대신
+        trgm 비트맵으로 전체 매칭을 읽는다 (1M 건 기준 50ms → 1.2s, scripts/test_article_search_performance.py).
+        """
+        return [
+            ARTICLE_SEARCH_TEXT.ilike(
+                bindparam(None, f"%{escape_like(term)}%", type_=String, literal_execute=True), escape="\\"
+            )
+            for term in terms
+        ]
+    
+    @staticmethod
+    def _order_by(sort: str, descending: bool) -> list:
+        """정렬 기준 → ORDER BY (커서 가능한 정렬은 (값, id) 키셋 순서)"""
+        sort_col = CURSOR_SORT_COLUMNS.get(sort)
+        if sort_col is not None:
+            return keyset_order(sort_col, Article.id, descending)
+        if sort == "title":
+            order_func = desc if descending else asc
+            return [order_func(Article.title), order_func(Article.id)]
+        return keyset_order(Article.published_at, Article.id, True)  # 기본값
     
-    def _filter_articles_by_company_mention(self, articles: List[Article], company_name: str, positive_keywords: List[str] = None) -> List[Article]:
-        """회사명이나 관련 키워드가 포함된 기사만 필터링"""
-        if not company_name:
-            return articles
+    def _list_conditions(self, params: ArticleQueryParams) -> list:
+        """목록/내보내기 공통 필터 조건"""
+        conditions = [Company.is_active == True]
+        
+        if params.company_id:
+            conditions.append(Article.company_id == params.company_id)
         
-        filtered_articles = []
-        for article in articles:
-            if self._has_company_mention(article, company_name, positive_keywords):
-                filtered_articles.append(article)
+        if params.search:
+            # ✅ [Search] 제목+요약 식(ARTICLE_SEARCH_TEXT)에 대한 ILIKE → pg_trgm GIN 식 인덱스 사용
+            conditions.extend(self._search_conditions(split_search_terms(params.search)))
         
-        return filtered_articles
+        if params.date_from:
+            conditions.append(Article.published_at >= params.date_from)
+        
+        if params.date_to:
+            conditions.append(Article.published_at <= params.date_to)
+        
+        if params.collapse_stories:
+            # ✅ [Dedup] 스토리 대표 기사만 (전재 기사는 story_size 로 표시)
+            conditions.append(IS_STORY_ROOT)
+        
+        return conditions
+    
+    @staticmethod
+    def _list_sort(params: ArticleQueryParams) -> Tuple[str, bool]:
+        """정렬 기준/방향 (알 수 없는 정렬 기준은 published_at desc)"""
+        sort = params.sort if params.sort in CURSOR_SORT_COLUMNS or params.sort == "title" else "published_at"
+        descending = params.order == "desc" if sort == params.sort else True
+        return sort, descending
     
     async def get_articles(self, params: ArticleQueryParams) -> ArticleListResponse:
-        """기사 목록 조회 (페이징, 필터링, 정렬)"""
+        """기사 목록 조회 (페이징/커서, 필터링, 정렬)"""
         async with AsyncSessionLocal() as session:
-            # 기본 쿼리 구성
-            query = select(Article, Company).join(Company).where(Company.is_active == True)
-            
-            # 필터링 적용
-            if params.company_id:
-                query = query.where(Article.company_id == params.company_id)
-            
-            if params.search:
-                search_term = f"%{params.search}%"
-                query = query.where(Article.title.ilike(search_term))
-            
-            if params.date_from:
-                query = query.where(Article.published_at >= params.date_from)
-            
-            if params.date_to:
-                query = query.where(Article.published_at <= params.date_to)
-            
-            # 정렬 적용
-            order_func = desc if params.order == "desc" else asc
-            if params.sort == "published_at":
-                query = query.order_by(order_func(Article.published_at))
-            elif params.sort == "crawled_at":
-                query = query.order_by(order_func(Article.crawled_at))
-            elif params.sort == "title":
-                query = query.order_by(order_func(Article.title))
-            else:
-                query = query.order_by(desc(Article.published_at))  # 기본값
-            
-            # 전체 개수 조회
-            count_query = select(func.count()).select_from(
-                query.subquery()
-            )
-            total_result = await session.execute(count_query)
-            total = total_result.scalar()
+            conditions = self._list_conditions(params)
+            sort, descending = self._list_sort(params)
             
-            # 페이징 적용
-            offset = (params.page - 1) * params.size
-            query = query.offset(offset).limit(params.size)
+            query = select(*ARTICLE_LIST_COLUMNS, *COMPANY_LIST_COLUMNS).join(Company).where(*conditions).order_by(*self._order_by(sort, descending))
+            count_query = select(func.count(Article.id)).join(Company).where(*conditions)
+            count_key = ("articles", params.company_id, params.search, params.date_from, params.date_to, params.collapse_stories)
             
-            # 데이터 조회
-            result = await session.execute(query)
-            rows = result.all()
+            rows, total, has_next, next_cursor = await self._paginate(
+                session, query, count_query, count_key,
+                page=params.page, size=params.size, cursor=params.cursor,
+                sort=sort, descending=descending,
+            )
             
             # 응답 데이터 구성
-            articles = []
-            for article, company in rows:
-                article_response = ArticleResponse(
-                    id=article.id,
-                    title=article.title,
-                    source_name=article.source_name,
-                    article_url=article.article_url,
-                    published_at=article.published_at,
-                    crawled_at=article.crawled_at,
-                    summary=article.summary,
-                    language=article.language,
-                    is_verified=article.is_verified,
-                    image_url=article.image_url,
-                    company_id=company.id,
-                    company_name=company.company_name,
-                    company_name_en=company.company_name_en
-                )
-                articles.append(article_response)
+            articles = [article_list_item(row) for row in rows]
+            if params.collapse_stories and articles:
+                sizes = await self._story_sizes(session, [article["id"] for article in articles])
+                for article in articles:
+                    article["story_size"] = sizes.get(article["id"], 1)
             
-            # 페이징 정보 계산
-            has_next = offset + params.size < total
-            has_prev = params.page > 1
-            
-            return ArticleListResponse(
+            return ArticleListResponse.model_construct(
                 articles=articles,
                 total=total,
                 page=params.page,
                 size=params.size,
                 has_next=has_next,
-                has_prev=has_prev
+                has_prev=bool(params.cursor) or params.page > 1,
+                next_cursor=next_cursor
             )
     
-    async def get_company_articles(self, company_id: int, page: int = 1, size: int = 20, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> ArticleListResponse:
-        """특정 회사의 기사 목록 조회 (회사명 포함 기사만 필터링)"""
+    async def export_articles(self, params: ArticleQueryParams, fmt: str) -> AsyncIterator[bytes]:
+        """
+        기사 대량 내보내기 (목록과 같은 필터/정렬, 페이지/커서 무시)
+        
+        서버 측 커서(yield_per)로 EXPORT_CHUNK_SIZE 행씩 받아 바로 인코딩하여 흘려보낸다.
+        응답 스트림이 소비되는 동안 세션을 열어 두므로 StreamingResponse 의 본문으로 사용한다.
+        """
+        conditions = self._list_conditions(params)
+        sort, descending = self._list_sort(params)
+        columns = (*ARTICLE_LIST_COLUMNS, *COMPANY_LIST_COLUMNS)
+        query = (
+            select(*columns)
+            .join(Company)
+            .where(*conditions)
+            .order_by(*self._order_by(sort, descending))
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        encoder = make_encoder(fmt, columns)
+        
+        exported = 0
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(query)
+            yield encoder.begin()
+            async for partition in result.partitions():
+                yield encoder.encode(partition)
+                exported += len(partition)
+            yield encoder.end()
+        logger.info(f"기사 내보내기 완료: {exported}건 ({fmt})")
+    
+    async def get_company_articles(self, company_id: int, page: int = 1, size: int = 20, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, cursor: Optional[str] = None) -> ArticleListResponse:
+        """특정 회사의 기사 목록 조회 (회사 언급으로 분류된 기사만)"""
         async with AsyncSessionLocal() as session:
-            # 회사 정보 및 키워드 조회
-            company_result = await session.execute(
-                select(Company.id, Company.company_name, Company.company_name_en, Company.positive_keywords)
-                .where(Company.id == company_id, Company.is_active == True)
-            )
-            company_data = company_result.first()
+            # 회사 정보 및 키워드 조회 (회사 프로필 캐시)
+            company_data = await company_profile_cache.get_active(company_id)
             
             if not company_data:
                 return ArticleListResponse(
@@ -189,66 +308,162 @@ class ArticleService:
                     has_prev=False
                 )
             
-            # 해당 회사의 기사 조회 (날짜 필터링 포함)
-            query = select(Article).where(Article.company_id == company_id)
+            # ✅ [Perf] 회사 언급 여부는 수집 시점에 분류되어 저장됨 → SQL에서 필터링/페이징
+            conditions = [Article.company_id == company_id, Article.is_company_mention.is_(True)]
             
             # 날짜 필터링 적용
             if date_from:
-                query = query.where(Article.published_at >= date_from)
+                conditions.append(Article.published_at >= date_from)
             if date_to:
-                query = query.where(Article.published_at <= date_to)
-                
-            query = query.order_by(desc(Article.published_at))
-            result = await session.execute(query)
-            all_articles = result.scalars().all()
-            
-            # 회사명이나 관련 키워드가 포함된 기사만 필터링
-            filtered_articles = self._filter_articles_by_company_mention(
-                all_articles, 
-                company_data.company_name,
-                company_data.positive_keywords or []
-            )
+                conditions.append(Article.published_at <= date_to)
             
-            # 페이징 적용
-            total = len(filtered_articles)
-            offset = (page - 1) * size
-            paginated_articles = filtered_articles[offset:offset + size]
+            query = select(*ARTICLE_LIST_COLUMNS).where(*conditions).order_by(*keyset_order(Article.published_at, Article.id))
+            count_query = select(func.count(Article.id)).where(*conditions)
+            count_key = ("company_articles", company_id, date_from, date_to)
             
-            # 응답 데이터 구성
-            articles = []
-            for article in paginated_articles:
-                article_response = ArticleResponse(
-                    id=article.id,
-                    title=article.title,
-                    source_name=article.source_name,
-                    article_url=article.article_url,
-                    published_at=article.published_at,
-                    crawled_at=article.crawled_at,
-                    summary=article.summary,
-                    language=article.language,
-                    is_verified=article.is_verified,
-                    image_url=article.image_url,
-                    company_id=company_data.id,
+            rows, total, has_next, next_cursor = await self._paginate(
+                session, query, count_query, count_key,
+                page=page, size=size, cursor=cursor,
+                sort="published_at", descending=True,
+            )
+            
+            # 응답 데이터 구성 (회사 정보는 프로필 캐시에서)
+            articles = [
+                article_list_item(
+                    row,
                     company_name=company_data.company_name,
                     company_name_en=company_data.company_name_en
                 )
-                articles.append(article_response)
-            
-            # 페이징 정보 계산
-            has_next = offset + size < total
-            has_prev = page > 1
+                for row in rows
+            ]
             
-            return ArticleListResponse(
+            return ArticleListResponse.model_construct(
                 articles=articles,
                 total=total,
                 page=page,
                 size=size,
                 has_next=has_next,
-                has_prev=has_prev
+                has_prev=bool(cursor) or page > 1,
+                next_cursor=next_cursor
             )
     
-    async def get_feed(self, page: int = 1, size: int = 20, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None) -> FeedResponse:
-        """통합 뉴스 피드 조회 (최신순, 모든 회사)"""
+    async def backfill_company_mentions(self, batch_size: int = 500) -> int:
+        """
+        회사 언급 판정 백필
+        
+        미분류(NULL) 기사와, 판정 이후 회사명/키워드가 바뀌어 규칙 지문이 달라진 기사를
+        현재 매처로 재분류한다. 스케줄러에서 주기적으로 실행된다.
+        """
+        updated = 0
+        profiles = await company_profile_cache.list_active()
+        
+        for profile in profiles:
+            matcher = profile.matcher
+            rule_hash = matcher.rule_hash
+            last_id = 0
+            while True:
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        select(Article.id, Article.title, Article.summary)
+                        .where(
+                            Article.company_id == profile.id,
+                            Article.id > last_id,
+                            Article.mention_rule_hash.is_distinct_from(rule_hash),
+                        )
+                        .order_by(Article.id)
+                        .limit(batch_size)
+                    )
+                    rows = result.all()
+                    if not rows:
+                        break
+                    
+                    await session.execute(
+                        update(Article),
+                        [
+                            {
+                                "id": row.id,
+                                "is_company_mention": matcher.is_company_mention(row.title, row.summary),
+                                "mention_rule_hash": rule_hash,
+                            }
+                            for row in rows
+                        ],
+                    )
+                    await session.commit()
+                
+                updated += len(rows)
+                last_id = rows[-1].id
+                if len(rows) < batch_size:
+                    break
+        
+        return updated
+    
+    async def reconcile_mention_rollups(self, days: Optional[int] = None) -> int:
+        """
+        일별 언급량 집계 재계산 (야간 보정 / 전체 백필)
+        
+        articles 에서 다시 집계해 덮어쓰고, 해당 구간에 기사가 사라진 집계 행은 삭제한다.
+        증분 반영이 놓친 변경(기사 삭제, 수동 적재 등)을 바로잡는다.
+        
+        Args:
+            days: 최근 N일만 재계산 (None 이면 전체 기간)
+        """
+        since_date = datetime.utcnow().date() - timedelta(days=days) if days is not None else None
+        
+        aggregate = select(
+            Article.company_id,
+            ARTICLE_DAY.label('date'),
+            func.count(Article.id).label('mention_count'),
+            func.count(Article.id).filter(IS_STORY_ROOT).label('story_count')
+        ).where(Article.published_at.isnot(None))
+        if since_date is not None:
+            aggregate = aggregate.where(
+                Article.published_at >= datetime.combine(since_date - timedelta(days=1), time.min),
+                ARTICLE_DAY >= since_date
+            )
+        aggregate = aggregate.group_by(Article.company_id, ARTICLE_DAY)
+        
+        upsert = pg_insert(MentionTrendDaily).from_select(['company_id', 'date', 'mention_count', 'story_count'], aggregate)
+        upsert = upsert.on_conflict_do_update(
+            constraint="uq_mention_trends_daily_company_date",
+            set_={
+                "mention_count": upsert.excluded.mention_count,
+                "story_count": upsert.excluded.story_count,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                MentionTrendDaily.mention_count != upsert.excluded.mention_count,
+                MentionTrendDaily.story_count != upsert.excluded.story_count,
+            ),
+        )
+        
+        stale = delete(MentionTrendDaily).where(
+            ~exists().where(
+                Article.company_id == MentionTrendDaily.company_id,
+                ARTICLE_DAY == MentionTrendDaily.date
+            )
+        )
+        if since_date is not None:
+            stale = stale.where(MentionTrendDaily.date >= since_date)
+        
+        async with AsyncSessionLocal() as session:
+            upserted = await session.execute(upsert)
+            deleted = await session.execute(stale)
+            await session.commit()
+        
+        changed = (upserted.rowcount or 0) + (deleted.rowcount or 0)
+        if changed:
+            # 보정된 집계가 트렌드 캐시에 반영되도록 세대 증가
+            await response_cache.bump_generation()
+        return changed
+    
+    async def has_mention_rollups(self) -> bool:
+        """일별 집계 테이블에 데이터가 있는지 (최초 백필 필요 여부 판단)"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(MentionTrendDaily.id).limit(1))
+            return result.first() is not None
+    
+    async def get_feed(self, page: int = 1, size: int = 20, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None, cursor: Optional[str] = None, collapse_stories: bool = False) -> FeedResponse:
+        """통합 뉴스 피드 조회 (최신순, 모든 회사, 선택적으로 유사 기사 묶기)"""
         async with AsyncSessionLocal() as session:
             # 최신순 기사 조회 (날짜 필터링 포함)
             params = ArticleQueryParams(
@@ -257,7 +472,9 @@ class ArticleService:
                 sort="published_at",
                 order="desc",
                 date_from=date_from,
-                date_to=date_to
+                date_to=date_to,
+                cursor=cursor,
+                collapse_stories=collapse_stories
             )
             
             articles_response = await self.get_articles(params)
@@ -275,12 +492,13 @@ class ArticleService:
             )
             latest_crawl = latest_crawl_result.scalar()
             
-            return FeedResponse(
+            return FeedResponse.model_construct(
                 articles=articles_response.articles,
                 total=articles_response.total,
                 page=page,
                 size=size,
                 has_next=articles_response.has_next,
+                next_cursor=articles_response.next_cursor,
                 companies_count=companies_count,
                 latest_crawl=latest_crawl
             )
@@ -322,123 +540,164 @@ class ArticleService:
             )
             return result.scalars().all()
     
-    async def search_articles(self, query: str, page: int = 1, size: int = 20) -> ArticleListResponse:
-        """기사 제목 검색"""
-        params = ArticleQueryParams(
-            page=page,
-            size=size,
-            search=query,
-            sort="published_at",
-            order="desc"
-        )
-        return await self.get_articles(params)
+    async def search_articles(self, query: str, page: int = 1, size: int = 20, cursor: Optional[str] = None, sort: str = "relevance") -> ArticleListResponse:
+        """
+        기사 검색 (제목 + 요약)
+        
+        - relevance: pg_trgm word_similarity + 제목 매칭 가중치 순 (페이지 모드, 최신 매칭 SEARCH_RELEVANCE_CANDIDATES 건 안에서)
+        - published_at: 최신순 (커서 페이지네이션 지원)
+        각 기사에 검색어 하이라이트 스니펫을 포함한다.
+        """
+        terms = split_search_terms(query)
+        if not terms:
+            return ArticleListResponse(articles=[], total=0, page=page, size=size, has_next=False, has_prev=False)
+        
+        if cursor or sort == "published_at":
+            params = ArticleQueryParams(
+                page=page,
+                size=size,
+                search=query,
+                sort="published_at",
+                order="desc",
+                cursor=cursor
+            )
+            response = await self.get_articles(params)
+        else:
+            response = await self._search_by_relevance(query, terms, page, size)
+        
+        for article in response.articles:
+            article["highlight"] = build_highlight(article["summary"], terms) or build_highlight(article["title"], terms)
+        return response
     
-    async def get_mention_trends(self, period_days: int = 30) -> MentionTrendsResponse:
-        """회사별 언급량 트렌드 분석 (상위 10개)"""
+    async def _search_by_relevance(self, query: str, terms: List[str], page: int, size: int) -> ArticleListResponse:
+        """
+        관련도 순 검색 (트라이그램 유사도 + 제목 매칭 가중치)
+        
+        흔한 검색어(회사명 등)는 매칭이 수십만 건이라 전부 유사도를 계산하면 수 초가 걸린다.
+        최신순 매칭 SEARCH_RELEVANCE_CANDIDATES 건을 후보로 잘라(흔한 검색어는 발행일 인덱스,
+        드문 검색어는 trgm 인덱스) 그 안에서만 정렬하며, total 도 후보 수로 제한된다.
+        전체 매칭을 넘겨보려면 sort=published_at 을 사용한다.
+        """
         async with AsyncSessionLocal() as session:
-            now = datetime.utcnow()
+            conditions = [Company.is_active == True, *self._search_conditions(terms)]
+            candidates = (
+                select(Article.id)
+                .join(Company)
+                .where(*conditions)
+                .order_by(*keyset_order(Article.published_at, Article.id))
+                .limit(SEARCH_RELEVANCE_CANDIDATES)
+                .cte("candidates")
+            )
             
-            # 현재 기간 (최근 30일)
-            current_end = now
-            current_start = current_end - timedelta(days=period_days)
+            title_hits = sum(
+                (case((Article.title.ilike(f"%{escape_like(term)}%", escape="\\"), 1.0), else_=0.0) for term in terms),
+                literal(0.0),
+            )
+            rank = (func.word_similarity(query, ARTICLE_SEARCH_TEXT) + title_hits).label("rank")
             
-            # 이전 기간 (직전 30일)
-            previous_end = current_start
-            previous_start = previous_end - timedelta(days=period_days)
+            total_result = await session.execute(select(func.count()).select_from(candidates))
+            total = total_result.scalar()
             
-            # 현재 기간 언급량 집계
-            current_mentions_query = select(
-                Company.id,
-                Company.company_name,
-                Company.company_name_en,
-                func.count(Article.id).label('mention_count')
-            ).select_from(
-                Company
-            ).outerjoin(
-                Article,
-                and_(
-                    Article.company_id == Company.id,
-                    Article.published_at >= current_start,
-                    Article.published_at < current_end
-                )
-            ).where(
-                Company.is_active == True
-            ).group_by(Company.id, Company.company_name, Company.company_name_en)
+            offset = (page - 1) * size
+            result = await session.execute(
+                select(*ARTICLE_LIST_COLUMNS, *COMPANY_LIST_COLUMNS)
+                .join(Company)
+                .where(Article.id.in_(select(candidates.c.id)))
+                .order_by(rank.desc(), *keyset_order(Article.published_at, Article.id))
+                .offset(offset)
+                .limit(size)
+            )
             
-            current_result = await session.execute(current_mentions_query)
-            current_mentions = {row.id: row for row in current_result.all()}
+            articles = [article_list_item(row) for row in result.all()]
             
-            # 이전 기간 언급량 집계
-            previous_mentions_query = select(
-                Company.id,
-                func.count(Article.id).label('mention_count')
-            ).select_from(
-                Company
-            ).outerjoin(
-                Article,
-                and_(
-                    Article.company_id == Company.id,
-                    Article.published_at >= previous_start,
-                    Article.published_at < previous_end
-                )
-            ).where(
-                Company.is_active == True
-            ).group_by(Company.id)
+            return ArticleListResponse.model_construct(
+                articles=articles,
+                total=total,
+                page=page,
+                size=size,
+                has_next=offset + size < total,
+                has_prev=page > 1
+            )
+    
+    @staticmethod
+    def _period_counts(previous_start_date: date, current_start_date: date, today: date, count_by: str = "articles"):
+        """회사별 현재/이전 기간 언급량 CTE (일별 집계 테이블 1회 스캔, 조건부 집계)"""
+        count_col = MentionTrendDaily.story_count if count_by == "stories" else MentionTrendDaily.mention_count
+        return select(
+            MentionTrendDaily.company_id,
+            func.sum(count_col).filter(
+                MentionTrendDaily.date >= current_start_date
+            ).label('current_count'),
+            func.sum(count_col).filter(
+                MentionTrendDaily.date < current_start_date
+            ).label('previous_count')
+        ).where(
+            MentionTrendDaily.date >= previous_start_date,
+            MentionTrendDaily.date <= today
+        ).group_by(MentionTrendDaily.company_id).cte('period_counts')
+    
+    async def get_mention_trends(self, period_days: int = 30, count_by: str = "articles") -> MentionTrendsResponse:
+        """회사별 언급량 트렌드 분석 (상위 10개, count_by=stories 면 유사 기사 묶음 단위)"""
+        # 카테고리는 매핑 조인 대신 미리 적재된 회사 × 카테고리 매트릭스에서 조회
+        matrix = await company_category_matrix.get()
+        async with AsyncSessionLocal() as session:
+            now = datetime.utcnow()
+            today = now.date()
             
-            previous_result = await session.execute(previous_mentions_query)
-            previous_mentions = {row.id: row.mention_count for row in previous_result.all()}
+            # 현재 기간 (오늘 포함 최근 N일) / 이전 기간 (직전 N일)
+            current_start_date, previous_start_date = rollup_windows(today, period_days)
+            current_start = datetime.combine(current_start_date, time.min)
+            current_end = now
+            
+            # ✅ [Perf] 단일 SQL 문: 기간별 언급량(조건부 집계) + 최신 기사(DISTINCT ON)
+            counts = self._period_counts(previous_start_date, current_start_date, today, count_by)
             
-            # 최신 기사 정보 조회
-            latest_articles_query = select(
+            latest = select(
                 Article.company_id,
                 Article.title,
                 Article.article_url,
-                Article.published_at,
-                func.row_number().over(
-                    partition_by=Article.company_id,
-                    order_by=desc(Article.published_at)
-                ).label('rn')
+                Article.published_at
             ).where(
                 Article.published_at >= current_start,
                 Article.published_at < current_end
-            )
-            
-            latest_articles_subquery = latest_articles_query.subquery()
-            latest_articles_final = select(latest_articles_subquery).where(
-                latest_articles_subquery.c.rn == 1
-            )
+            ).distinct(
+                Article.company_id
+            ).order_by(
+                Article.company_id,
+                desc(Article.published_at)
+            ).cte('latest_articles')
             
-            latest_result = await session.execute(latest_articles_final)
-            latest_articles = {row.company_id: row for row in latest_result.all()}
-            
-            # 회사별 ESG 서비스 카테고리 정보 조회
-            company_categories_query = select(
-                CompanyServiceMapping.company_id,
-                ESGServiceCategory.category_code,
-                ESGServiceCategory.main_topic
-            ).join(
-                ESGServiceCategory,
-                CompanyServiceMapping.category_id == ESGServiceCategory.id
+            current_count = func.coalesce(counts.c.current_count, 0)
+            trends_query = select(
+                Company.id,
+                Company.company_name,
+                Company.company_name_en,
+                current_count.label('current_count'),
+                func.coalesce(counts.c.previous_count, 0).label('previous_count'),
+                latest.c.title.label('latest_title'),
+                latest.c.article_url.label('latest_url'),
+                latest.c.published_at.label('latest_published_at'),
+                func.count().over().label('total_companies')
+            ).select_from(
+                Company
+            ).outerjoin(
+                counts, counts.c.company_id == Company.id
+            ).outerjoin(
+                latest, latest.c.company_id == Company.id
             ).where(
-                CompanyServiceMapping.provides_service == True
-            )
+                Company.is_active == True
+            ).order_by(
+                desc(current_count), Company.id
+            ).limit(10)
             
-            categories_result = await session.execute(company_categories_query)
-            company_categories = {}
-            for row in categories_result.all():
-                if row.company_id not in company_categories:
-                    company_categories[row.company_id] = {
-                        'categories': [],
-                        'topics': set()
-                    }
-                company_categories[row.company_id]['categories'].append(row.category_code)
-                company_categories[row.company_id]['topics'].add(row.main_topic)
-            
-            # 트렌드 아이템 생성
-            trend_items = []
-            for company_id, current_data in current_mentions.items():
-                current_count = current_data.mention_count
-                previous_count = previous_mentions.get(company_id, 0)
+            result = await session.execute(trends_query)
+            rows = result.all()
+            
+            # 트렌드 아이템 생성 (현재 언급량 기준 상위 10개, SQL 에서 정렬됨)
+            top_trends = []
+            for rank, row in enumerate(rows, start=1):
+                current_count = row.current_count
+                previous_count = row.previous_count
                 
                 # 증감률 계산
                 if previous_count > 0:
@@ -454,55 +713,32 @@ class ArticleService:
                 else:
                     change_type = "down"
                 
-                # 최신 기사 정보
-                latest_article = latest_articles.get(company_id)
+                # ESG 서비스 카테고리 정보 / 회사 유형 (매트릭스 적재 시 계산됨)
+                company_categories = matrix.company_categories(row.id)
                 
-                # ESG 서비스 카테고리 정보
-                company_esg_info = company_categories.get(company_id, {'categories': [], 'topics': set()})
-                service_categories = company_esg_info['categories']
-                primary_categories = list(company_esg_info['topics'])
-                
-                # 회사 유형 결정
-                if len(service_categories) >= 15:
-                    company_type = "All-in-One"
-                elif len(service_categories) >= 8:
-                    company_type = "Specialized"
-                elif len(service_categories) >= 3:
-                    company_type = "Focused"
-                else:
-                    company_type = "Niche"
-                
-                trend_item = MentionTrendItem(
-                    rank=0,  # 임시값, 나중에 정렬 후 설정
-                    company_id=company_id,
-                    company_name=current_data.company_name,
-                    company_name_en=current_data.company_name_en,
+                top_trends.append(MentionTrendItem(
+                    rank=rank,
+                    company_id=row.id,
+                    company_name=row.company_name,
+                    company_name_en=row.company_name_en,
                     current_mentions=current_count,
                     previous_mentions=previous_count,
                     change_rate=round(change_rate, 2),
                     change_type=change_type,
-                    primary_categories=primary_categories,
-                    service_categories=service_categories,
-                    company_type=company_type,
-                    latest_article_title=latest_article.title if latest_article else None,
-                    latest_article_url=latest_article.article_url if latest_article else None,
-                    latest_published_at=latest_article.published_at if latest_article else None
-                )
-                trend_items.append(trend_item)
-            
-            # 현재 언급량 기준으로 정렬 (상위 10개)
-            trend_items.sort(key=lambda x: x.current_mentions, reverse=True)
-            top_trends = trend_items[:10]
-            
-            # 순위 설정
-            for i, item in enumerate(top_trends):
-                item.rank = i + 1
+                    primary_categories=company_categories.primary_categories,
+                    service_categories=company_categories.service_categories,
+                    company_type=company_categories.company_type,
+                    latest_article_title=row.latest_title,
+                    latest_article_url=row.latest_url,
+                    latest_published_at=row.latest_published_at
+                ))
             
             return MentionTrendsResponse(
                 trends=top_trends,
                 period_days=period_days,
+                count_by=count_by,
                 analysis_date=now,
-                total_companies=len(current_mentions)
+                total_companies=rows[0].total_companies if rows else 0
             )
     
     async def get_company_mention_stats(self, company_id: int, period_days: int = 30) -> Optional[CompanyMentionStats]:
@@ -517,34 +753,27 @@ class ArticleService:
                 return None
             
             now = datetime.utcnow()
+            today = now.date()
             
-            # 현재 기간 (최근 30일)
+            # 현재 기간 (오늘 포함 최근 N일) / 이전 기간 (직전 N일)
+            current_start_date, previous_start_date = rollup_windows(today, period_days)
+            current_start = datetime.combine(current_start_date, time.min)
             current_end = now
-            current_start = current_end - timedelta(days=period_days)
-            
-            # 이전 기간 (직전 30일)
-            previous_end = current_start
-            previous_start = previous_end - timedelta(days=period_days)
-            
-            # 현재 기간 언급량
-            current_count_result = await session.execute(
-                select(func.count(Article.id)).where(
-                    Article.company_id == company_id,
-                    Article.published_at >= current_start,
-                    Article.published_at < current_end
-                )
-            )
-            current_count = current_count_result.scalar()
-            
-            # 이전 기간 언급량
-            previous_count_result = await session.execute(
-                select(func.count(Article.id)).where(
-                    Article.company_id == company_id,
-                    Article.published_at >= previous_start,
-                    Article.published_at < previous_end
+            
+            # ✅ [Rollup] 일별 집계 테이블에서 이전+현재 기간을 한 번에 조회
+            daily_result = await session.execute(
+                select(MentionTrendDaily.date, MentionTrendDaily.mention_count)
+                .where(
+                    MentionTrendDaily.company_id == company_id,
+                    MentionTrendDaily.date >= previous_start_date,
+                    MentionTrendDaily.date <= today
                 )
+                .order_by(MentionTrendDaily.date)
             )
-            previous_count = previous_count_result.scalar()
+            daily_rows = daily_result.all()
+            
+            current_count = sum(row.mention_count for row in daily_rows if row.date >= current_start_date)
+            previous_count = sum(row.mention_count for row in daily_rows if row.date < current_start_date)
             
             # 증감률 계산
             if previous_count > 0:
@@ -561,23 +790,10 @@ class ArticleService:
                 change_type = "down"
             
             # 일별 언급량 데이터 (현재 기간)
-            daily_mentions_query = select(
-                func.date(Article.published_at).label('date'),
-                func.count(Article.id).label('count')
-            ).where(
-                Article.company_id == company_id,
-                Article.published_at >= current_start,
-                Article.published_at < current_end
-            ).group_by(
-                func.date(Article.published_at)
-            ).order_by(
-                func.date(Article.published_at)
-            )
-            
-            daily_result = await session.execute(daily_mentions_query)
             daily_mentions = [
-                {"date": str(row.date), "count": row.count}
-                for row in daily_result.all()
+                {"date": str(row.date), "count": row.mention_count}
+                for row in daily_rows
+                if row.date >= current_start_date and row.mention_count > 0
             ]
             
             return CompanyMentionStats(
@@ -592,176 +808,91 @@ class ArticleService:
                 period_end=current_end
             )
     
-    async def get_category_trends(self, period_days: int = 30) -> CategoryTrendsResponse:
-        """ESG 서비스 카테고리별 언급량 트렌드 분석"""
+    async def get_category_trends(self, period_days: int = 30, count_by: str = "articles") -> CategoryTrendsResponse:
+        """ESG 서비스 카테고리별 언급량 트렌드 분석 (count_by=stories 면 유사 기사 묶음 단위)"""
+        matrix = await company_category_matrix.get()
         async with AsyncSessionLocal() as session:
             now = datetime.utcnow()
+            today = now.date()
             
-            # 현재 기간 (최근 30일)
-            current_end = now
-            current_start = current_end - timedelta(days=period_days)
-            
-            # 이전 기간 (직전 30일)
-            previous_end = current_start
-            previous_start = previous_end - timedelta(days=period_days)
-            
-            # 현재 기간 카테고리별 언급량 집계
-            current_category_mentions_query = select(
-                ESGServiceCategory.id,
-                ESGServiceCategory.category_code,
-                ESGServiceCategory.category_name,
-                ESGServiceCategory.category_name_en,
-                ESGServiceCategory.main_topic,
-                func.count(Article.id).label('mention_count'),
-                func.count(func.distinct(Company.id)).label('companies_count')
-            ).select_from(
-                ESGServiceCategory
-            ).join(
-                CompanyServiceMapping,
-                and_(
-                    CompanyServiceMapping.category_id == ESGServiceCategory.id,
-                    CompanyServiceMapping.provides_service == True
-                )
-            ).join(
-                Company,
-                and_(
-                    Company.id == CompanyServiceMapping.company_id,
-                    Company.is_active == True
-                )
-            ).outerjoin(
-                Article,
-                and_(
-                    Article.company_id == Company.id,
-                    Article.published_at >= current_start,
-                    Article.published_at < current_end
-                )
-            ).group_by(
-                ESGServiceCategory.id,
-                ESGServiceCategory.category_code,
-                ESGServiceCategory.category_name,
-                ESGServiceCategory.category_name_en,
-                ESGServiceCategory.main_topic
-            )
-            
-            current_result = await session.execute(current_category_mentions_query)
-            current_categories = {row.id: row for row in current_result.all()}
+            # 현재 기간 (오늘 포함 최근 N일) / 이전 기간 (직전 N일)
+            current_start_date, previous_start_date = rollup_windows(today, period_days)
             
-            # 이전 기간 카테고리별 언급량 집계
-            previous_category_mentions_query = select(
-                ESGServiceCategory.id,
-                func.count(Article.id).label('mention_count')
-            ).select_from(
-                ESGServiceCategory
-            ).join(
-                CompanyServiceMapping,
-                and_(
-                    CompanyServiceMapping.category_id == ESGServiceCategory.id,
-                    CompanyServiceMapping.provides_service == True
-                )
-            ).join(
-                Company,
-                and_(
-                    Company.id == CompanyServiceMapping.company_id,
-                    Company.is_active == True
-                )
-            ).outerjoin(
-                Article,
-                and_(
-                    Article.company_id == Company.id,
-                    Article.published_at >= previous_start,
-                    Article.published_at < previous_end
-                )
-            ).group_by(ESGServiceCategory.id)
-            
-            previous_result = await session.execute(previous_category_mentions_query)
-            previous_categories = {row.id: row.mention_count for row in previous_result.all()}
-            
-            # 각 카테고리별 상위 언급량 회사 조회
-            top_companies_query = select(
-                CompanyServiceMapping.category_id,
-                Company.company_name,
-                func.count(Article.id).label('mention_count')
-            ).select_from(
-                CompanyServiceMapping
-            ).join(
-                Company,
-                and_(
-                    Company.id == CompanyServiceMapping.company_id,
-                    Company.is_active == True
-                )
-            ).join(
-                Article,
-                and_(
-                    Article.company_id == Company.id,
-                    Article.published_at >= current_start,
-                    Article.published_at < current_end
-                )
-            ).where(
-                CompanyServiceMapping.provides_service == True
-            ).group_by(
-                CompanyServiceMapping.category_id,
-                Company.company_name
-            ).order_by(
-                CompanyServiceMapping.category_id,
-                desc(func.count(Article.id))
-            )
-            
-            top_companies_result = await session.execute(top_companies_query)
-            category_top_companies = {}
-            for row in top_companies_result.all():
-                if row.category_id not in category_top_companies:
-                    category_top_companies[row.category_id] = []
-                if len(category_top_companies[row.category_id]) < 3:  # 상위 3개 회사만
-                    category_top_companies[row.category_id].append(row.company_name)
-            
-            # 카테고리 트렌드 아이템 생성
-            trend_items = []
-            for category_id, current_data in current_categories.items():
-                current_count = current_data.mention_count
-                previous_count = previous_categories.get(category_id, 0)
-                
-                # 증감률 계산
-                if previous_count > 0:
-                    change_rate = ((current_count - previous_count) / previous_count) * 100
-                else:
-                    change_rate = 100.0 if current_count > 0 else 0.0
-                
-                # 변화 유형 결정
-                if abs(change_rate) < 5:
-                    change_type = "stable"
-                elif change_rate > 0:
-                    change_type = "up"
-                else:
-                    change_type = "down"
-                
-                # 상위 회사 목록
-                top_companies = category_top_companies.get(category_id, [])
-                
-                trend_item = CategoryTrendItem(
-                    rank=0,  # 임시값, 나중에 정렬 후 설정
-                    category_code=current_data.category_code,
-                    category_name=current_data.category_name,
-                    category_name_en=current_data.category_name_en,
-                    main_topic=current_data.main_topic,
-                    current_mentions=current_count,
-                    previous_mentions=previous_count,
-                    change_rate=round(change_rate, 2),
-                    change_type=change_type,
-                    companies_count=current_data.companies_count,
-                    top_companies=top_companies
-                )
-                trend_items.append(trend_item)
+            # 회사별 기간 언급량 (일별 집계 테이블 1회 스캔)
+            counts = self._period_counts(previous_start_date, current_start_date, today, count_by)
+            result = await session.execute(select(counts))
+            count_rows = result.all()
+        
+        # ✅ [Perf] 카테고리 집계 = 회사별 언급량 벡터 × 회사-카테고리 매트릭스 (매핑 조인 없음)
+        current = matrix.company_vector({row.company_id: row.current_count for row in count_rows})
+        previous = matrix.company_vector({row.company_id: row.previous_count for row in count_rows})
+        current_totals = matrix.category_totals(current)
+        previous_totals = matrix.category_totals(previous)
+        top_companies = matrix.top_companies(current, limit=3)
+        
+        # 제공 회사가 있는 카테고리만, 현재 언급량 내림차순 (동률은 카테고리 ID 순)
+        order = np.lexsort((matrix.category_ids, -current_totals))
+        current_categories = {
+            matrix.categories[j].id: {
+                'category_code': matrix.categories[j].category_code,
+                'category_name': matrix.categories[j].category_name,
+                'category_name_en': matrix.categories[j].category_name_en,
+                'main_topic': matrix.categories[j].main_topic,
+                'mention_count': int(current_totals[j]),
+                'previous_count': int(previous_totals[j]),
+                'companies_count': int(matrix.category_company_counts[j]),
+                'top_companies': top_companies[j],
+            }
+            for j in order
+            if matrix.category_company_counts[j] > 0
+        }
+        
+        # 카테고리 트렌드 아이템 생성
+        trend_items = []
+        for category_id, current_data in current_categories.items():
+            current_count = current_data['mention_count']
+            previous_count = current_data['previous_count']
             
-            # 현재 언급량 기준으로 정렬
-            trend_items.sort(key=lambda x: x.current_mentions, reverse=True)
+            # 증감률 계산
+            if previous_count > 0:
+                change_rate = ((current_count - previous_count) / previous_count) * 100
+            else:
+                change_rate = 100.0 if current_count > 0 else 0.0
             
-            # 순위 설정
-            for i, item in enumerate(trend_items):
-                item.rank = i + 1
+            # 변화 유형 결정
+            if abs(change_rate) < 5:
+                change_type = "stable"
+            elif change_rate > 0:
+                change_type = "up"
+            else:
+                change_type = "down"
             
-            return CategoryTrendsResponse(
-                trends=trend_items,
-                period_days=period_days,
-                analysis_date=now,
-                total_categories=len(current_categories)
+            # 상위 회사 목록 (상위 3개 회사만, 매트릭스에서 집계됨)
+            top_companies = current_data['top_companies']
+            
+            trend_item = CategoryTrendItem(
+                rank=0,  # 임시값, 나중에 정렬 후 설정
+                category_code=current_data['category_code'],
+                category_name=current_data['category_name'],
+                category_name_en=current_data['category_name_en'],
+                main_topic=current_data['main_topic'],
+                current_mentions=current_count,
+                previous_mentions=previous_count,
+                change_rate=round(change_rate, 2),
+                change_type=change_type,
+                companies_count=current_data['companies_count'],
+                top_companies=top_companies
             )
+            trend_items.append(trend_item)
+        
+        # 순위 설정 (현재 언급량 기준, 위에서 정렬됨)
+        for i, item in enumerate(trend_items):
+            item.rank = i + 1
+        
+        return CategoryTrendsResponse(
+            trends=trend_items,
+            period_days=period_days,
+            count_by=count_by,
+            analysis_date=now,
+            total_categories=len(current_categories)
+        )
@@ -0,0 +1,234 @@
+"""
+회사 × ESG 서비스 카테고리 이진 매트릭스
+
+CompanyServiceMapping(provides_service=True) 을 활성 회사 × 카테고리 bool 행렬로 한 번 적재해 두고
+매핑 쓰기 시 버전을 올려 재적재한다. 트렌드 API 는 매 요청마다 매핑 테이블을 조인하는 대신
+회사별 언급량 벡터와 이 행렬의 곱으로 카테고리 합계를 계산한다.
+"""
+import asyncio
+import time
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from .constants import CATEGORY_MATRIX_TTL_SECONDS, COMPANY_TYPE_DEFAULT, COMPANY_TYPE_THRESHOLDS
+from .models import Company, CompanyServiceMapping, ESGServiceCategory
+from ..core.database import AsyncSessionLocal
+
+
+class CategoryInfo(NamedTuple):
+    """카테고리 메타데이터 (행렬 열 순서 = 카테고리 ID 순)"""
+    id: int
+    category_code: str
+    category_name: str
+    category_name_en: Optional[str]
+    main_topic: str
+
+
+class CompanyCategories(NamedTuple):
+    """회사별 제공 카테고리 요약"""
+    service_categories: List[str]
+    primary_categories: List[str]
+    company_type: str
+
+
+_NO_CATEGORIES = CompanyCategories([], [], COMPANY_TYPE_DEFAULT)
+
+
+def classify_company_types(category_counts: np.ndarray) -> np.ndarray:
+    """제공 카테고리 수 → 회사 유형 ("All-in-One", "Specialized", "Focused", "Niche")"""
+    return np.select(
+        [category_counts >= lower for lower, _ in COMPANY_TYPE_THRESHOLDS],
+        [name for _, name in COMPANY_TYPE_THRESHOLDS],
+        default=COMPANY_TYPE_DEFAULT,
+    )
+
+
+class CategoryMatrixSnapshot:
+    """
+    적재 시점의 불변 매트릭스 (재적재 시 인스턴스 통째로 교체)
+
+    - matrix[i, j]: i번째 활성 회사가 j번째 카테고리 서비스를 제공하는지 여부
+    - 행 순서 = 회사 ID 순, 열 순서 = 카테고리 ID 순
+    """
+
+    __slots__ = (
+        "version", "company_ids", "company_names", "company_index",
+        "categories", "category_ids", "matrix", "category_company_counts",
+        "_company_categories",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        companies: List[Tuple[int, str]],
+        categories: List[CategoryInfo],
+        mappings: List[Tuple[int, int]],
+    ):
+        self.version = version
+        self.company_ids = np.array([company_id for company_id, _ in companies], dtype=np.int64)
+        self.company_names = np.array([name for _, name in companies], dtype=object)
+        self.company_index: Dict[int, int] = {company_id: i for i, (company_id, _) in enumerate(companies)}
+        self.categories = categories
+        self.category_ids = np.array([category.id for category in categories], dtype=np.int64)
+        category_index = {category.id: j for j, category in enumerate(categories)}
+
+        self.matrix = np.zeros((len(companies), len(categories)), dtype=bool)
+        # 비활성 회사의 매핑은 제외
+        cells = [
+            (self.company_index[company_id], category_index[category_id])
+            for company_id, category_id in mappings
+            if company_id in self.company_index and category_id in category_index
+        ]
+        if cells:
+            rows, cols = zip(*cells)
+            self.matrix[list(rows), list(cols)] = True
+        self.category_company_counts = self.matrix.sum(axis=0)
+
+        # 회사별 요약은 행마다 한 번만 계산
+        types = classify_company_types(self.matrix.sum(axis=1))
+        self._company_categories: Dict[int, CompanyCategories] = {}
+        for i, company_id in enumerate(self.company_ids.tolist()):
+            provided = [categories[j] for j in np.flatnonzero(self.matrix[i])]
+            self._company_categories[company_id] = CompanyCategories(
+                service_categories=[category.category_code for category in provided],
+                primary_categories=sorted({category.main_topic for category in provided}),
+                company_type=str(types[i]),
+            )
+
+    def company_categories(self, company_id: int) -> CompanyCategories:
+        """회사 제공 카테고리 코드 / 주제 / 유형 (매핑 없는 회사는 빈 목록, Niche)"""
+        return self._company_categories.get(company_id, _NO_CATEGORIES)
+
+    def company_vector(self, values: Mapping[int, int]) -> np.ndarray:
+        """회사 ID → 값 dict 를 행렬 행 순서의 벡터로 변환 (없는 회사는 0)"""
+        vector = np.zeros(len(self.company_ids), dtype=np.int64)
+        for company_id, value in values.items():
+            i = self.company_index.get(company_id)
+            if i is not None and value:
+                vector[i] = value
+        return vector
+
+    def category_totals(self, company_values: np.ndarray) -> np.ndarray:
+        """카테고리별 합계 (제공 회사 값의 합, 행렬-벡터 곱)"""
+        return company_values @ self.matrix
+
+    def top_companies(self, company_values: np.ndarray, limit: int = 3) -> List[List[str]]:
+        """카테고리별 값 상위 회사명 (값 > 0, 값 내림차순 / 회사 ID 오름차순)"""
+        order = np.lexsort((self.company_ids, -company_values))
+        ranked = self.matrix[order] & (company_values[order] > 0)[:, None]
+        picked = ranked & (np.cumsum(ranked, axis=0) <= limit)
+        names = self.company_names[order]
+        return [names[picked[:, j]].tolist() for j in range(len(self.categories))]
+
+
+class CompanyCategoryMatrixCache:
+    """
+    회사 × 카테고리 매트릭스 캐시 (버전 기반 무효화)
+
+    - 활성 회사 / 카테고리 / 매핑을 각각 단일 쿼리로 적재
+    - 회사, 카테고리, 매핑 쓰기 시 버전 증가 → 다음 조회에서 재적재
+    - 외부 변경 대비 TTL 경과 시에도 재적재
+    """
+
+    def __init__(self, ttl_seconds: int = CATEGORY_MATRIX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[CategoryMatrixSnapshot] = None
+        self._version = 0
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (버전 증가)"""
+        self._version += 1
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and self._snapshot.version == self._version
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def get(self) -> CategoryMatrixSnapshot:
+        """현재 매트릭스 스냅샷 (필요 시 재적재)"""
+        if self._is_fresh():
+            return self._snapshot
+        async with self._lock:
+            if self._is_fresh():
+                return self._snapshot
+            # 적재 도중 쓰기가 발생하면 버전 불일치로 다음 조회에서 다시 적재된다
+            version = self._version
+            async with AsyncSessionLocal() as session:
+                companies = (await session.execute(
+                    select(Company.id, Company.company_name)
+                    .where(Company.is_active == True)
+                    .order_by(Company.id)
+                )).all()
+                categories = (await session.execute(
+                    select(
+                        ESGServiceCategory.id,
+                        ESGServiceCategory.category_code,
+                        ESGServiceCategory.category_name,
+                        ESGServiceCategory.category_name_en,
+                        ESGServiceCategory.main_topic,
+                    ).order_by(ESGServiceCategory.id)
+                )).all()
+                mappings = (await session.execute(
+                    select(CompanyServiceMapping.company_id, CompanyServiceMapping.category_id)
+                    .where(CompanyServiceMapping.provides_service == True)
+                )).all()
+
+            self._snapshot = CategoryMatrixSnapshot(
+                version,
+                [tuple(row) for row in companies],
+                [CategoryInfo(*row) for row in categories],
+                [tuple(row) for row in mappings],
+            )
+            self._loaded_at = time.monotonic()
+            logger.debug(
+                f"Company category matrix loaded: {self._snapshot.matrix.shape} "
+                f"({int(self._snapshot.matrix.sum())} mappings, v{version})"
+            )
+            return self._snapshot
+
+
+# 전역 캐시 인스턴스
+company_category_matrix = CompanyCategoryMatrixCache()
+
+
+# ============================================
+# 쓰기 감지 → 버전 무효화
+# ============================================
+
+_DIRTY_KEY = "_company_category_matrix_dirty"
+
+
+@event.listens_for(Company, "after_insert")
+@event.listens_for(Company, "after_update")
+@event.listens_for(Company, "after_delete")
+@event.listens_for(ESGServiceCategory, "after_insert")
+@event.listens_for(ESGServiceCategory, "after_update")
+@event.listens_for(ESGServiceCategory, "after_delete")
+@event.listens_for(CompanyServiceMapping, "after_insert")
+@event.listens_for(CompanyServiceMapping, "after_update")
+@event.listens_for(CompanyServiceMapping, "after_delete")
+def _invalidate_on_matrix_write(mapper, connection, target) -> None:
+    """ORM을 통한 회사/카테고리/매핑 쓰기 시 매트릭스 무효화"""
+    company_category_matrix.invalidate()
+    session = object_session(target)
+    if session is not None:
+        session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_matrix_after_commit(session) -> None:
+    """커밋 이전에 재적재된 매트릭스가 남지 않도록 커밋 시점에 한 번 더 무효화"""
+    if session.info.pop(_DIRTY_KEY, False):
+        company_category_matrix.invalidate()
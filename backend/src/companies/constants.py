@@ -0,0 +1,19 @@
+"""
+회사 도메인 상수
+"""
+
+# 회사 프로필 캐시 최대 유지 시간(초)
+# 프로세스 외부(스크립트, 직접 SQL)에서 수정된 회사 정보도 이 시간 내에 반영된다.
+COMPANY_PROFILE_TTL_SECONDS: int = 300
+
+# 회사 × ESG 카테고리 매트릭스 최대 유지 시간(초)
+# 시드 스크립트 등 프로세스 외부에서 바뀐 서비스 매핑도 이 시간 내에 반영된다.
+CATEGORY_MATRIX_TTL_SECONDS: int = 600
+
+# 제공 카테고리 수 기준 회사 유형 (하한, 유형) - 큰 값부터
+COMPANY_TYPE_THRESHOLDS = (
+    (15, "All-in-One"),
+    (8, "Specialized"),
+    (3, "Focused"),
+)
+COMPANY_TYPE_DEFAULT: str = "Niche"
@@ -39,6 +39,7 @@ class MentionTrendDaily(Base, TimestampMixin):
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
     mention_count = Column(Integer, nullable=False, default=0)
+    story_count = Column(Integer, nullable=False, default=0, server_default="0")  # 유사 기사 묶음 기준 건수
     
     # 관계 설정
     company = relationship("Company")
@@ -0,0 +1,180 @@
+"""
+회사 프로필 캐시
+크롤러/기사 서비스가 공유하는 회사 메타데이터(이름, 키워드, CEO, 검색 전략) 인메모리 캐시
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from .constants import COMPANY_PROFILE_TTL_SECONDS
+from .models import Company
+from ..core.database import AsyncSessionLocal
+from ..crawler.utils import CompanyKeywordMatcher
+
+
+class CompanyProfile:
+    """회사 메타데이터 레코드 (캐시 항목)"""
+
+    __slots__ = (
+        "id", "company_name", "company_name_en", "positive_keywords",
+        "negative_keywords", "ceo_name", "search_strategy", "is_active",
+        "_matcher",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        company_name: str,
+        company_name_en: Optional[str],
+        positive_keywords: Optional[List[str]],
+        negative_keywords: Optional[List[str]],
+        ceo_name: Optional[str],
+        search_strategy: Optional[str],
+        is_active: bool,
+    ):
+        self.id = id
+        self.company_name = company_name
+        self.company_name_en = company_name_en
+        self.positive_keywords = positive_keywords or []
+        self.negative_keywords = negative_keywords or []
+        self.ceo_name = ceo_name
+        self.search_strategy = search_strategy
+        self.is_active = is_active
+        self._matcher: Optional[CompanyKeywordMatcher] = None
+
+    @property
+    def matcher(self) -> CompanyKeywordMatcher:
+        """회사별 키워드 매처 (최초 접근 시 컴파일)"""
+        if self._matcher is None:
+            self._matcher = CompanyKeywordMatcher(
+                self.company_name,
+                self.company_name_en,
+                self.positive_keywords,
+                self.negative_keywords,
+            )
+        return self._matcher
+
+    def __repr__(self):
+        return f"<CompanyProfile(id={self.id}, name={self.company_name})>"
+
+
+class CompanyProfileCache:
+    """
+    회사 프로필 캐시 (버전 기반 무효화)
+
+    - 전체 회사를 단일 쿼리로 적재
+    - 회사 쓰기 시 버전 증가 → 다음 조회에서 재적재
+    - 외부 변경 대비 TTL 경과 시에도 재적재
+    """
+
+    def __init__(self, ttl_seconds: int = COMPANY_PROFILE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._profiles: Dict[int, CompanyProfile] = {}
+        self._version = 0
+        self._loaded_version = -1
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (버전 증가)"""
+        self._version += 1
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_version == self._version
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def _ensure_loaded(self) -> None:
+        if self._is_fresh():
+            return
+        async with self._lock:
+            if self._is_fresh():
+                return
+            # 적재 도중 쓰기가 발생하면 버전 불일치로 다음 조회에서 다시 적재된다
+            version = self._version
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(
+                        Company.id,
+                        Company.company_name,
+                        Company.company_name_en,
+                        Company.positive_keywords,
+                        Company.negative_keywords,
+                        Company.ceo_name,
+                        Company.search_strategy,
+                        Company.is_active,
+                    )
+                )
+                rows = result.all()
+
+            self._profiles = {
+                row.id: CompanyProfile(
+                    id=row.id,
+                    company_name=row.company_name,
+                    company_name_en=row.company_name_en,
+                    positive_keywords=row.positive_keywords,
+                    negative_keywords=row.negative_keywords,
+                    ceo_name=row.ceo_name,
+                    search_strategy=row.search_strategy,
+                    is_active=row.is_active,
+                )
+                for row in rows
+            }
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+            logger.debug(f"Company profile cache loaded: {len(self._profiles)} companies (v{version})")
+
+    async def get(self, company_id: int) -> Optional[CompanyProfile]:
+        """회사 프로필 조회"""
+        await self._ensure_loaded()
+        return self._profiles.get(company_id)
+
+    async def get_active(self, company_id: int) -> Optional[CompanyProfile]:
+        """활성 회사 프로필 조회 (비활성/미존재 시 None)"""
+        profile = await self.get(company_id)
+        if profile is None or not profile.is_active:
+            return None
+        return profile
+
+    async def list_active(self) -> List[CompanyProfile]:
+        """활성 회사 프로필 목록 (ID 순)"""
+        await self._ensure_loaded()
+        return [p for _, p in sorted(self._profiles.items()) if p.is_active]
+
+
+# 전역 캐시 인스턴스
+company_profile_cache = CompanyProfileCache()
+
+
+# ============================================
+# 쓰기 감지 → 버전 무효화
+# ============================================
+
+_DIRTY_KEY = "_company_profiles_dirty"
+
+
+@event.listens_for(Company, "after_insert")
+@event.listens_for(Company, "after_update")
+@event.listens_for(Company, "after_delete")
+def _invalidate_on_company_write(mapper, connection, target) -> None:
+    """ORM을 통한 회사 생성/수정/삭제 시 캐시 무효화"""
+    company_profile_cache.invalidate()
+    session = object_session(target)
+    if session is not None:
+        session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session) -> None:
+    """커밋 이전에 재적재된 캐시가 남지 않도록 커밋 시점에 한 번 더 무효화"""
+    if session.info.pop(_DIRTY_KEY, False):
+        company_profile_cache.invalidate()
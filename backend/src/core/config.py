@@ -15,6 +15,15 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     
+    # Response Cache (대시보드 조회 API)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_USE_REDIS: bool = False  # True: REDIS_URL 을 2차 캐시 / 크롤 세대 공유에 사용
+    RESPONSE_CACHE_TTL_SECONDS: int = 300   # 날짜 경계(트렌드 기간) 반영을 위한 최대 유지 시간
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    
+    # Document Versions
+    VERSION_COMPRESSION_ENABLED: bool = False  # True: 버전 payload 를 zstd 압축(bytea)으로 저장 (zstandard 필요)
+    
     # FastAPI
     DEBUG: bool = True
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
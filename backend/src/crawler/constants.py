@@ -1,6 +1,7 @@
 """
 크롤러 설정 및 Two-Track 전략 상수
 """
+from datetime import timedelta, timezone
 
 # Two-Track 전략 토글
 TWO_TRACK_ENABLED: bool = True
@@ -21,3 +22,98 @@ DISPLAY_PER_PAGE: int = 10
 DEFAULT_SEARCH_STRATEGY: str = "two_track"
 
 
+
+
+# 컨텍스트 점수용 비즈니스 키워드 (가중치 1)
+BUSINESS_CONTEXT_KEYWORDS = (
+    "기업", "회사", "솔루션", "플랫폼", "서비스", "CEO", "대표",
+    "스타트업", "기업가", "창업", "투자", "사업", "경영",
+)
+
+# 컨텍스트 점수용 ESG 키워드 (가중치 2)
+ESG_CONTEXT_KEYWORDS = (
+    "ESG", "탄소", "환경", "지속가능", "친환경", "녹색", "기후",
+    "배출권", "넷제로", "탄소중립", "재생에너지", "LCA",
+)
+
+# 컨텍스트 점수 정규화 기준 (최대 7점)
+CONTEXT_MAX_SCORE: float = 7.0
+
+# 회사 언급 판정: 회사명이 없어도 positive 키워드 + 컨텍스트 점수가 이 이상이면 언급으로 간주
+MENTION_MIN_CONTEXT_SCORE: float = 0.3
+
+
+# 적응형 크롤링 스케줄 (회사별 뉴스 발생 속도 기반)
+ADAPTIVE_SCHEDULING_ENABLED: bool = True
+
+# 디스패치 주기(분): 이 간격마다 만기된 회사들을 우선순위 큐에서 꺼내 크롤링
+ADAPTIVE_TICK_MINUTES: int = 15
+
+# 회사별 크롤링 간격 범위(시간)
+ADAPTIVE_MIN_INTERVAL_HOURS: float = 1.0
+ADAPTIVE_MAX_INTERVAL_HOURS: float = 72.0
+
+# 발생률 추정 기간(일): 최근 단기/장기 구간을 블렌딩
+ADAPTIVE_SHORT_WINDOW_DAYS: int = 7
+ADAPTIVE_LONG_WINDOW_DAYS: int = 30
+ADAPTIVE_SHORT_WINDOW_WEIGHT: float = 0.7
+
+# 1회 크롤링당 기대 신규 기사 수 (간격 = 목표 / 발생률)
+ADAPTIVE_TARGET_ARTICLES_PER_CRAWL: float = 3.0
+
+# 크롤링 결과 피드백: 신규 기사 있으면 간격 축소, 없으면 지수 백오프
+ADAPTIVE_BOOST_FACTOR: float = 0.5
+ADAPTIVE_BACKOFF_FACTOR: float = 2.0
+
+# 증분 크롤링 1회 수집 상한(건)
+ADAPTIVE_MAX_ARTICLES_PER_CRAWL: int = 20
+
+# 전역 API 예산: 네이버 검색 API 일일 호출 한도(25,000) 중 스케줄러가 사용할 양
+ADAPTIVE_DAILY_API_BUDGET: int = 20000
+
+# 디스패치 1회당 크롤링할 최대 회사 수 (예산을 하루에 고르게 분산)
+ADAPTIVE_MAX_COMPANIES_PER_TICK: int = 10
+
+# 영속 크롤링 작업 큐
+# 작업 임대 시간(초): 체크포인트마다 연장, 워커가 죽으면 만료 후 회수
+CRAWL_JOB_LEASE_SECONDS: int = 600
+
+# 최대 시도 횟수 (초과 시 dead)
+CRAWL_JOB_MAX_ATTEMPTS: int = 5
+
+# 재시도 지수 백오프: base * 2^(attempts-1), 상한 적용
+CRAWL_JOB_RETRY_BASE_SECONDS: int = 300
+CRAWL_JOB_RETRY_MAX_SECONDS: int = 6 * 3600
+
+# 큐 워커 주기(분): 대기/재시도/임대 만료 작업 처리
+CRAWL_JOB_WORKER_INTERVAL_MINUTES: int = 5
+
+# 스크래퍼가 돌려주는 tzinfo 없는 발행 시각의 기준 시간대
+# (네이버 뉴스 pubDate "... +0900" 을 벽시계 그대로 파싱하므로 KST)
+SCRAPED_TIMEZONE = timezone(timedelta(hours=9))
+
+# 유사 기사(스토리) 클러스터링 - 같은 보도자료를 여러 매체가 전재한 기사 묶기
+# SimHash 입력: 제목+요약 정규화 문자열의 문자 n-gram (한글 띄어쓰기 차이에 강함)
+STORY_SHINGLE_SIZE: int = 3
+
+# n-gram 이 이보다 적은 짧은 글은 지문을 만들지 않음 (오탐 방지, 단독 스토리로 저장)
+STORY_MIN_SHINGLES: int = 16
+
+# 64비트 지문 해밍 거리 허용치 (이하이면 같은 스토리)
+# 제목+요약 정도의 짧은 글은 지문 변동이 커서 웹 문서 기준(3)보다 넓게 잡는다.
+# scripts/test_story_simhash_threshold.py 측정 기준:
+#   전재 기사 쌍 p50 9 / p95 15, 같은 회사의 다른 기사 쌍 최소 9 / p50 27
+#   10 → 스토리 묶임 89~90%, 오병합 0.01~0.03% / 12 → 96%, 0.13~0.17% / 14 → 99%, 0.4~0.6%
+# 12 이후로는 재현율 증가가 작고 오병합이 거리 1당 약 2배로 늘어 12로 둔다.
+# (LSH 밴드 13개 x 4비트 → 후보가 늘지만 후보 검증은 회사별 72시간 창 안의 popcount 비교)
+STORY_SIMHASH_MAX_DISTANCE: int = 12
+
+# 같은 스토리로 볼 발행 시각 차이(시간) = 메모리 인덱스 유지 구간
+STORY_WINDOW_HOURS: int = 72
+
+# 다른 프로세스가 저장한 기사 반영을 위한 인덱스 재적재 주기(초)
+STORY_INDEX_RELOAD_SECONDS: int = 3600
+
+# 기존 기사 클러스터 백필 1회 처리량
+STORY_BACKFILL_BATCH_SIZE: int = 500
+STORY_BACKFILL_MAX_BATCHES: int = 20
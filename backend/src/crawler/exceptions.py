@@ -0,0 +1,5 @@
+class CrawlJobLeaseLost(Exception):
+    """크롤링 작업 임대가 만료되어 다른 워커에게 넘어간 경우"""
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        super().__init__(f"Lease lost for crawl job {job_id}")
@@ -0,0 +1,69 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from src.shared.models import Base, TimestampMixin
+
+
+class CrawlWatermark(Base, TimestampMixin):
+    """회사/검색 쿼리별 증분 크롤링 기준점 (가장 최근에 본 기사)"""
+    __tablename__ = "crawl_watermarks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    query = Column(Text, nullable=False)  # 네이버 검색 쿼리 문자열
+    last_published_at = Column(DateTime(timezone=True), nullable=False)  # 가장 최근 pubDate
+    last_article_url = Column(Text, nullable=True)  # 해당 시점의 기사 URL
+    
+    # 관계 설정
+    company = relationship("Company")
+    
+    __table_args__ = (
+        UniqueConstraint('company_id', 'query', name='uq_crawl_watermark_company_query'),
+    )
+    
+    def __repr__(self):
+        return f"<CrawlWatermark(company_id={self.company_id}, query={self.query}, last={self.last_published_at})>"
+
+
+class CrawlJob(Base, TimestampMixin):
+    """
+    영속 크롤링 작업 큐 (회사 1곳 = 작업 1건)
+    
+    프로세스가 재시작되어도 완료된 작업/쿼리는 다시 하지 않도록
+    상태, 시도 횟수, 재개 지점(checkpoint), 임대 만료 시각을 DB에 보관한다.
+    """
+    __tablename__ = "crawl_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(64), nullable=False, index=True)  # 실행 묶음 (예: daily_20260101)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String(20), nullable=False, default="full")  # full | incremental
+    max_articles = Column(Integer, nullable=False, default=100)
+    
+    # 상태: pending → running → succeeded | (pending 재시도) → dead
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # 임대: 워커가 죽으면 만료 후 다른 워커가 회수
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # 재개 지점: 완료된 검색 쿼리 목록 + 누적 카운터
+    checkpoint = Column(JSONB, nullable=False, default=dict)
+    articles_saved = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # 관계 설정
+    company = relationship("Company")
+    
+    __table_args__ = (
+        UniqueConstraint('run_id', 'company_id', name='uq_crawl_job_run_company'),
+        Index('ix_crawl_jobs_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+    
+    def __repr__(self):
+        return f"<CrawlJob(id={self.id}, run_id={self.run_id}, company_id={self.company_id}, status={self.status})>"
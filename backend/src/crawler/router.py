@@ -148,7 +148,9 @@ async def get_scheduler_status():
         return {
             "is_running": crawler_scheduler.is_running,
             "jobs_count": len(jobs),
-            "jobs": jobs
+            "jobs": jobs,
+            # ✅ [Adaptive] 회사별 뉴스 발생 속도 / 크롤링 간격 / 다음 만기 (만기 순)
+            "adaptive_schedule": crawler_scheduler.get_adaptive_schedule()
         }
         
     except Exception as e:
@@ -0,0 +1,207 @@
+"""
+적응형 크롤링 스케줄러
+회사별 뉴스 발생 속도(Article.published_at 이력)로 다음 크롤링 시각을 정하고,
+전역 API 예산 안에서 우선순위 큐(만기 시각 순)로 디스패치한다.
+"""
+import heapq
+from datetime import datetime, timedelta, date
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import select, func
+
+from ..constants import (
+    ADAPTIVE_MIN_INTERVAL_HOURS,
+    ADAPTIVE_MAX_INTERVAL_HOURS,
+    ADAPTIVE_SHORT_WINDOW_DAYS,
+    ADAPTIVE_LONG_WINDOW_DAYS,
+    ADAPTIVE_SHORT_WINDOW_WEIGHT,
+    ADAPTIVE_TARGET_ARTICLES_PER_CRAWL,
+    ADAPTIVE_BOOST_FACTOR,
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_MAX_ARTICLES_PER_CRAWL,
+    ADAPTIVE_DAILY_API_BUDGET,
+    ADAPTIVE_MAX_COMPANIES_PER_TICK,
+)
+from ..service import CrawlerService
+from ...articles.models import Article
+from ...core.database import AsyncSessionLocal
+
+
+def _clamp_interval(hours: float) -> float:
+    return max(ADAPTIVE_MIN_INTERVAL_HOURS, min(ADAPTIVE_MAX_INTERVAL_HOURS, hours))
+
+
+class CompanyCrawlState:
+    """회사별 스케줄 상태"""
+
+    __slots__ = ("company_id", "rate_per_hour", "interval_hours", "next_due", "last_crawled")
+
+    def __init__(self, company_id: int, rate_per_hour: float, now: datetime):
+        self.company_id = company_id
+        self.rate_per_hour = rate_per_hour
+        self.interval_hours = self.base_interval()
+        # 편입 즉시 만기: 동시 만기 시 힙의 -rate 키로 발생률 높은 회사부터 크롤링
+        self.next_due = now
+        self.last_crawled: Optional[datetime] = None
+
+    def base_interval(self) -> float:
+        """발생률 기반 기본 간격: 1회 크롤링에 목표 건수가 쌓이는 시간"""
+        if self.rate_per_hour <= 0:
+            return ADAPTIVE_MAX_INTERVAL_HOURS
+        return _clamp_interval(ADAPTIVE_TARGET_ARTICLES_PER_CRAWL / self.rate_per_hour)
+
+    def update_rate(self, rate_per_hour: float) -> None:
+        """이력 재추정 시 간격을 새 기본값 쪽으로 되돌림 (피드백 누적이 무한히 쏠리지 않도록)"""
+        self.rate_per_hour = rate_per_hour
+        self.interval_hours = _clamp_interval((self.interval_hours + self.base_interval()) / 2)
+
+    def record_crawl(self, new_articles: int, now: datetime) -> None:
+        """크롤링 결과 피드백: 신규 기사 있으면 부스트, 없으면 지수 백오프"""
+        if new_articles > 0:
+            self.interval_hours = _clamp_interval(self.interval_hours * ADAPTIVE_BOOST_FACTOR)
+        else:
+            self.interval_hours = _clamp_interval(self.interval_hours * ADAPTIVE_BACKOFF_FACTOR)
+        self.last_crawled = now
+        self.next_due = now + timedelta(hours=self.interval_hours)
+
+
+class AdaptiveCrawlPlanner:
+    """
+    회사별 다음 크롤링 시각을 관리하는 우선순위 스케줄러
+
+    - 발생률: 최근 단기/장기 구간 기사 수를 블렌딩한 시간당 기사 수
+    - 큐: (next_due, -rate, company_id) 최소 힙, 재스케줄 시 오래된 항목은 lazy 삭제
+    - 예산: 일일 검색 API 호출 수, 회사당 평균 호출 수로 다음 크롤링 비용을 추정
+    """
+
+    def __init__(self, crawler_service: CrawlerService):
+        self.crawler_service = crawler_service
+        self.states: Dict[int, CompanyCrawlState] = {}
+        self._heap: List[Tuple[datetime, float, int]] = []
+        self._budget_day: date = date.today()
+        self._calls_used = 0
+        self._avg_calls_per_crawl = 3.0  # 관측 전 초기 추정치 (정밀 1~3 + 광역)
+
+    async def _estimate_rates(self) -> Dict[int, float]:
+        """회사별 시간당 기사 발생률 추정 (단일 GROUP BY 쿼리)"""
+        short_since = func.now() - timedelta(days=ADAPTIVE_SHORT_WINDOW_DAYS)
+        long_since = func.now() - timedelta(days=ADAPTIVE_LONG_WINDOW_DAYS)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(
+                    Article.company_id,
+                    func.count(Article.id).filter(Article.published_at >= short_since),
+                    func.count(Article.id),
+                )
+                .where(Article.published_at >= long_since)
+                .group_by(Article.company_id)
+            )
+            rows = result.all()
+
+        short_hours = ADAPTIVE_SHORT_WINDOW_DAYS * 24
+        long_hours = ADAPTIVE_LONG_WINDOW_DAYS * 24
+        return {
+            company_id: (
+                ADAPTIVE_SHORT_WINDOW_WEIGHT * (short_count / short_hours)
+                + (1 - ADAPTIVE_SHORT_WINDOW_WEIGHT) * (long_count / long_hours)
+            )
+            for company_id, short_count, long_count in rows
+        }
+
+    def _push(self, state: CompanyCrawlState) -> None:
+        heapq.heappush(self._heap, (state.next_due, -state.rate_per_hour, state.company_id))
+
+    async def refresh(self) -> None:
+        """활성 회사 목록과 발생률 재동기화 (신규 회사 편입, 비활성 회사 제거)"""
+        now = datetime.now()
+        companies = await self.crawler_service.get_active_companies()
+        rates = await self._estimate_rates()
+        active_ids = {c["id"] for c in companies}
+
+        for company_id in list(self.states):
+            if company_id not in active_ids:
+                del self.states[company_id]
+
+        for company_id in active_ids:
+            rate = rates.get(company_id, 0.0)
+            state = self.states.get(company_id)
+            if state is None:
+                state = CompanyCrawlState(company_id, rate, now)
+                self.states[company_id] = state
+                self._push(state)
+            else:
+                state.update_rate(rate)
+
+        logger.info(f"적응형 스케줄 갱신: {len(self.states)}개 회사")
+
+    def _remaining_budget(self) -> int:
+        today = date.today()
+        if today != self._budget_day:
+            self._budget_day = today
+            self._calls_used = 0
+        return ADAPTIVE_DAILY_API_BUDGET - self._calls_used
+
+    def _pop_due(self, now: datetime) -> Optional[CompanyCrawlState]:
+        """만기된 회사 중 가장 오래 기다린 회사를 꺼냄 (stale 항목 스킵)"""
+        while self._heap and self._heap[0][0] <= now:
+            next_due, _, company_id = heapq.heappop(self._heap)
+            state = self.states.get(company_id)
+            if state is not None and state.next_due == next_due:
+                return state
+        return None
+
+    async def dispatch_due(self) -> List:
+        """만기된 회사들을 예산 안에서 증분 크롤링"""
+        if not self.states:
+            await self.refresh()
+
+        now = datetime.now()
+        results = []
+        while len(results) < ADAPTIVE_MAX_COMPANIES_PER_TICK:
+            if self._remaining_budget() < self._avg_calls_per_crawl:
+                logger.warning(f"일일 API 예산 소진 ({self._calls_used}/{ADAPTIVE_DAILY_API_BUDGET}), 다음 주기로 연기")
+                break
+
+            state = self._pop_due(now)
+            if state is None:
+                break
+
+            calls_before = self.crawler_service.scraper.request_count
+            try:
+                result = await self.crawler_service.crawl_single_company(
+                    company_id=state.company_id,
+                    max_articles=ADAPTIVE_MAX_ARTICLES_PER_CRAWL,
+                    incremental=True,
+                )
+                new_articles = result.articles_saved if result.success else 0
+                results.append(result)
+            except Exception as e:
+                logger.error(f"적응형 크롤링 실패: 회사 ID {state.company_id}: {str(e)}")
+                new_articles = 0
+
+            calls = self.crawler_service.scraper.request_count - calls_before
+            self._calls_used += calls
+            self._avg_calls_per_crawl = 0.8 * self._avg_calls_per_crawl + 0.2 * max(calls, 1)
+
+            state.record_crawl(new_articles, datetime.now())
+            self._push(state)
+            logger.debug(
+                f"회사 ID {state.company_id}: 신규 {new_articles}건, API {calls}회, "
+                f"다음 크롤링 {state.interval_hours:.1f}시간 후"
+            )
+
+        return results
+
+    def get_schedule(self) -> List[dict]:
+        """회사별 스케줄 현황 (만기 순)"""
+        return [
+            {
+                "company_id": state.company_id,
+                "rate_per_hour": round(state.rate_per_hour, 4),
+                "interval_hours": round(state.interval_hours, 2),
+                "next_due": state.next_due,
+                "last_crawled": state.last_crawled,
+            }
+            for state in sorted(self.states.values(), key=lambda s: s.next_due)
+        ]
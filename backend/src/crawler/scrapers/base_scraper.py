@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import Awaitable, Callable, List, Optional, Dict, Set, Tuple
 import httpx
 import asyncio
 from datetime import datetime
 import re
 from loguru import logger
+from sqlalchemy import select
 
 from ..schemas import CrawlResult
+from ..utils import Watermark
+from ...articles.models import Article
+from ...companies.service import company_profile_cache
 from ...core.config import settings
+from ...core.database import AsyncSessionLocal
 from ..constants import (
     TWO_TRACK_ENABLED,
     PRECISION_MIN_RESULTS,
@@ -15,6 +20,10 @@ from ..constants import (
     DISPLAY_PER_PAGE,
     DEFAULT_SEARCH_STRATEGY,
 )
+from ..exceptions import CrawlJobLeaseLost
+
+# 쿼리 단위 체크포인트 콜백: (재개 상태, 방금 끝난 쿼리의 기사 목록)
+CheckpointCallback = Callable[[dict, List[dict]], Awaitable[None]]
 
 
 class BaseScraper(ABC):
@@ -24,6 +33,7 @@ class BaseScraper(ABC):
         self.client_id = settings.NAVER_CLIENT_ID
         self.client_secret = settings.NAVER_CLIENT_SECRET
         self.delay = settings.CRAWLER_DELAY_SECONDS
+        self.request_count = 0  # 검색 API 호출 누적 횟수 (API 예산 집계용)
         
     @abstractmethod
     async def search_news(self, query: str, display: int = 10, start: int = 1, sort: str = "sim") -> dict:
@@ -38,13 +48,46 @@ class BaseScraper(ABC):
         company_name: str = None,
         source_track: Optional[str] = None,
         query_used: Optional[str] = None,
+        watermark: Optional[Watermark] = None,
     ) -> List[dict]:
-        """뉴스 데이터 파싱 추상 메서드"""
+        """뉴스 데이터 파싱 추상 메서드 (watermark 이전 기사는 제외)"""
         pass
     
-    async def crawl_company_news(self, company_id: int, company_name: str, max_articles: int = 100) -> CrawlResult:
-        """특정 회사의 뉴스를 크롤링 (Two-Track 전략 지원)"""
+    async def crawl_company_news(
+        self,
+        company_id: int,
+        company_name: str,
+        max_articles: int = 100,
+        watermarks: Optional[Dict[str, Watermark]] = None,
+        checkpoint: Optional[dict] = None,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+    ) -> CrawlResult:
+        """
+        특정 회사의 뉴스를 크롤링 (Two-Track 전략 지원)
+        
+        watermarks가 주어지면 증분 크롤링: 쿼리별 기준점(가장 최근에 본 기사)에
+        도달한 페이지에서 페이지네이션을 중단하고, 기준점 이전 기사는 파싱하지 않는다.
+        
+        checkpoint/on_checkpoint: 쿼리 단위 재개 지점. 쿼리 하나를 끝낼 때마다
+        on_checkpoint(상태, 해당 쿼리 기사)를 호출하고, checkpoint에 기록된
+        완료 쿼리는 건너뛴다 (중단된 크롤링을 이어서 진행).
+        """
         start_time = datetime.now()
+        watermarks = watermarks or {}
+        state = {
+            "done_queries": list((checkpoint or {}).get("done_queries", [])),
+            "total_found": int((checkpoint or {}).get("total_found", 0)),
+            "precision_collected": int((checkpoint or {}).get("precision_collected", 0)),
+            "collected": int((checkpoint or {}).get("collected", 0)),
+        }
+        done_queries = set(state["done_queries"])
+        resumed_collected = state["collected"]
+        
+        async def finish_query(q: str, articles: List[dict]) -> None:
+            state["done_queries"].append(q)
+            state["collected"] += len(articles)
+            if on_checkpoint is not None:
+                await on_checkpoint(dict(state, done_queries=list(state["done_queries"])), articles)
         
         try:
             logger.info(f"Starting crawl for company: {company_name} (ID: {company_id})")
@@ -61,60 +104,91 @@ class BaseScraper(ABC):
                 use_two_track = False
             
             all_articles: List[dict] = []
-            total_found = 0
 
             if use_two_track:
                 logger.info(f"Using Two-Track crawling for {company_name}")
                 # 1) 정밀 트랙: 대표명/탑키워드 조합으로 충분량 확보 시 광역 생략
-                precision_collected = 0
                 for q in queries.get("precision", []):
-                    # 첫 요청으로 total 파악
-                    initial = await self.search_news(q, display=DISPLAY_PER_PAGE, start=1, sort="date")
-                    q_total = max(0, int(initial.get("total", 0)))
-                    total_found += q_total
-
-                    max_pages = max(1, (q_total + DISPLAY_PER_PAGE - 1) // DISPLAY_PER_PAGE)
+                    if state["precision_collected"] >= PRECISION_MIN_RESULTS:
+                        break
+                    if q in done_queries:
+                        continue
+                    watermark = watermarks.get(q)
+                    query_articles: List[dict] = []
+                    max_pages = 1
                     page = 1
-                    while page <= max_pages and len(all_articles) < max_articles and precision_collected < PRECISION_MIN_RESULTS:
+                    while page <= max_pages and resumed_collected + len(all_articles) < max_articles and state["precision_collected"] < PRECISION_MIN_RESULTS:
                         start = 1 + (page - 1) * DISPLAY_PER_PAGE
                         resp = await self.search_news(q, display=DISPLAY_PER_PAGE, start=start, sort="date")
-                        articles = await self.parse_articles(resp, company_id, company_name, source_track="precision", query_used=q)
+                        if page == 1:
+                            # 첫 페이지 응답으로 total 파악
+                            q_total = max(0, int(resp.get("total", 0)))
+                            state["total_found"] += q_total
+                            max_pages = max(1, (q_total + DISPLAY_PER_PAGE - 1) // DISPLAY_PER_PAGE)
+                        articles, reached = await self._parse_page(resp, company_id, company_name, "precision", q, watermark)
                         all_articles.extend(articles)
-                        precision_collected += len(articles)
+                        query_articles.extend(articles)
+                        state["precision_collected"] += len(articles)
+                        if reached:
+                            logger.info(f"Reached watermark for query {q} at page {page}")
+                            break
                         page += 1
                         if page <= max_pages:
                             await asyncio.sleep(self.delay)
+                    await finish_query(q, query_articles)
 
-                    if precision_collected >= PRECISION_MIN_RESULTS:
-                        logger.info(f"Precision track collected {precision_collected} (>= {PRECISION_MIN_RESULTS}), skipping broad track for now")
+                    if state["precision_collected"] >= PRECISION_MIN_RESULTS:
+                        logger.info(f"Precision track collected {state['precision_collected']} (>= {PRECISION_MIN_RESULTS}), skipping broad track for now")
                         break
 
                 # 2) 광역 트랙: 필요 시 최대 N페이지 보강
-                if precision_collected < PRECISION_MIN_RESULTS:
+                if state["precision_collected"] < PRECISION_MIN_RESULTS:
                     for q in queries.get("broad", []):
+                        if q in done_queries:
+                            continue
+                        watermark = watermarks.get(q)
+                        query_articles = []
                         for page in range(1, BROAD_MAX_PAGES + 1):
-                            if len(all_articles) >= max_articles:
+                            if resumed_collected + len(all_articles) >= max_articles:
                                 break
                             start = 1 + (page - 1) * DISPLAY_PER_PAGE
                             resp = await self.search_news(q, display=DISPLAY_PER_PAGE, start=start, sort="date")
-                            articles = await self.parse_articles(resp, company_id, company_name, source_track="broad", query_used=q)
+                            articles, reached = await self._parse_page(resp, company_id, company_name, "broad", q, watermark)
                             all_articles.extend(articles)
+                            query_articles.extend(articles)
+                            if reached:
+                                logger.info(f"Reached watermark for query {q} at page {page}")
+                                break
                             if page < BROAD_MAX_PAGES:
                                 await asyncio.sleep(self.delay)
+                        await finish_query(q, query_articles)
             else:
                 # 단일 쿼리 전략 (기존 로직)
                 query = await self._build_enhanced_query(company_id, company_name)
-                initial_response = await self.search_news(query, display=10, start=1, sort="date")
-                total_found = initial_response.get('total', 0)
-                logger.info(f"Found {total_found} articles for {company_name}")
-                articles_to_collect = min(total_found, max_articles)
+                if query in done_queries:
+                    articles_to_collect = 0
+                else:
+                    watermark = watermarks.get(query)
+                    initial_response = await self.search_news(query, display=10, start=1, sort="date")
+                    state["total_found"] = initial_response.get('total', 0)
+                    logger.info(f"Found {state['total_found']} articles for {company_name}")
+                    articles_to_collect = min(state["total_found"], max_articles)
                 for start in range(1, articles_to_collect + 1, 10):
                     display = min(10, articles_to_collect - start + 1)
-                    response = await self.search_news(query, display=display, start=start, sort="date")
-                    articles = await self.parse_articles(response, company_id, company_name, source_track="single", query_used=query)
+                    if start == 1:
+                        # 첫 페이지는 total 조회 응답 재사용
+                        response = dict(initial_response, items=(initial_response.get('items') or [])[:display])
+                    else:
+                        response = await self.search_news(query, display=display, start=start, sort="date")
+                    articles, reached = await self._parse_page(response, company_id, company_name, "single", query, watermark)
                     all_articles.extend(articles)
+                    if reached:
+                        logger.info(f"Reached watermark for query {query} at offset {start}")
+                        break
                     if start + 10 <= articles_to_collect:
                         await asyncio.sleep(self.delay)
+                if query not in done_queries:
+                    await finish_query(query, all_articles)
             
             # 중복 제거 (URL 정규화 + 보조 키 기준)
             unique_articles = self._dedupe_articles(all_articles)
@@ -124,13 +198,16 @@ class BaseScraper(ABC):
                 company_id=company_id,
                 company_name=company_name,
                 query="two_track" if use_two_track else (query if 'query' in locals() else company_name),
-                total_found=total_found,
+                total_found=state["total_found"],
                 articles_saved=len(unique_articles),
                 success=True,
                 crawl_duration=duration,
                 articles_data=unique_articles
             )
             
+        except CrawlJobLeaseLost:
+            # 임대를 잃은 작업은 실패가 아니므로 호출자(CrawlJobQueue.drain)가 처리하도록 전달
+            raise
         except Exception as e:
             duration = (datetime.now() - start_time).total_seconds()
             logger.error(f"Crawl failed for {company_name}: {str(e)}")
@@ -147,56 +224,85 @@ class BaseScraper(ABC):
                 articles_data=[]
             )
     
-    async def _build_enhanced_query(self, company_id: int, company_name: str) -> str:
-        """DB에서 가져온 키워드를 기반으로 정확도 최적화된 검색 쿼리 생성"""
+    async def _parse_page(
+        self,
+        response: dict,
+        company_id: int,
+        company_name: str,
+        source_track: str,
+        query: str,
+        watermark: Optional[Watermark],
+    ) -> Tuple[List[dict], bool]:
+        """
+        검색 결과 한 페이지 파싱
+        
+        Returns:
+            (기사 목록, 워터마크 도달 여부)
+            날짜순 정렬이므로 기준점에 도달하면 이후 페이지는 모두 이미 본 기사다.
+        """
+        articles = await self.parse_articles(
+            response, company_id, company_name,
+            source_track=source_track, query_used=query, watermark=watermark,
+        )
+        reached = watermark is not None and len(articles) < len(response.get("items") or [])
+        return articles, reached
+    
+    async def _get_known_urls(self, urls: List[str]) -> Set[str]:
+        """이미 저장된 기사 URL 조회 (OG 이미지 재수집 방지용)"""
+        urls = [u for u in urls if u]
+        if not urls:
+            return set()
         try:
-            from src.core.database import AsyncSessionLocal
-            from src.companies.models import Company
-            from sqlalchemy import select
-            
             async with AsyncSessionLocal() as session:
-                # DB에서 회사의 검색 키워드 조회
                 result = await session.execute(
-                    select(Company.positive_keywords, Company.search_strategy)
-                    .where(Company.id == company_id)
+                    select(Article.article_url).where(Article.article_url.in_(urls))
                 )
-                row = result.first()
+                return set(result.scalars().all())
+        except Exception as e:
+            logger.warning(f"Failed to look up known article URLs: {e}")
+            return set()
+    
+    async def _build_enhanced_query(self, company_id: int, company_name: str) -> str:
+        """DB에서 가져온 키워드를 기반으로 정확도 최적화된 검색 쿼리 생성"""
+        try:
+            # 캐시된 회사 프로필에서 검색 키워드 조회
+            profile = await company_profile_cache.get(company_id)
+            
+            if profile and profile.positive_keywords:
+                positive_keywords = profile.positive_keywords
+                search_strategy = profile.search_strategy or 'enhanced'
                 
-                if row and row.positive_keywords:
-                    positive_keywords = row.positive_keywords
-                    search_strategy = row.search_strategy or 'enhanced'
+                if search_strategy == 'enhanced' and len(positive_keywords) > 0:
+                    # 🎯 핵심 전략: 반드시 포함할 키워드들을 따옴표로 감싸기
+                    main_keywords = [f'"{kw}"' for kw in [company_name] + positive_keywords[:2]]
+                    
+                    # 가장 정확한 키워드를 메인으로 사용 (보통 회사명이 가장 정확)
+                    primary_keyword = f'"{company_name}"'
                     
-                    if search_strategy == 'enhanced' and len(positive_keywords) > 0:
-                        # 🎯 핵심 전략: 반드시 포함할 키워드들을 따옴표로 감싸기
-                        main_keywords = [f'"{kw}"' for kw in [company_name] + positive_keywords[:2]]
-                        
-                        # 가장 정확한 키워드를 메인으로 사용 (보통 회사명이 가장 정확)
-                        primary_keyword = f'"{company_name}"'
-                        
-                        # 추가 키워드가 있으면 OR 조건으로 결합하되, 네이버 API 한계로 공백 사용
-                        if len(positive_keywords) > 0:
-                            # 첫 번째 positive_keyword를 추가 (정확도 향상)
-                            secondary_keyword = f'"{positive_keywords[0]}"'
-                            query = f"{primary_keyword} {secondary_keyword}"
-                        else:
-                            query = primary_keyword
-                        
-                        logger.info(f"Using precision-optimized query for {company_name}: {query}")
-                        return query
+                    # 추가 키워드가 있으면 OR 조건으로 결합하되, 네이버 API 한계로 공백 사용
+                    if len(positive_keywords) > 0:
+                        # 첫 번째 positive_keyword를 추가 (정확도 향상)
+                        secondary_keyword = f'"{positive_keywords[0]}"'
+                        query = f"{primary_keyword} {secondary_keyword}"
                     else:
-                        # 단일 키워드 전략 - 가장 정확한 매칭
-                        if positive_keywords:
-                            query = f'"{positive_keywords[0]}"'
-                        else:
-                            query = f'"{company_name}"'
-                        logger.info(f"Using exact match query for {company_name}: {query}")
-                        return query
+                        query = primary_keyword
+                    
+                    logger.info(f"Using precision-optimized query for {company_name}: {query}")
+                    return query
                 else:
-                    # DB에 키워드가 없으면 회사명 정확 매칭
-                    query = f'"{company_name}"'
-                    logger.info(f"Using fallback exact match query for {company_name}: {query}")
+                    # 단일 키워드 전략 - 가장 정확한 매칭
+                    if positive_keywords:
+                        query = f'"{positive_keywords[0]}"'
+                    else:
+                        query = f'"{company_name}"'
+                    logger.info(f"Using exact match query for {company_name}: {query}")
                     return query
-                    
+            else:
+                # DB에 키워드가 없으면 회사명 정확 매칭
+                query = f'"{company_name}"'
+                logger.info(f"Using fallback exact match query for {company_name}: {query}")
+                return query
+                
         except Exception as e:
             logger.error(f"Failed to build query from DB for {company_name}: {e}")
             # 에러 시 가장 안전한 정확 매칭 사용
@@ -206,30 +312,18 @@ class BaseScraper(ABC):
 
     async def _build_two_track_queries(self, company_id: int, company_name: str) -> Dict[str, List[str]]:
         """DB 메타(ceo_name, positive_keywords, search_strategy)로 Two-Track 쿼리 구성"""
-        from src.core.database import AsyncSessionLocal
-        from src.companies.models import Company
-        from sqlalchemy import select
-
         precision: List[str] = []
         broad: List[str] = []
 
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(
-                    Company.ceo_name,
-                    Company.positive_keywords,
-                    Company.search_strategy,
-                ).where(Company.id == company_id)
-            )
-            row = result.first()
+        profile = await company_profile_cache.get(company_id)
 
         ceo_name = None
         positive_keywords: List[str] = []
         search_strategy = DEFAULT_SEARCH_STRATEGY
-        if row:
-            ceo_name = row.ceo_name
-            positive_keywords = row.positive_keywords or []
-            search_strategy = (row.search_strategy or DEFAULT_SEARCH_STRATEGY).lower()
+        if profile:
+            ceo_name = profile.ceo_name
+            positive_keywords = profile.positive_keywords
+            search_strategy = (profile.search_strategy or DEFAULT_SEARCH_STRATEGY).lower()
 
         # 전략에 따라 구성
         if search_strategy in ("two_track", "precision_first", "enhanced"):
@@ -275,51 +369,20 @@ class BaseScraper(ABC):
         }
         return queries
     
-    def _has_exact_word_match(self, text: str, keyword: str) -> bool:
-        """정확한 단어 경계 매칭 (한글 조사 처리 개선)"""
-        import re
-        if not text or not keyword:
-            return False
-            
-        keyword = keyword.strip()
-        
-        # 영문/숫자로만 구성된 경우 -> 기존 word boundary 사용
-        if re.match(r'^[a-zA-Z0-9\s]+$', keyword):
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            return bool(re.search(pattern, text, re.IGNORECASE))
-            
-        # 한글이 포함된 경우 -> 왼쪽 경계만 체크하고 오른쪽은 조사 등을 허용
-        pattern = r'(?:^|[^가-힣a-zA-Z0-9])' + re.escape(keyword)
-        return bool(re.search(pattern, text, re.IGNORECASE))
-
     async def _is_relevant_article(self, title: str, content: str, company_id: int, company_name: str) -> bool:
         """개선된 기사 관련성 검증 - 정확한 네거티브 필터링"""
         try:
-            from src.core.database import AsyncSessionLocal
-            from src.companies.models import Company
-            from sqlalchemy import select
+            # 캐시된 회사 프로필의 네거티브 키워드 조회
+            profile = await company_profile_cache.get(company_id)
             
-            async with AsyncSessionLocal() as session:
-                # DB에서 회사의 네거티브 키워드 조회
-                result = await session.execute(
-                    select(Company.negative_keywords)
-                    .where(Company.id == company_id)
-                )
-                row = result.first()
-                
-                if row and row.negative_keywords:
-                    negative_keywords = row.negative_keywords
-                    
-                    # 전체 텍스트 합성
-                    full_text = f"{title} {content}"
-                    
-                    # 정확한 네거티브 키워드 매칭
-                    for neg_keyword in negative_keywords:
-                        if self._has_exact_word_match(full_text, neg_keyword):
-                            logger.debug(f"Article filtered out for {company_name} due to exact negative keyword match: {neg_keyword}")
-                            return False
-                
-                return True
+            if profile and profile.negative_keywords:
+                # 정확한 네거티브 키워드 매칭 (제목 + 본문 단일 패스)
+                neg_keyword = profile.matcher.scan(title, content).negative_keyword
+                if neg_keyword:
+                    logger.debug(f"Article filtered out for {company_name} due to exact negative keyword match: {neg_keyword}")
+                    return False
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to check relevance from DB for {company_name}: {e}")
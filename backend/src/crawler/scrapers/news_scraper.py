@@ -8,7 +8,9 @@ from loguru import logger
 # BaseScraper가 같은 폴더에 있다고 가정, 경로는 프로젝트 구조에 맞게
 from .base_scraper import BaseScraper
 from ..schemas import NaverNewsResponse
+from ..utils import Watermark, is_seen_by_watermark
 from ...core.config import settings
+from ...companies.service import company_profile_cache
 
 # 타입 힌팅용 (필요시)
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -29,6 +31,7 @@ class NaverNewsScraper(BaseScraper):
             "User-Agent": "ESG-SaaS-Monitor/1.0"
         }
         params = { "query": query, "display": display, "start": start, "sort": sort }
+        self.request_count += 1
         
         async with httpx.AsyncClient(timeout=30.0) as client:
             try:
@@ -77,50 +80,52 @@ class NaverNewsScraper(BaseScraper):
             # 이미지 추출 실패는 조용히 넘어감
             return None
 
-    async def parse_articles(self, response_data: dict, company_id: int, company_name: str = None, source_track: str = None, query_used: str = None) -> List[dict]:
+    async def parse_articles(self, response_data: dict, company_id: int, company_name: str = None, source_track: str = None, query_used: str = None, watermark: Optional[Watermark] = None) -> List[dict]:
         """네이버 API 응답을 Article 모델 형식으로 변환 + 이미지 추출 병렬 처리"""
         try:
             naver_response = NaverNewsResponse(**response_data)
             parsed_items = []
 
-            # 비동기 HTTP 클라이언트 생성 (이미지 추출용)
-            async with httpx.AsyncClient() as client:
-                tasks = []
-                
-                for item in naver_response.items:
-                    title = self._clean_html_tags(item.title)
-                    summary = self._clean_html_tags(item.description)
-                    article_url = item.originallink or item.link
-                    
-                    # 기본 기사 데이터 구성
-                    article_data = {
-                        "company_id": company_id,
-                        "title": title,
-                        "source_name": self._extract_source_name(item.link),
-                        "article_url": article_url,
-                        "published_at": self._parse_date(item.pubDate),
-                        "summary": summary,
-                        "language": "ko",
-                        "is_verified": False,
-                        "_source_track": source_track,
-                        "_query_used": query_used,
-                        "image_url": None  # 초기값
-                    }
-                    
-                    parsed_items.append(article_data)
-                    
-                    # 이미지 추출 작업 예약
-                    tasks.append(self._fetch_og_image(client, article_url))
-                
-                # 병렬 실행: 모든 기사의 이미지를 동시에 긁어옴
-                if tasks:
-                    logger.info(f"Fetching images for {len(tasks)} articles...")
-                    image_urls = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # 결과 매핑
-                    for idx, result in enumerate(image_urls):
-                        if isinstance(result, str): # 성공한 URL만 저장
-                            parsed_items[idx]['image_url'] = result
+            for item in naver_response.items:
+                article_url = item.originallink or item.link
+                published_at = self._parse_date(item.pubDate)
+
+                # ✅ [Incremental] 워터마크 이전 기사는 파싱/이미지 추출 생략
+                if is_seen_by_watermark(published_at, article_url, watermark):
+                    continue
+
+                # 기본 기사 데이터 구성
+                parsed_items.append({
+                    "company_id": company_id,
+                    "title": self._clean_html_tags(item.title),
+                    "source_name": self._extract_source_name(item.link),
+                    "article_url": article_url,
+                    "published_at": published_at,
+                    "summary": self._clean_html_tags(item.description),
+                    "language": "ko",
+                    "is_verified": False,
+                    "_source_track": source_track,
+                    "_query_used": query_used,
+                    "image_url": None  # 초기값
+                })
+
+            # ✅ [Incremental] 이미 저장된 기사는 어차피 저장 단계에서 제외되므로 이미지 추출 대상에서 뺀다
+            known_urls = await self._get_known_urls([a["article_url"] for a in parsed_items])
+            targets = [a for a in parsed_items if a["article_url"] not in known_urls]
+
+            # 병렬 실행: 신규 기사의 이미지를 동시에 긁어옴
+            if targets:
+                async with httpx.AsyncClient() as client:
+                    logger.info(f"Fetching images for {len(targets)} articles...")
+                    image_urls = await asyncio.gather(
+                        *(self._fetch_og_image(client, a["article_url"]) for a in targets),
+                        return_exceptions=True,
+                    )
+
+                # 결과 매핑
+                for article, result in zip(targets, image_urls):
+                    if isinstance(result, str): # 성공한 URL만 저장
+                        article['image_url'] = result
             
             logger.info(f"Parsed {len(parsed_items)} articles for {company_name}")
             return parsed_items
@@ -129,28 +134,17 @@ class NaverNewsScraper(BaseScraper):
             logger.error(f"Failed to parse articles: {str(e)}")
             return []
 
-    # ✅ [수정] 인자에서 session 제거 (내부에서 생성해서 사용)
     async def _get_company_metadata(self, company_id: int) -> dict:
-        """DB에서 회사 메타데이터 조회"""
+        """회사 메타데이터 조회 (회사 프로필 캐시 사용)"""
         try:
-            # 순환 참조 방지를 위해 함수 내부 import
-            from src.core.database import AsyncSessionLocal
-            from src.companies.models import Company
-            from sqlalchemy import select
+            profile = await company_profile_cache.get(company_id)
             
-            async with AsyncSessionLocal() as session:
-                result = await session.execute(
-                    select(Company.positive_keywords, Company.negative_keywords)
-                    .where(Company.id == company_id)
-                )
-                row = result.first()
-                
-                if row:
-                    return {
-                        'positive_keywords': row.positive_keywords or [],
-                        'negative_keywords': row.negative_keywords or []
-                    }
-                return {}
+            if profile:
+                return {
+                    'positive_keywords': list(profile.positive_keywords),
+                    'negative_keywords': list(profile.negative_keywords)
+                }
+            return {}
                 
         except Exception as e:
             logger.error(f"Failed to get company metadata for ID {company_id}: {e}")
@@ -3,7 +3,7 @@
 APScheduler를 사용한 백그라운드 작업 관리
 """
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -11,6 +11,13 @@ from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 
 from ..service import CrawlerService
+from ..constants import ADAPTIVE_SCHEDULING_ENABLED, ADAPTIVE_TICK_MINUTES, CRAWL_JOB_WORKER_INTERVAL_MINUTES
+from .adaptive_scheduler import AdaptiveCrawlPlanner
+from ..tasks.crawling_tasks import CrawlJobQueue
+from ..story_cluster import story_clusterer
+from ...articles.service import ArticleService
+from ...documents.block_store import block_store
+from ...documents.version_retention import version_retention
 
 
 class CrawlingScheduler:
@@ -19,6 +26,9 @@ class CrawlingScheduler:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self.crawler_service = CrawlerService()
+        self.planner = AdaptiveCrawlPlanner(self.crawler_service)
+        self.job_queue = CrawlJobQueue(self.crawler_service)
+        self.article_service = ArticleService()
         self.is_running = False
     
     async def start(self):
@@ -70,17 +80,51 @@ class CrawlingScheduler:
         )
         logger.info("일일 전체 크롤링 작업 등록 완료 (매일 00:30)")
         
-        # 2. 6시간마다 증분 크롤링
+        # 1-1. 작업 큐 워커: 재시도 대기/중단된(임대 만료) 작업을 이어서 처리
         self.scheduler.add_job(
-            func=self._incremental_crawl,
-            trigger=IntervalTrigger(hours=6),
-            id="incremental_crawl",
-            name="6시간마다 증분 크롤링",
+            func=self._drain_job_queue,
+            trigger=IntervalTrigger(minutes=CRAWL_JOB_WORKER_INTERVAL_MINUTES),
+            id="crawl_job_worker",
+            name="크롤링 작업 큐 워커",
             max_instances=1,
             coalesce=True,
-            misfire_grace_time=1800  # 30분 이내 실행 허용
+            next_run_time=datetime.now()  # 시작 직후 한 번 실행 (재배포 전 미완료 작업 재개)
         )
-        logger.info("증분 크롤링 작업 등록 완료 (6시간마다)")
+        logger.info(f"크롤링 작업 큐 워커 등록 완료 ({CRAWL_JOB_WORKER_INTERVAL_MINUTES}분마다)")
+        
+        # 2. 증분 크롤링
+        if ADAPTIVE_SCHEDULING_ENABLED:
+            # ✅ [Adaptive] 회사별 뉴스 발생 속도에 따라 만기된 회사만 디스패치
+            self.scheduler.add_job(
+                func=self._adaptive_crawl_tick,
+                trigger=IntervalTrigger(minutes=ADAPTIVE_TICK_MINUTES),
+                id="adaptive_crawl",
+                name="적응형 증분 크롤링",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=600
+            )
+            # 발생률 재추정 (1시간마다)
+            self.scheduler.add_job(
+                func=self.planner.refresh,
+                trigger=IntervalTrigger(hours=1),
+                id="adaptive_crawl_refresh",
+                name="적응형 스케줄 발생률 갱신",
+                max_instances=1,
+                coalesce=True
+            )
+            logger.info(f"적응형 증분 크롤링 작업 등록 완료 ({ADAPTIVE_TICK_MINUTES}분마다 디스패치)")
+        else:
+            self.scheduler.add_job(
+                func=self._incremental_crawl,
+                trigger=IntervalTrigger(hours=6),
+                id="incremental_crawl",
+                name="6시간마다 증분 크롤링",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=1800  # 30분 이내 실행 허용
+            )
+            logger.info("증분 크롤링 작업 등록 완료 (6시간마다)")
         
         # 3. 주간 통계 업데이트 (매주 일요일 오전 2시)
         self.scheduler.add_job(
@@ -92,40 +136,100 @@ class CrawlingScheduler:
             coalesce=True
         )
         logger.info("주간 통계 업데이트 작업 등록 완료 (매주 일요일 02:00)")
+        
+        # 4. 회사 언급 판정 백필 (미분류 기사 + 키워드 변경된 회사의 기사 재분류)
+        self.scheduler.add_job(
+            func=self._backfill_company_mentions,
+            trigger=IntervalTrigger(hours=1),
+            id="company_mention_backfill",
+            name="회사 언급 판정 백필",
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now()  # 시작 직후 한 번 실행
+        )
+        logger.info("회사 언급 판정 백필 작업 등록 완료 (1시간마다)")
+        
+        # 5. 일별 언급량 집계 보정 (매일 새벽 3시, 최근 7일 재계산)
+        self.scheduler.add_job(
+            func=self._reconcile_mention_rollups,
+            trigger=CronTrigger(hour=3, minute=0),
+            id="mention_rollup_reconcile",
+            name="일별 언급량 집계 보정",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=3600
+        )
+        # 집계 테이블이 비어 있으면 시작 직후 전체 백필
+        self.scheduler.add_job(
+            func=self._backfill_mention_rollups_if_empty,
+            trigger='date',
+            run_date=datetime.now(),
+            id="mention_rollup_initial_backfill",
+            name="일별 언급량 집계 초기 백필",
+            max_instances=1
+        )
+        logger.info("일별 언급량 집계 보정 작업 등록 완료 (매일 03:00)")
+        
+        # 6. 유사 기사(스토리) 클러스터 백필 (클러스터 미지정 기존 기사)
+        self.scheduler.add_job(
+            func=self._backfill_story_clusters,
+            trigger=IntervalTrigger(hours=1),
+            id="story_cluster_backfill",
+            name="유사 기사 클러스터 백필",
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now()  # 시작 직후 한 번 실행
+        )
+        logger.info("유사 기사 클러스터 백필 작업 등록 완료 (1시간마다)")
+        
+        # 7. 문서 블록 저장소 GC (어떤 버전도 참조하지 않는 블록 삭제)
+        self.scheduler.add_job(
+            func=self._collect_document_blocks,
+            trigger=CronTrigger(hour=4, minute=0),
+            id="document_block_gc",
+            name="문서 블록 저장소 GC",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=3600
+        )
+        logger.info("문서 블록 저장소 GC 작업 등록 완료 (매일 04:00)")
+        
+        # 8. 자동 저장 버전 정리 (보존 정책, 삭제된 버전의 블록은 다음 GC 에서 회수)
+        self.scheduler.add_job(
+            func=self._thin_document_versions,
+            trigger=CronTrigger(hour=3, minute=30),
+            id="document_version_thinning",
+            name="자동 저장 버전 정리",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=3600
+        )
+        logger.info("자동 저장 버전 정리 작업 등록 완료 (매일 03:30)")
     
-    async def _daily_full_crawl(self):
-        """일일 전체 크롤링 작업"""
+    async def _daily_full_crawl(self, run_id: Optional[str] = None):
+        """일일 전체 크롤링 작업 (영속 작업 큐 경유)"""
         logger.info("일일 전체 크롤링 시작")
         
         try:
-            # 모든 활성 회사에 대해 크롤링 수행
-            results = await self.crawler_service.crawl_all_companies(
-                max_articles_per_company=100  # 일일 크롤링은 더 많은 기사 수집
-            )
-            
-            # 결과 로깅
-            total_articles = sum(r.articles_saved for r in results if r.success)
-            success_count = sum(1 for r in results if r.success)
-            
-            logger.info(f"일일 전체 크롤링 완료: {success_count}/{len(results)} 회사, {total_articles}개 기사 수집")
+            # ✅ [Durable] 회사별 작업을 DB 큐에 적재 후 처리
+            # 재시작되어도 같은 run_id 의 완료 작업은 건너뛰고, 실패 작업은 백오프 재시도된다.
+            run_id = run_id or f"daily_{datetime.now().strftime('%Y%m%d')}"
+            await self.job_queue.enqueue_run(run_id, kind="full", max_articles=100)  # 일일 크롤링은 더 많은 기사 수집
+            await self.job_queue.drain()
             
-            # 실패한 회사들에 대한 재시도 (1시간 후)
-            failed_companies = [r for r in results if not r.success]
-            if failed_companies:
-                logger.warning(f"{len(failed_companies)}개 회사 크롤링 실패, 1시간 후 재시도 예약")
-                self.scheduler.add_job(
-                    func=self._retry_failed_crawls,
-                    trigger='date',
-                    run_date=datetime.now() + timedelta(hours=1),
-                    args=[failed_companies],
-                    id=f"retry_failed_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                    name="실패 크롤링 재시도",
-                    max_instances=1
-                )
+            summary = await self.job_queue.get_run_summary(run_id)
+            logger.info(f"일일 전체 크롤링 완료: {summary['status_counts']}, {summary['articles_saved']}개 기사 수집")
             
         except Exception as e:
             logger.error(f"일일 전체 크롤링 실패: {str(e)}")
     
+    async def _drain_job_queue(self):
+        """작업 큐 워커 (재시도/재개 대상 처리)"""
+        try:
+            await self.job_queue.drain()
+        except Exception as e:
+            logger.error(f"크롤링 작업 큐 처리 실패: {str(e)}")
+    
     async def _incremental_crawl(self):
         """증분 크롤링 작업 (최신 기사만)"""
         logger.info("증분 크롤링 시작")
@@ -133,7 +237,8 @@ class CrawlingScheduler:
         try:
             # 모든 활성 회사에 대해 적은 수의 최신 기사만 수집
             results = await self.crawler_service.crawl_all_companies(
-                max_articles_per_company=20  # 증분 크롤링은 적은 수의 기사만
+                max_articles_per_company=20,  # 증분 크롤링은 적은 수의 기사만
+                incremental=True  # 쿼리별 워터마크 이후 기사만 수집
             )
             
             # 결과 로깅
@@ -145,6 +250,73 @@ class CrawlingScheduler:
         except Exception as e:
             logger.error(f"증분 크롤링 실패: {str(e)}")
     
+    async def _adaptive_crawl_tick(self):
+        """적응형 증분 크롤링 디스패치 (만기된 회사만, API 예산 내)"""
+        try:
+            results = await self.planner.dispatch_due()
+            if results:
+                total_articles = sum(r.articles_saved for r in results if r.success)
+                logger.info(f"적응형 크롤링: {len(results)}개 회사, {total_articles}개 기사 수집")
+        except Exception as e:
+            logger.error(f"적응형 크롤링 실패: {str(e)}")
+    
+    async def _backfill_company_mentions(self):
+        """회사 언급 판정 백필 작업"""
+        try:
+            updated = await self.article_service.backfill_company_mentions()
+            if updated:
+                logger.info(f"회사 언급 판정 백필 완료: {updated}개 기사 재분류")
+        except Exception as e:
+            logger.error(f"회사 언급 판정 백필 실패: {str(e)}")
+    
+    async def _reconcile_mention_rollups(self):
+        """일별 언급량 집계 보정 작업 (최근 7일)"""
+        try:
+            changed = await self.article_service.reconcile_mention_rollups(days=7)
+            logger.info(f"일별 언급량 집계 보정 완료: {changed}개 행 변경")
+        except Exception as e:
+            logger.error(f"일별 언급량 집계 보정 실패: {str(e)}")
+    
+    async def _backfill_story_clusters(self):
+        """유사 기사 클러스터 백필 작업 (편입된 기사가 있으면 해당 기간 스토리 수 재집계)"""
+        try:
+            processed, earliest = await story_clusterer.backfill()
+            if processed:
+                logger.info(f"유사 기사 클러스터 백필 완료: {processed}개 기사 처리")
+            if earliest is not None:
+                days = (datetime.utcnow().date() - earliest).days + 1
+                await self.article_service.reconcile_mention_rollups(days=days)
+        except Exception as e:
+            logger.error(f"유사 기사 클러스터 백필 실패: {str(e)}")
+    
+    async def _collect_document_blocks(self):
+        """문서 블록 저장소 GC 작업"""
+        try:
+            deleted, deleted_bytes = await block_store.collect_garbage()
+            logger.info(f"문서 블록 저장소 GC 완료: {deleted}개 블록 ({deleted_bytes:,} bytes) 삭제")
+        except Exception as e:
+            logger.error(f"문서 블록 저장소 GC 실패: {str(e)}")
+    
+    async def _thin_document_versions(self):
+        """자동 저장 버전 정리 작업"""
+        try:
+            result = await version_retention.thin()
+            logger.info(
+                f"자동 저장 버전 정리 완료: {result['documents']}개 문서, "
+                f"{result['versions']}개 버전 삭제 ({result['bytes']:,} bytes 회수)"
+            )
+        except Exception as e:
+            logger.error(f"자동 저장 버전 정리 실패: {str(e)}")
+    
+    async def _backfill_mention_rollups_if_empty(self):
+        """일별 언급량 집계 초기 백필 (테이블이 비어 있을 때만)"""
+        try:
+            if not await self.article_service.has_mention_rollups():
+                changed = await self.article_service.reconcile_mention_rollups(days=None)
+                logger.info(f"일별 언급량 집계 초기 백필 완료: {changed}개 행")
+        except Exception as e:
+            logger.error(f"일별 언급량 집계 초기 백필 실패: {str(e)}")
+    
     async def _weekly_stats_update(self):
         """주간 통계 업데이트 작업"""
         logger.info("주간 통계 업데이트 시작")
@@ -156,38 +328,13 @@ class CrawlingScheduler:
             logger.info(f"주간 통계: 총 {stats['total_articles']}개 기사, {stats['companies_count']}개 회사")
             logger.info(f"회사별 통계: {stats['company_statistics']}")
             
-            # TODO: 향후 일일 집계 테이블 업데이트 로직 추가
-            # await self._update_daily_aggregations()
+            # 일별 집계 테이블 전체 재계산 (야간 보정 범위 밖의 과거 변경까지 반영)
+            changed = await self.article_service.reconcile_mention_rollups(days=None)
+            logger.info(f"일별 언급량 집계 전체 재계산 완료: {changed}개 행 변경")
             
         except Exception as e:
             logger.error(f"주간 통계 업데이트 실패: {str(e)}")
     
-    async def _retry_failed_crawls(self, failed_results):
-        """실패한 크롤링 재시도"""
-        logger.info(f"{len(failed_results)}개 회사 크롤링 재시도 시작")
-        
-        retry_count = 0
-        for failed_result in failed_results:
-            try:
-                # 개별 회사 크롤링 재시도
-                company_id = failed_result.company_id
-                if company_id:
-                    result = await self.crawler_service.crawl_single_company(
-                        company_id=company_id,
-                        max_articles=50
-                    )
-                    
-                    if result.success:
-                        retry_count += 1
-                        logger.info(f"재시도 성공: 회사 ID {company_id}, {result.articles_saved}개 기사 수집")
-                    else:
-                        logger.warning(f"재시도 실패: 회사 ID {company_id}")
-                        
-            except Exception as e:
-                logger.error(f"재시도 중 오류 발생: {str(e)}")
-        
-        logger.info(f"크롤링 재시도 완료: {retry_count}개 회사 성공")
-    
     def add_custom_job(self, func, trigger, job_id: str, name: str, **kwargs):
         """사용자 정의 작업 추가"""
         try:
@@ -228,10 +375,14 @@ class CrawlingScheduler:
             })
         return jobs
     
+    def get_adaptive_schedule(self):
+        """적응형 스케줄 현황 조회"""
+        return self.planner.get_schedule()
+    
     async def manual_crawl_all(self):
         """수동 전체 크롤링 실행"""
         logger.info("수동 전체 크롤링 시작")
-        await self._daily_full_crawl()
+        await self._daily_full_crawl(run_id=f"manual_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
     
     async def manual_crawl_company(self, company_id: int):
         """수동 개별 회사 크롤링 실행"""
@@ -1,15 +1,21 @@
-from typing import List, Dict
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from loguru import logger
-import re
 
 from .scrapers.news_scraper import NaverNewsScraper
 from .schemas import CrawlResult, ArticleCreateRequest
 from ..companies.models import Company
 from ..articles.models import Article
+from ..articles.service import increment_mention_rollups
 from ..core.database import AsyncSessionLocal
 from .constants import PRECISION_SCORE_BOOST
+from .models import CrawlWatermark
+from .utils import KeywordHits, Watermark, localize_scraped, to_naive_utc
+from ..companies.service import company_profile_cache
+from ..shared.cache import response_cache
+from .story_cluster import story_clusterer
 
 
 class CrawlerService:
@@ -20,23 +26,34 @@ class CrawlerService:
     
     async def get_active_companies(self) -> List[Dict]:
         """활성화된 회사 목록 조회"""
+        profiles = await company_profile_cache.list_active()
+        
+        return [
+            {
+                "id": profile.id,
+                "company_name": profile.company_name,
+                "company_name_en": profile.company_name_en
+            }
+            for profile in profiles
+        ]
+    
+    async def get_watermarks(self, company_id: int) -> Dict[str, Watermark]:
+        """회사의 쿼리별 증분 크롤링 기준점 조회"""
         async with AsyncSessionLocal() as session:
             result = await session.execute(
-                select(Company).where(Company.is_active == True)
+                select(CrawlWatermark).where(CrawlWatermark.company_id == company_id)
             )
-            companies = result.scalars().all()
-            
-            return [
-                {
-                    "id": company.id,
-                    "company_name": company.company_name,
-                    "company_name_en": company.company_name_en
-                }
-                for company in companies
-            ]
+            return {
+                mark.query: (mark.last_published_at, mark.last_article_url)
+                for mark in result.scalars().all()
+            }
     
-    async def crawl_all_companies(self, max_articles_per_company: int = 50) -> List[CrawlResult]:
-        """모든 활성화된 회사의 뉴스 크롤링"""
+    async def crawl_all_companies(self, max_articles_per_company: int = 50, incremental: bool = False) -> List[CrawlResult]:
+        """
+        모든 활성화된 회사의 뉴스 크롤링
+        
+        incremental=True 이면 쿼리별 워터마크 이후의 기사만 수집한다.
+        """
         logger.info("Starting news crawling for all active companies")
         
         # 활성화된 회사 목록 조회
@@ -51,10 +68,12 @@ class CrawlerService:
         crawl_results = []
         for company in companies:
             try:
+                watermarks = await self.get_watermarks(company['id']) if incremental else None
                 result = await self.scraper.crawl_company_news(
                     company_id=company['id'],
                     company_name=company['company_name'],
-                    max_articles=max_articles_per_company
+                    max_articles=max_articles_per_company,
+                    watermarks=watermarks
                 )
                 
                 # 크롤링된 기사들을 데이터베이스에 저장
@@ -78,28 +97,26 @@ class CrawlerService:
         
         return crawl_results
     
-    async def crawl_single_company(self, company_id: int, max_articles: int = 50) -> CrawlResult:
-        """특정 회사의 뉴스 크롤링"""
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(
-                select(Company).where(Company.id == company_id, Company.is_active == True)
-            )
-            company = result.scalar_one_or_none()
-            
-            if not company:
-                raise ValueError(f"Active company not found with ID: {company_id}")
-            
-            crawl_result = await self.scraper.crawl_company_news(
-                company_id=company.id,
-                company_name=company.company_name,
-                max_articles=max_articles
-            )
-            
-            if crawl_result.success and crawl_result.articles_data:
-                saved_count = await self.save_articles(crawl_result.articles_data)
-                crawl_result.articles_saved = saved_count
-            
-            return crawl_result
+    async def crawl_single_company(self, company_id: int, max_articles: int = 50, incremental: bool = False) -> CrawlResult:
+        """특정 회사의 뉴스 크롤링 (incremental=True 이면 워터마크 이후 기사만)"""
+        company = await company_profile_cache.get_active(company_id)
+        
+        if not company:
+            raise ValueError(f"Active company not found with ID: {company_id}")
+        
+        watermarks = await self.get_watermarks(company.id) if incremental else None
+        crawl_result = await self.scraper.crawl_company_news(
+            company_id=company.id,
+            company_name=company.company_name,
+            max_articles=max_articles,
+            watermarks=watermarks
+        )
+        
+        if crawl_result.success and crawl_result.articles_data:
+            saved_count = await self.save_articles(crawl_result.articles_data)
+            crawl_result.articles_saved = saved_count
+        
+        return crawl_result
     
     async def save_articles(self, articles_data: List[Dict]) -> int:
         """기사 데이터를 데이터베이스에 저장 (3단계 Quality Gate 적용)"""
@@ -110,6 +127,9 @@ class CrawlerService:
         async with AsyncSessionLocal() as session:
             saved_count = 0
             quality_filtered_count = 0
+            rollup_counts: Counter = Counter()  # (company_id, 날짜) → 신규 기사 수
+            story_rollup_counts: Counter = Counter()  # (company_id, 날짜) → 신규 스토리 수
+            stories = []  # (기사, 매칭된 스토리 항목, 인덱스 항목) - flush 후 클러스터 ID 지정
             
             for article_data in articles_data:
                 try:
@@ -123,8 +143,10 @@ class CrawlerService:
                         continue
                     
                     # 🛡️ 3단계 방어: Quality Gate - 관련도 점수 계산
-                    # ✅ [Refactor] 세션 객체 전달 (DB 연결 오버헤드 제거)
-                    relevance_score = await self._calculate_relevance_score(session, article_data)
+                    # ✅ [Refactor] 회사 메타데이터는 프로필 캐시에서 조회 (DB 왕복 없음)
+                    profile = await company_profile_cache.get(article_data.get('company_id'))
+                    hits = profile.matcher.scan(article_data.get('title', ''), article_data.get('summary', '')) if profile else None
+                    relevance_score = self._calculate_relevance_score(article_data, hits)
                     
                     min_quality_score = 0.6
                     if relevance_score < min_quality_score:
@@ -142,135 +164,133 @@ class CrawlerService:
                         title=sanitized.get('title'),
                         source_name=sanitized.get('source_name'),
                         article_url=sanitized.get('article_url'),
-                        published_at=sanitized.get('published_at'),
+                        # KST 벽시계(naive)는 시간대를 붙여 저장 → 저장값과 일별 집계 날짜가 같은 시각 기준
+                        published_at=localize_scraped(sanitized.get('published_at')),
                         content=sanitized.get('content'),
                         summary=sanitized.get('summary'),
                         image_url=sanitized.get('image_url'),  # 이미지 URL 저장
+                        # ✅ [Ingest] 회사 언급 판정을 수집 시점에 한 번만 계산해 저장
+                        is_company_mention=hits.is_company_mention if profile.matcher.company_name else True,
+                        mention_rule_hash=profile.matcher.rule_hash,
                         # 필요한 경우 추가 필드 매핑
                     )
                     
+                    # ✅ [Dedup] 전재 기사 묶기: 최근 구간 SimHash 인덱스에서 같은 스토리 탐색
+                    matched, entry = await story_clusterer.assign(article)
+                    stories.append((article, matched, entry))
+                    
                     session.add(article)
                     saved_count += 1
+                    if article.published_at is not None:
+                        # 읽기 쪽 ARTICLE_DAY(date(timezone('UTC', published_at)))와 같은 UTC 날짜
+                        day_key = (article.company_id, to_naive_utc(article.published_at).date())
+                        rollup_counts[day_key] += 1
+                        if matched is None:
+                            story_rollup_counts[day_key] += 1
                     
                 except Exception as e:
                     logger.error(f"Failed to save article: {str(e)}")
                     continue
             
+            # ✅ [Incremental] 기사 저장과 같은 트랜잭션에서 워터마크 전진
+            await self._advance_watermarks(session, articles_data)
+            
+            # ✅ [Rollup] 일별 언급량 집계도 같은 트랜잭션에서 증분 반영
+            await increment_mention_rollups(session, rollup_counts, story_rollup_counts)
+            
+            entries = [entry for _, _, entry in stories if entry is not None]
             try:
+                if stories:
+                    # id 확정 후 스토리 대표 기사 id 지정 (배치 내 순서대로: 대표 기사가 먼저 처리됨)
+                    await session.flush()
+                    for article, matched, _ in stories:
+                        story_clusterer.resolve(article, matched)
                 await session.commit()
+                story_clusterer.settle(entries)
                 if saved_count > 0:
                     logger.info(f"Saved {saved_count} new articles to database")
+                    # ✅ [Cache] 크롤 세대 증가 → 피드/트렌드 캐시 응답 무효화
+                    await response_cache.bump_generation()
                 if quality_filtered_count > 0:
                     logger.info(f"🛡️ Quality Gate blocked {quality_filtered_count} low-quality articles")
                 return saved_count
                 
             except Exception as e:
                 await session.rollback()
+                story_clusterer.discard(entries)
                 logger.error(f"Failed to commit articles: {str(e)}")
                 return 0
     
-    def _has_exact_word_match(self, text: str, keyword: str) -> bool:
-        """정확한 단어 경계 매칭 (한글 조사 처리 개선)"""
-        if not text or not keyword:
-            return False
-            
-        keyword = keyword.strip()
+    async def _advance_watermarks(self, session, articles_data: List[Dict]) -> None:
+        """
+        (회사, 쿼리)별로 이번에 본 가장 최근 기사로 워터마크 upsert
         
-        # 영문/숫자로만 구성된 경우 -> 기존 word boundary 사용
-        if re.match(r'^[a-zA-Z0-9\s]+$', keyword):
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            return bool(re.search(pattern, text, re.IGNORECASE))
-            
-        # 한글이 포함된 경우 -> 왼쪽 경계만 체크하고 오른쪽은 조사 등을 허용
-        # (예: '로그블랙' -> '로그블랙은', '로그블랙이' 등을 매칭하기 위함)
-        # 왼쪽 경계: 문장의 시작이거나, 한글/영문/숫자가 아닌 문자가 선행
-        pattern = r'(?:^|[^가-힣a-zA-Z0-9])' + re.escape(keyword)
-        return bool(re.search(pattern, text, re.IGNORECASE))
-    
-    def _calculate_context_score(self, title: str, summary: str) -> float:
-        """비즈니스/ESG 컨텍스트 점수 계산 (0.0 ~ 1.0)"""
-        full_text = f"{title} {summary}".lower()
-        
-        business_keywords = [
-            "기업", "회사", "솔루션", "플랫폼", "서비스", "CEO", "대표",
-            "스타트업", "기업가", "창업", "투자", "사업", "경영"
-        ]
-        
-        esg_keywords = [
-            "ESG", "탄소", "환경", "지속가능", "친환경", "녹색", "기후",
-            "배출권", "넷제로", "탄소중립", "재생에너지", "LCA"
-        ]
-        
-        business_score = sum(1 for kw in business_keywords if kw in full_text)
-        esg_score = sum(2 for kw in esg_keywords if kw in full_text)
-        
-        max_possible_score = 7.0
-        total_score = min(business_score + esg_score, max_possible_score)
+        Quality Gate 에서 걸러진 기사도 '본 기사'이므로 기준점 계산에 포함한다.
+        기존 값보다 최신일 때만 갱신되어 워터마크는 뒤로 가지 않는다.
+        """
+        latest: Dict[Tuple[int, str], Tuple[object, Optional[str]]] = {}
+        for article_data in articles_data:
+            query = article_data.get('_query_used')
+            published_at = article_data.get('published_at')
+            if not query or published_at is None:
+                continue
+            key = (article_data['company_id'], query)
+            current = latest.get(key)
+            if current is None or to_naive_utc(published_at) > to_naive_utc(current[0]):
+                latest[key] = (published_at, article_data.get('article_url'))
         
-        return total_score / max_possible_score
-
-    async def _calculate_relevance_score(self, session: AsyncSession, article_data: Dict) -> float:
-        """개선된 관련도 점수 계산 (세션 재사용 버전)"""
-        try:
-            company_id = article_data.get('company_id')
-            title = article_data.get('title', '')
-            summary = article_data.get('summary', '')
-            
-            if not company_id:
-                return 0.0
-            
-            # ✅ [Refactor] 전달받은 session 사용 (새 연결 안 만듦)
-            result = await session.execute(
-                select(Company.company_name, Company.company_name_en, Company.positive_keywords, Company.negative_keywords)
-                .where(Company.id == company_id)
+        for (company_id, query), (published_at, article_url) in latest.items():
+            stmt = pg_insert(CrawlWatermark).values(
+                company_id=company_id,
+                query=query,
+                last_published_at=published_at,
+                last_article_url=article_url,
             )
-            row = result.first()
-            
-            if not row:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CrawlWatermark.company_id, CrawlWatermark.query],
+                set_={
+                    "last_published_at": stmt.excluded.last_published_at,
+                    "last_article_url": stmt.excluded.last_article_url,
+                    "updated_at": func.now(),
+                },
+                where=CrawlWatermark.last_published_at < stmt.excluded.last_published_at,
+            )
+            await session.execute(stmt)
+    
+    def _calculate_relevance_score(self, article_data: Dict, hits: Optional[KeywordHits]) -> float:
+        """개선된 관련도 점수 계산 (회사별 매처의 스캔 결과 사용)"""
+        try:
+            if hits is None:
                 return 0.0
             
-            company_name = row.company_name
-            company_name_en = row.company_name_en or ''
-            positive_keywords = row.positive_keywords or []
-            negative_keywords = row.negative_keywords or []
-            
-            full_text = f"{title} {summary}"
             score = 0.0
             
             # 1. 회사명 정확 매칭
-            title_has_company = self._has_exact_word_match(title, company_name)
-            summary_has_company = self._has_exact_word_match(summary, company_name)
-            
             # [변경] 제목에 회사명이 있으면 점수를 대폭 상향 (0.35 -> 0.5)
             # 이유: 제목에 회사명이 명시된 경우 관련성이 매우 높음
-            if title_has_company:
+            if hits.title_has_company:
                 score += 0.50
-            elif summary_has_company:
+            elif hits.summary_has_company:
                 # [변경] 본문에만 있어도 소폭 상향 (0.20 -> 0.30)
                 score += 0.30
             else:
                 score -= 0.10
             
             # 2. 영어 회사명 정확 매칭
-            if company_name_en and self._has_exact_word_match(full_text, company_name_en):
+            if hits.has_company_en:
                 score += 0.25
             
             # 3. Positive keywords 정확 매칭
-            if positive_keywords:
-                positive_matches = sum(1 for kw in positive_keywords 
-                                     if self._has_exact_word_match(full_text, kw))
-                positive_ratio = min(positive_matches / len(positive_keywords), 1.0)
+            if hits.positive_total:
+                positive_ratio = min(hits.positive_matches / hits.positive_total, 1.0)
                 score += 0.2 * positive_ratio
             
             # 4. 컨텍스트 점수
-            context_score = self._calculate_context_score(title, summary)
-            score += 0.2 * context_score
+            score += 0.2 * hits.context_score
             
             # 5. Negative keywords 패널티
-            for neg_kw in negative_keywords:
-                if self._has_exact_word_match(full_text, neg_kw):
-                    score -= 0.6
-                    break
+            if hits.negative_keyword:
+                score -= 0.6
             
             # 6. 정밀 트랙 가산점
             try:
@@ -0,0 +1,340 @@
+"""
+유사 기사(스토리) 클러스터링
+
+같은 보도자료를 여러 매체가 전재한 기사를 하나의 스토리로 묶는다.
+- 지문: 제목+요약 문자 n-gram 의 64비트 SimHash
+- 인덱스: 지문을 (허용 거리 + 1)개 밴드로 나눈 LSH 버킷 (회사별, 발행 시각 구간 내)
+  비둘기집 원리로 허용 거리 이내의 지문은 최소 한 밴드가 완전히 같아 반드시 후보에 잡힌다.
+- 클러스터 ID: 스토리 대표 기사(처음 저장된 기사)의 id → Article.story_cluster_id
+"""
+import asyncio
+import hashlib
+import re
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+from sqlalchemy import select, update, func
+
+from .constants import (
+    STORY_SHINGLE_SIZE,
+    STORY_MIN_SHINGLES,
+    STORY_SIMHASH_MAX_DISTANCE,
+    STORY_WINDOW_HOURS,
+    STORY_INDEX_RELOAD_SECONDS,
+    STORY_BACKFILL_BATCH_SIZE,
+    STORY_BACKFILL_MAX_BATCHES,
+)
+from .utils import to_naive_utc
+from ..articles.models import Article
+from ..core.database import AsyncSessionLocal
+
+SIMHASH_BITS = 64
+_MASK = (1 << SIMHASH_BITS) - 1
+_BANDS = STORY_SIMHASH_MAX_DISTANCE + 1
+_BAND_BITS = SIMHASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+_MARKUP_RE = re.compile(r"<[^>]+>|&[#\w]+;")
+
+
+def normalize_story_text(title: Optional[str], summary: Optional[str] = None) -> str:
+    """태그/엔티티 제거 후 소문자 문자·숫자만 남김 (매체별 띄어쓰기·문장부호 차이 무시)"""
+    text = _MARKUP_RE.sub(" ", f"{title or ''} {summary or ''}").lower()
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+def simhash(title: Optional[str], summary: Optional[str] = None) -> Optional[int]:
+    """
+    제목+요약 SimHash (부호 있는 64비트, BIGINT 저장용)
+
+    n-gram 수가 STORY_MIN_SHINGLES 미만인 짧은 글은 None (지문 없음 → 단독 스토리)
+    """
+    text = normalize_story_text(title, summary)
+    k = STORY_SHINGLE_SIZE
+    if len(text) - k + 1 < STORY_MIN_SHINGLES:
+        return None
+
+    weights = Counter(text[i:i + k] for i in range(len(text) - k + 1))
+    vector = [0] * SIMHASH_BITS
+    for shingle, weight in weights.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                vector[bit] += weight
+            else:
+                vector[bit] -= weight
+
+    fingerprint = 0
+    for bit, total in enumerate(vector):
+        if total > 0:
+            fingerprint |= 1 << bit
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >= 1 << (SIMHASH_BITS - 1) else fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) & _MASK).bit_count()
+
+
+def _bands(fingerprint: int) -> List[Tuple[int, int]]:
+    unsigned = fingerprint & _MASK
+    return [(band, (unsigned >> (band * _BAND_BITS)) & _BAND_MASK) for band in range(_BANDS)]
+
+
+# 클러스터 참조: 저장된 클러스터 id, 또는 같은 배치에서 아직 id 가 없는 대표 기사
+ClusterRef = Union[int, Article]
+
+
+class StoryEntry:
+    """인덱스 항목 (기사 1건)"""
+
+    __slots__ = ("company_id", "fingerprint", "published_at", "cluster")
+
+    def __init__(self, company_id: int, fingerprint: int, published_at: datetime, cluster: ClusterRef):
+        self.company_id = company_id
+        self.fingerprint = fingerprint
+        self.published_at = published_at  # naive UTC
+        self.cluster = cluster
+
+    def cluster_id(self) -> Optional[int]:
+        if isinstance(self.cluster, Article):
+            return self.cluster.story_cluster_id or self.cluster.id
+        return self.cluster
+
+
+class StoryIndex:
+    """
+    회사별 SimHash 밴드 LSH 인덱스 (발행 시각 구간 내 항목만 유지)
+
+    오래된 항목은 추가 1,000건마다 가장 최근 발행 시각 - 구간 기준으로 일괄 정리한다.
+    """
+
+    SWEEP_EVERY = 1000
+
+    def __init__(self, window_hours: int = STORY_WINDOW_HOURS):
+        self.window = timedelta(hours=window_hours)
+        self._buckets: Dict[Tuple[int, int, int], List[StoryEntry]] = {}
+        self._size = 0
+        self._newest: Optional[datetime] = None
+        self._added_since_sweep = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def find(self, company_id: int, fingerprint: int, published_at: datetime) -> Optional[StoryEntry]:
+        """허용 거리 이내 + 발행 시각 구간 내에서 가장 가까운 항목"""
+        best: Optional[StoryEntry] = None
+        best_distance = STORY_SIMHASH_MAX_DISTANCE + 1
+        seen = set()
+        for band, value in _bands(fingerprint):
+            for entry in self._buckets.get((company_id, band, value), ()):
+                if id(entry) in seen:
+                    continue
+                seen.add(id(entry))
+                if abs(entry.published_at - published_at) > self.window:
+                    continue
+                distance = hamming_distance(entry.fingerprint, fingerprint)
+                if distance < best_distance:
+                    best, best_distance = entry, distance
+        return best
+
+    def add(self, entry: StoryEntry) -> None:
+        for band, value in _bands(entry.fingerprint):
+            self._buckets.setdefault((entry.company_id, band, value), []).append(entry)
+        self._size += 1
+        if self._newest is None or entry.published_at > self._newest:
+            self._newest = entry.published_at
+        self._added_since_sweep += 1
+        if self._added_since_sweep >= self.SWEEP_EVERY:
+            self.sweep()
+
+    def discard(self, entries: Iterable[StoryEntry]) -> None:
+        """저장이 롤백된 기사 항목 제거"""
+        for entry in entries:
+            removed = False
+            for band, value in _bands(entry.fingerprint):
+                bucket = self._buckets.get((entry.company_id, band, value))
+                if bucket and entry in bucket:
+                    bucket.remove(entry)
+                    removed = True
+                    if not bucket:
+                        del self._buckets[(entry.company_id, band, value)]
+            if removed:
+                self._size -= 1
+
+    def sweep(self) -> None:
+        """구간을 벗어난 오래된 항목 정리"""
+        self._added_since_sweep = 0
+        if self._newest is None:
+            return
+        horizon = self._newest - self.window
+        buckets: Dict[Tuple[int, int, int], List[StoryEntry]] = {}
+        kept = set()
+        for key, bucket in self._buckets.items():
+            alive = [entry for entry in bucket if entry.published_at >= horizon]
+            if alive:
+                buckets[key] = alive
+                kept.update(id(entry) for entry in alive)
+        self._buckets = buckets
+        self._size = len(kept)
+
+
+class StoryClusterer:
+    """
+    수집 파이프라인용 스토리 클러스터러
+
+    최근 구간의 지문을 DB 에서 한 번 적재한 뒤 저장되는 기사로 증분 유지한다.
+    다른 프로세스가 저장한 기사는 STORY_INDEX_RELOAD_SECONDS 마다 재적재로 반영된다.
+    """
+
+    def __init__(self):
+        self.index = StoryIndex()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < STORY_INDEX_RELOAD_SECONDS
+
+    async def _ensure_loaded(self) -> None:
+        if self._is_fresh():
+            return
+        async with self._lock:
+            if self._is_fresh():
+                return
+            index = StoryIndex()
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(
+                        Article.id,
+                        Article.company_id,
+                        Article.simhash,
+                        Article.story_cluster_id,
+                        Article.published_at,
+                    ).where(
+                        Article.simhash.isnot(None),
+                        Article.published_at >= func.now() - index.window,
+                    )
+                )
+                for row in result.all():
+                    index.add(StoryEntry(
+                        row.company_id, row.simhash, to_naive_utc(row.published_at), row.story_cluster_id or row.id
+                    ))
+            self.index = index
+            self._loaded_at = time.monotonic()
+            logger.debug(f"스토리 인덱스 적재: {len(index)}건")
+
+    async def assign(self, article: Article) -> Tuple[Optional[StoryEntry], Optional[StoryEntry]]:
+        """
+        저장 전 기사의 지문 계산 + 같은 스토리 탐색 후 인덱스에 등록
+
+        Returns:
+            (매칭된 기존 항목, None 이면 새 스토리), (이 기사의 인덱스 항목, 지문이 없으면 None)
+        """
+        await self._ensure_loaded()
+        article.simhash = simhash(article.title, article.summary)
+        if article.simhash is None or article.published_at is None:
+            return None, None
+
+        published_at = to_naive_utc(article.published_at)
+        matched = self.index.find(article.company_id, article.simhash, published_at)
+        entry = StoryEntry(article.company_id, article.simhash, published_at, matched.cluster if matched else article)
+        self.index.add(entry)
+        return matched, entry
+
+    @staticmethod
+    def resolve(article: Article, matched: Optional[StoryEntry]) -> None:
+        """flush 후(id 확정) 클러스터 ID 지정: 대표 기사는 자기 id, 나머지는 대표 기사 id"""
+        article.story_cluster_id = matched.cluster_id() if matched else article.id
+
+    @staticmethod
+    def settle(entries: Iterable[StoryEntry]) -> None:
+        """커밋 후 인덱스가 ORM 객체 대신 클러스터 id 만 참조하도록 정리"""
+        for entry in entries:
+            if isinstance(entry.cluster, Article):
+                entry.cluster = entry.cluster_id()
+
+    def discard(self, entries: Iterable[StoryEntry]) -> None:
+        self.index.discard(entries)
+
+    async def backfill(
+        self,
+        batch_size: int = STORY_BACKFILL_BATCH_SIZE,
+        max_batches: int = STORY_BACKFILL_MAX_BATCHES,
+    ) -> Tuple[int, Optional[date]]:
+        """
+        클러스터 미지정 기존 기사 백필 (발행 시각 오름차순, 별도 인덱스 사용)
+
+        Returns:
+            (처리 건수, 다른 스토리에 편입된 기사 중 가장 이른 발행일 - 일별 집계 보정 범위)
+        """
+        index = StoryIndex()
+        seeded_ids = set()
+        processed = 0
+        earliest: Optional[date] = None
+
+        for _ in range(max_batches):
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Article.id, Article.company_id, Article.title, Article.summary, Article.published_at)
+                    .where(Article.story_cluster_id.is_(None))
+                    .order_by(Article.published_at.asc().nulls_last(), Article.id)
+                    .limit(batch_size)
+                )
+                rows = result.all()
+                if not rows:
+                    break
+
+                # 배치 구간 주변의 이미 클러스터링된 기사(최근 수집분 등)를 인덱스에 포함
+                dated = [row.published_at for row in rows if row.published_at is not None]
+                if dated:
+                    seed = await session.execute(
+                        select(
+                            Article.id,
+                            Article.company_id,
+                            Article.simhash,
+                            Article.story_cluster_id,
+                            Article.published_at,
+                        ).where(
+                            Article.simhash.isnot(None),
+                            Article.story_cluster_id.isnot(None),
+                            Article.published_at >= min(dated) - index.window,
+                            Article.published_at <= max(dated) + index.window,
+                        )
+                    )
+                    for row in seed.all():
+                        if row.id not in seeded_ids:
+                            seeded_ids.add(row.id)
+                            index.add(StoryEntry(
+                                row.company_id, row.simhash, to_naive_utc(row.published_at), row.story_cluster_id
+                            ))
+
+                updates = []
+                for row in rows:
+                    fingerprint = simhash(row.title, row.summary)
+                    cluster_id = row.id
+                    if fingerprint is not None and row.published_at is not None:
+                        published_at = to_naive_utc(row.published_at)
+                        matched = index.find(row.company_id, fingerprint, published_at)
+                        if matched is not None:
+                            # 스토리 수 집계가 바뀌는 것은 다른 스토리에 편입된 기사뿐
+                            cluster_id = matched.cluster_id()
+                            day = published_at.date()
+                            earliest = day if earliest is None or day < earliest else earliest
+                        index.add(StoryEntry(row.company_id, fingerprint, published_at, cluster_id))
+                        seeded_ids.add(row.id)
+                    updates.append({"id": row.id, "simhash": fingerprint, "story_cluster_id": cluster_id})
+
+                await session.execute(update(Article), updates)
+                await session.commit()
+
+            processed += len(rows)
+            if len(rows) < batch_size:
+                break
+
+        return processed, earliest
+
+
+# 싱글톤 인스턴스
+story_clusterer = StoryClusterer()
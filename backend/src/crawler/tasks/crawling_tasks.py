@@ -0,0 +1,205 @@
+"""
+영속 크롤링 작업 큐
+회사별 크롤링 작업을 crawl_jobs 테이블에 적재하고, 임대(lease) 기반으로 처리한다.
+쿼리 단위 체크포인트로 재시작 시 이어서 진행하며, 실패는 지수 백오프로 재시도한다.
+"""
+import os
+import socket
+from datetime import timedelta
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import select, update, func, or_, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ..constants import (
+    CRAWL_JOB_LEASE_SECONDS,
+    CRAWL_JOB_MAX_ATTEMPTS,
+    CRAWL_JOB_RETRY_BASE_SECONDS,
+    CRAWL_JOB_RETRY_MAX_SECONDS,
+)
+from ..exceptions import CrawlJobLeaseLost
+from ..models import CrawlJob
+from ..service import CrawlerService
+from ...companies.service import company_profile_cache
+from ...core.database import AsyncSessionLocal
+
+
+def _retry_delay_seconds(attempts: int) -> int:
+    return min(CRAWL_JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), CRAWL_JOB_RETRY_MAX_SECONDS)
+
+
+class CrawlJobQueue:
+    """crawl_jobs 테이블 기반 작업 큐"""
+    
+    def __init__(self, crawler_service: CrawlerService):
+        self.crawler_service = crawler_service
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    
+    async def enqueue_run(self, run_id: str, kind: str = "full", max_articles: int = 100) -> int:
+        """
+        활성 회사 전체에 대한 작업 묶음 적재
+        
+        같은 run_id 로 다시 호출해도 (run_id, company_id) 유니크 제약으로 중복 적재되지 않는다.
+        """
+        companies = await self.crawler_service.get_active_companies()
+        if not companies:
+            return 0
+        
+        async with AsyncSessionLocal() as session:
+            stmt = pg_insert(CrawlJob).values([
+                {
+                    "run_id": run_id,
+                    "company_id": company["id"],
+                    "kind": kind,
+                    "max_articles": max_articles,
+                    "status": "pending",
+                    "attempts": 0,
+                    "max_attempts": CRAWL_JOB_MAX_ATTEMPTS,
+                    "checkpoint": {},
+                    "articles_saved": 0,
+                }
+                for company in companies
+            ]).on_conflict_do_nothing(constraint="uq_crawl_job_run_company")
+            result = await session.execute(stmt)
+            await session.commit()
+        
+        logger.info(f"크롤링 작업 적재: run_id={run_id}, {result.rowcount}/{len(companies)}개 회사")
+        return result.rowcount
+    
+    async def lease_next(self) -> Optional[CrawlJob]:
+        """
+        처리할 작업 1건 임대
+        
+        대기 중이면서 재시도 시각이 지난 작업, 또는 임대가 만료된 실행 중 작업을 대상으로
+        FOR UPDATE SKIP LOCKED 로 다른 워커와 겹치지 않게 가져온다.
+        """
+        async with AsyncSessionLocal() as session:
+            candidate = (
+                select(CrawlJob.id)
+                .where(
+                    or_(
+                        and_(CrawlJob.status == "pending", CrawlJob.next_attempt_at <= func.now()),
+                        and_(CrawlJob.status == "running", CrawlJob.lease_expires_at < func.now()),
+                    )
+                )
+                .order_by(CrawlJob.next_attempt_at, CrawlJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                update(CrawlJob)
+                .where(CrawlJob.id == candidate)
+                .values(
+                    status="running",
+                    attempts=CrawlJob.attempts + 1,
+                    lease_owner=self.worker_id,
+                    lease_expires_at=func.now() + timedelta(seconds=CRAWL_JOB_LEASE_SECONDS),
+                )
+                .returning(CrawlJob)
+                .execution_options(synchronize_session=False)
+            )
+            job = result.scalar_one_or_none()
+            await session.commit()
+            return job
+    
+    async def _save_checkpoint(self, job_id: int, checkpoint: dict, saved: int) -> None:
+        """체크포인트 기록 + 임대 연장 (임대를 잃었으면 중단)"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(CrawlJob)
+                .where(CrawlJob.id == job_id, CrawlJob.lease_owner == self.worker_id, CrawlJob.status == "running")
+                .values(
+                    checkpoint=checkpoint,
+                    articles_saved=CrawlJob.articles_saved + saved,
+                    lease_expires_at=func.now() + timedelta(seconds=CRAWL_JOB_LEASE_SECONDS),
+                )
+            )
+            await session.commit()
+        if result.rowcount == 0:
+            raise CrawlJobLeaseLost(job_id)
+    
+    async def _finish(self, job: CrawlJob, error: Optional[str] = None) -> None:
+        """작업 종료 처리: 성공 / 백오프 재시도 / dead"""
+        values = {"lease_owner": None, "lease_expires_at": None}
+        if error is None:
+            values.update(status="succeeded", last_error=None, finished_at=func.now())
+        elif job.attempts >= job.max_attempts:
+            values.update(status="dead", last_error=error, finished_at=func.now())
+        else:
+            delay = _retry_delay_seconds(job.attempts)
+            values.update(
+                status="pending",
+                last_error=error,
+                next_attempt_at=func.now() + timedelta(seconds=delay),
+            )
+        
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(CrawlJob)
+                .where(CrawlJob.id == job.id, CrawlJob.lease_owner == self.worker_id)
+                .values(**values)
+            )
+            await session.commit()
+        
+        if error is not None:
+            logger.warning(f"크롤링 작업 실패: job={job.id}, 회사 ID {job.company_id}, 시도 {job.attempts}/{job.max_attempts}: {error}")
+    
+    async def run_job(self, job: CrawlJob) -> None:
+        """임대한 작업 1건 실행 (체크포인트부터 재개)"""
+        company = await company_profile_cache.get_active(job.company_id)
+        if company is None:
+            await self._finish(job)
+            return
+        
+        async def on_checkpoint(state: dict, articles: List[dict]) -> None:
+            saved = await self.crawler_service.save_articles(articles) if articles else 0
+            await self._save_checkpoint(job.id, state, saved)
+        
+        watermarks = await self.crawler_service.get_watermarks(job.company_id) if job.kind == "incremental" else None
+        result = await self.crawler_service.scraper.crawl_company_news(
+            company_id=company.id,
+            company_name=company.company_name,
+            max_articles=job.max_articles,
+            watermarks=watermarks,
+            checkpoint=job.checkpoint,
+            on_checkpoint=on_checkpoint,
+        )
+        await self._finish(job, None if result.success else (result.error_message or "unknown error"))
+    
+    async def drain(self, max_jobs: Optional[int] = None) -> int:
+        """처리 가능한 작업이 없을 때까지 순차 처리"""
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            job = await self.lease_next()
+            if job is None:
+                break
+            if job.checkpoint:
+                logger.info(f"크롤링 작업 재개: job={job.id}, 완료 쿼리 {len(job.checkpoint.get('done_queries', []))}개")
+            try:
+                await self.run_job(job)
+            except CrawlJobLeaseLost as e:
+                logger.warning(str(e))
+            except Exception as e:
+                await self._finish(job, str(e))
+            processed += 1
+        
+        if processed:
+            logger.info(f"크롤링 작업 큐 처리: {processed}건")
+        return processed
+    
+    async def get_run_summary(self, run_id: str) -> dict:
+        """실행 묶음별 상태 집계"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(CrawlJob.status, func.count(CrawlJob.id), func.sum(CrawlJob.articles_saved))
+                .where(CrawlJob.run_id == run_id)
+                .group_by(CrawlJob.status)
+            )
+            rows = result.all()
+        return {
+            "run_id": run_id,
+            "status_counts": {status: count for status, count, _ in rows},
+            "articles_saved": sum(saved or 0 for _, _, saved in rows),
+        }
@@ -0,0 +1,304 @@
+"""
+크롤러 공용 유틸리티
+회사별 키워드 매처 (Aho–Corasick 오토마톤)
+"""
+import hashlib
+import re
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from .constants import (
+    BUSINESS_CONTEXT_KEYWORDS,
+    ESG_CONTEXT_KEYWORDS,
+    CONTEXT_MAX_SCORE,
+    MENTION_MIN_CONTEXT_SCORE,
+    SCRAPED_TIMEZONE,
+)
+
+# 매칭 모드
+MODE_WORD = "word"          # 영문/숫자 키워드: 양쪽 단어 경계 (\b ... \b)
+MODE_KOREAN = "korean"      # 한글 포함 키워드: 왼쪽 경계만 (오른쪽은 조사 허용)
+MODE_SUBSTRING = "substring"  # 컨텍스트 키워드: 단순 부분 문자열
+
+_ASCII_KEYWORD_RE = re.compile(r'^[a-zA-Z0-9\s]+$')
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 \\w 와 동일한 판정 (유니코드 문자/숫자 + '_')"""
+    return ch.isalnum() or ch == '_'
+
+
+def _is_korean_boundary_char(ch: str) -> bool:
+    """한글 왼쪽 경계에서 '단어 내부'로 간주되는 문자 ([가-힣a-zA-Z0-9])"""
+    return ('가' <= ch <= '힣') or ('a' <= ch <= 'z') or ('A' <= ch <= 'Z') or ('0' <= ch <= '9')
+
+
+def keyword_mode(keyword: str) -> str:
+    """키워드 형태에 따라 경계 매칭 모드 결정"""
+    return MODE_WORD if _ASCII_KEYWORD_RE.match(keyword) else MODE_KOREAN
+
+
+def _boundary_ok(text: str, start: int, end: int, mode: str) -> bool:
+    """매칭 구간 [start, end) 의 경계 조건 확인"""
+    if mode == MODE_SUBSTRING:
+        return True
+    if mode == MODE_WORD:
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
+    # MODE_KOREAN: 문장의 시작이거나, 한글/영문/숫자가 아닌 문자가 선행
+    return start == 0 or not _is_korean_boundary_char(text[start - 1])
+
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 매칭 오토마톤
+
+    패턴 집합을 한 번 컴파일해두고 텍스트를 단일 패스로 스캔하여
+    모든 (start, end, label) 매칭을 찾는다. 패턴은 소문자로 정규화된다.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Hashable]]] = [[]]
+
+        for pattern, label in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((len(pattern), label))
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Hashable]]:
+        """텍스트의 모든 매칭 구간 반환 (start, end, label)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for idx, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                end = idx + 1
+                for length, label in out[node]:
+                    yield end - length, end, label
+
+
+class KeywordHits:
+    """기사 1건에 대한 키워드 매칭 결과"""
+
+    __slots__ = (
+        "title_has_company", "summary_has_company", "has_company",
+        "has_company_en", "positive_matches", "positive_total",
+        "negative_keyword", "business_hits", "esg_hits",
+        "mention_has_company", "mention_positive_matches",
+    )
+
+    def __init__(self, positive_total: int):
+        self.title_has_company = False
+        self.summary_has_company = False
+        self.has_company = False
+        self.has_company_en = False
+        self.positive_matches = 0
+        # 언급 판정용: 한글 키워드도 양쪽 단어 경계로 매칭 (조사가 붙은 "로그블랙은" 제외)
+        self.mention_has_company = False
+        self.mention_positive_matches = 0
+        self.positive_total = positive_total
+        self.negative_keyword: Optional[str] = None
+        self.business_hits = 0
+        self.esg_hits = 0
+
+    @property
+    def context_score(self) -> float:
+        """비즈니스/ESG 컨텍스트 점수 (0.0 ~ 1.0)"""
+        total_score = min(self.business_hits + 2 * self.esg_hits, CONTEXT_MAX_SCORE)
+        return total_score / CONTEXT_MAX_SCORE
+
+    @property
+    def is_company_mention(self) -> bool:
+        """
+        회사 관련 기사 여부 (회사명 정확 매칭, 또는 positive 키워드 + 충분한 컨텍스트)
+
+        기사 서비스의 기존 판정과 같이 모든 키워드를 양쪽 단어 경계(\\b ... \\b)로 매칭한 결과를 쓴다.
+        (관련도 점수는 한글 조사를 허용하는 왼쪽 경계 매칭 결과를 사용)
+        """
+        if self.mention_has_company:
+            return True
+        return bool(self.mention_positive_matches) and self.context_score >= MENTION_MIN_CONTEXT_SCORE
+
+
+class CompanyKeywordMatcher:
+    """
+    회사별 컴파일된 키워드 매처
+
+    회사명(국문/영문), positive/negative 키워드, 컨텍스트 키워드를 하나의
+    Aho–Corasick 오토마톤으로 묶어 기사 1건을 단일 패스로 판정한다.
+    """
+
+    def __init__(
+        self,
+        company_name: Optional[str],
+        company_name_en: Optional[str] = None,
+        positive_keywords: Optional[List[str]] = None,
+        negative_keywords: Optional[List[str]] = None,
+    ):
+        self.company_name = (company_name or "").strip()
+        self.company_name_en = (company_name_en or "").strip()
+        self.positive_keywords = [kw.strip() for kw in (positive_keywords or []) if kw and kw.strip()]
+        self.negative_keywords = [kw.strip() for kw in (negative_keywords or []) if kw and kw.strip()]
+
+        patterns: List[Tuple[str, Hashable]] = []
+
+        def add(keyword: str, kind: str, index: int = 0, mode: Optional[str] = None):
+            patterns.append((keyword.lower(), (kind, index, mode or keyword_mode(keyword))))
+
+        if self.company_name:
+            add(self.company_name, "company")
+        if self.company_name_en:
+            add(self.company_name_en, "company_en")
+        for idx, kw in enumerate(self.positive_keywords):
+            add(kw, "positive", idx)
+        for idx, kw in enumerate(self.negative_keywords):
+            add(kw, "negative", idx)
+        for idx, kw in enumerate(BUSINESS_CONTEXT_KEYWORDS):
+            add(kw, "business", idx, MODE_SUBSTRING)
+        for idx, kw in enumerate(ESG_CONTEXT_KEYWORDS):
+            add(kw, "esg", idx, MODE_SUBSTRING)
+
+        self._automaton = AhoCorasick(patterns)
+        self._rule_hash: Optional[str] = None
+
+    @property
+    def rule_hash(self) -> str:
+        """
+        판정 규칙 지문 (회사명/키워드/컨텍스트 키워드/임계값)
+
+        저장된 기사의 언급 판정이 현재 규칙으로 계산된 것인지 확인하는 데 쓴다.
+        """
+        if self._rule_hash is None:
+            source = "\x1f".join([
+                self.company_name,
+                self.company_name_en,
+                "\x1e".join(self.positive_keywords),
+                "\x1e".join(self.negative_keywords),
+                "\x1e".join(BUSINESS_CONTEXT_KEYWORDS),
+                "\x1e".join(ESG_CONTEXT_KEYWORDS),
+                repr(MENTION_MIN_CONTEXT_SCORE),
+                MODE_WORD,  # 언급 판정 경계 규칙 (바뀌면 저장된 판정 재분류)
+            ])
+            self._rule_hash = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+        return self._rule_hash
+
+    def is_company_mention(self, title: Optional[str], summary: Optional[str] = None) -> bool:
+        """회사 언급 기사 여부 (회사명이 비어 있으면 필터링하지 않음)"""
+        if not self.company_name:
+            return True
+        return self.scan(title, summary).is_company_mention
+
+    def scan(self, title: Optional[str], summary: Optional[str] = None) -> KeywordHits:
+        """제목 + 요약을 한 번에 스캔하여 모든 키워드 매칭 결과 반환"""
+        title = (title or "").lower()
+        summary = (summary or "").lower()
+        # 제목과 요약 사이의 공백은 양쪽 모두에게 단어 경계로 작용하므로
+        # 위치만으로 제목/요약 매칭을 구분할 수 있다.
+        text = f"{title} {summary}"
+        title_end = len(title)
+        summary_start = title_end + 1
+
+        hits = KeywordHits(positive_total=len(self.positive_keywords))
+        positive_seen = set()
+        mention_positive_seen = set()
+        negative_first: Optional[int] = None
+        business_seen = set()
+        esg_seen = set()
+
+        for start, end, (kind, index, mode) in self._automaton.iter_matches(text):
+            if not _boundary_ok(text, start, end, mode):
+                continue
+            if kind == "company":
+                hits.has_company = True
+                if end <= title_end:
+                    hits.title_has_company = True
+                elif start >= summary_start:
+                    hits.summary_has_company = True
+                if _boundary_ok(text, start, end, MODE_WORD):
+                    hits.mention_has_company = True
+            elif kind == "company_en":
+                hits.has_company_en = True
+            elif kind == "positive":
+                positive_seen.add(index)
+                if _boundary_ok(text, start, end, MODE_WORD):
+                    mention_positive_seen.add(index)
+            elif kind == "negative":
+                if negative_first is None or index < negative_first:
+                    negative_first = index
+            elif kind == "business":
+                business_seen.add(index)
+            elif kind == "esg":
+                esg_seen.add(index)
+
+        hits.positive_matches = len(positive_seen)
+        hits.mention_positive_matches = len(mention_positive_seen)
+        if negative_first is not None:
+            hits.negative_keyword = self.negative_keywords[negative_first]
+        hits.business_hits = len(business_seen)
+        hits.esg_hits = len(esg_seen)
+        return hits
+
+
+# 증분 크롤링 기준점: (마지막으로 본 기사 발행시각, 해당 기사 URL)
+Watermark = Tuple[datetime, Optional[str]]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """비교용 정규화: aware → UTC 변환 후 tzinfo 제거, naive 는 그대로"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def localize_scraped(value: Optional[datetime]) -> Optional[datetime]:
+    """수집 발행 시각에 시간대 부여: naive 는 SCRAPED_TIMEZONE(KST) 벽시계로 간주, aware 는 그대로"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=SCRAPED_TIMEZONE)
+    return value
+
+
+def is_seen_by_watermark(published_at: Optional[datetime], url: Optional[str], watermark: Optional[Watermark]) -> bool:
+    """기준점 이전(또는 기준점과 동일한) 기사인지 판정"""
+    if watermark is None or published_at is None:
+        return False
+    mark_at, mark_url = watermark
+    published = to_naive_utc(published_at)
+    mark = to_naive_utc(mark_at)
+    if published < mark:
+        return True
+    return published == mark and url is not None and url == mark_url
@@ -0,0 +1,231 @@
+"""
+내용 주소(content-addressed) 블록 저장소
+
+버전 스냅샷/델타에 블록 JSON 을 그대로 넣지 않고, 정규화 JSON 해시로 document_blocks 에 한 번만 저장한 뒤
+{"$h": 해시} 참조로 바꿔 저장한다. 연속 버전, 템플릿에서 복제한 문서처럼 같은 블록이 반복되면
+버전 쓰기는 대부분 해시 조회로 끝난다.
+
+- pack_payload / unpack_payload: 스냅샷(키프레임) 또는 델타의 블록 ↔ 해시 참조 변환
+- BlockStore.save: 버전 트랜잭션 안에서 없는 블록만 INSERT, 오래된 블록은 최근 사용 시각 갱신
+- BlockStore.collect_garbage: 어떤 버전도 참조하지 않고 유예 기간이 지난 블록 삭제 (배치 단위)
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .constants import BLOCK_CACHE_SIZE, BLOCK_GC_BATCH_SIZE, BLOCK_GC_GRACE_HOURS
+from .models import DocumentBlock, DocumentVersion
+from .version_delta import json_size
+from ..core.database import AsyncSessionLocal
+
+BLOCK_REF_KEY = "$h"
+
+# 한 INSERT 문에 담을 블록 수 (바인드 파라미터 수 제한 대비)
+_INSERT_CHUNK_SIZE = 1000
+
+
+def block_hash(block: Dict[str, Any]) -> str:
+    """블록 정규화 JSON(키 정렬, 공백 없음)의 BLAKE2b-128 해시 (hex 32자)"""
+    canonical = json.dumps(block, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _is_block_ref(item: Any) -> bool:
+    return isinstance(item, dict) and len(item) == 1 and BLOCK_REF_KEY in item
+
+
+def _map_blocks(payload: Dict[str, Any], transform: Callable[[List[Any]], List[Any]]) -> Dict[str, Any]:
+    """
+    스냅샷/델타의 블록 목록 위치마다 transform 을 적용한 사본
+
+    - 키프레임 섹션: section["blocks"]
+    - 델타 섹션 항목: entry["blocks"] (블록 id 참조 문자열은 transform 에서 그대로 둔다), entry["new"]["blocks"]
+    """
+    if not isinstance(payload.get("sections"), list):
+        return dict(payload)
+    sections = []
+    for entry in payload["sections"]:
+        if isinstance(entry, dict):
+            entry = dict(entry)
+            if isinstance(entry.get("blocks"), list):
+                entry["blocks"] = transform(entry["blocks"])
+            if isinstance(entry.get("new"), dict) and isinstance(entry["new"].get("blocks"), list):
+                entry["new"] = {**entry["new"], "blocks": transform(entry["new"]["blocks"])}
+        sections.append(entry)
+    return {**payload, "sections": sections}
+
+
+def pack_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """블록 dict 를 해시 참조로 치환한 payload 와 {해시: 블록} 반환"""
+    blocks: Dict[str, Dict[str, Any]] = {}
+
+    def pack(items: List[Any]) -> List[Any]:
+        packed = []
+        for item in items:
+            if isinstance(item, dict) and not _is_block_ref(item):
+                digest = block_hash(item)
+                blocks[digest] = item
+                packed.append({BLOCK_REF_KEY: digest})
+            else:
+                packed.append(item)
+        return packed
+
+    return _map_blocks(payload, pack), blocks
+
+
+def unpack_payload(payload: Dict[str, Any], blocks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """해시 참조를 블록 내용으로 복원 (참조가 없는 기존 형식 payload 는 그대로)"""
+    def unpack(items: List[Any]) -> List[Any]:
+        return [blocks[item[BLOCK_REF_KEY]] if _is_block_ref(item) else item for item in items]
+
+    return _map_blocks(payload, unpack)
+
+
+class BlockStore:
+    """블록 저장/조회 + GC (해시 → 블록 LRU 캐시 포함)"""
+
+    def __init__(
+        self,
+        cache_size: int = BLOCK_CACHE_SIZE,
+        grace_hours: int = BLOCK_GC_GRACE_HOURS,
+    ):
+        self.cache_size = cache_size
+        self.grace = timedelta(hours=grace_hours)
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _cache_set(self, digest: str, block: Dict[str, Any]) -> None:
+        self._cache[digest] = block
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def save(self, db: AsyncSession, blocks: Dict[str, Dict[str, Any]]) -> int:
+        """
+        버전 트랜잭션 안에서 블록 저장 (커밋은 호출자)
+
+        유예 기간 절반 이내에 사용된 블록은 조회만 하고, 그보다 오래된 블록은 last_used_at 을 갱신해
+        GC 대상에서 빼낸다 (갱신되지 않은 = 방금 GC 된 블록은 다시 INSERT).
+
+        Returns:
+            새로 저장한 블록 바이트 수
+        """
+        if not blocks:
+            return 0
+        hashes = list(blocks)
+        now = datetime.now(timezone.utc)
+
+        result = await db.execute(
+            select(DocumentBlock.hash).where(
+                DocumentBlock.hash.in_(hashes),
+                DocumentBlock.last_used_at >= now - self.grace / 2
+            )
+        )
+        recent = set(result.scalars().all())
+        stale = [digest for digest in hashes if digest not in recent]
+
+        touched = set()
+        if stale:
+            result = await db.execute(
+                update(DocumentBlock)
+                .where(DocumentBlock.hash.in_(stale))
+                .values(last_used_at=func.now())
+                .returning(DocumentBlock.hash)
+            )
+            touched = set(result.scalars().all())
+
+        missing = [digest for digest in stale if digest not in touched]
+        inserted_bytes = 0
+        for start in range(0, len(missing), _INSERT_CHUNK_SIZE):
+            rows = [
+                {"hash": digest, "content": blocks[digest], "size_bytes": json_size(blocks[digest])}
+                for digest in missing[start:start + _INSERT_CHUNK_SIZE]
+            ]
+            stmt = pg_insert(DocumentBlock).values(rows)
+            # 동시에 같은 블록을 저장한 경우
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[DocumentBlock.hash],
+                set_={"last_used_at": func.now()}
+            ))
+            inserted_bytes += sum(row["size_bytes"] for row in rows)
+
+        for digest, block in blocks.items():
+            self._cache_set(digest, block)
+        return inserted_bytes
+
+    async def load(self, db: AsyncSession, hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """해시 → 블록 (캐시에 없는 것만 한 번에 조회)"""
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for digest in set(hashes):
+            block = self._cache.get(digest)
+            if block is None:
+                missing.append(digest)
+            else:
+                self._cache.move_to_end(digest)
+                found[digest] = block
+        if missing:
+            result = await db.execute(
+                select(DocumentBlock.hash, DocumentBlock.content).where(DocumentBlock.hash.in_(missing))
+            )
+            for digest, content in result.all():
+                found[digest] = content
+                self._cache_set(digest, content)
+        return found
+
+    async def collect_garbage(self, batch_size: int = BLOCK_GC_BATCH_SIZE) -> Tuple[int, int]:
+        """
+        참조 없는 블록 삭제 (해시 순 배치, 배치마다 커밋)
+
+        Returns:
+            (삭제한 블록 수, 삭제한 바이트 수)
+        """
+        cutoff = datetime.now(timezone.utc) - self.grace
+        referenced = exists().where(
+            DocumentVersion.block_hashes.contains(array([DocumentBlock.hash]))
+        )
+        deleted_count = 0
+        deleted_bytes = 0
+        after = ""
+
+        while True:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(DocumentBlock.hash)
+                    .where(DocumentBlock.last_used_at < cutoff, DocumentBlock.hash > after)
+                    .order_by(DocumentBlock.hash)
+                    .limit(batch_size)
+                )
+                candidates = result.scalars().all()
+                if not candidates:
+                    break
+                after = candidates[-1]
+
+                # 조건 재확인: 그 사이 재사용(last_used_at 갱신)되었거나 참조가 생긴 블록은 남긴다
+                result = await session.execute(
+                    delete(DocumentBlock)
+                    .where(
+                        DocumentBlock.hash.in_(candidates),
+                        DocumentBlock.last_used_at < cutoff,
+                        ~referenced
+                    )
+                    .returning(DocumentBlock.hash, DocumentBlock.size_bytes)
+                )
+                rows = result.all()
+                await session.commit()
+
+            for digest, size_bytes in rows:
+                self._cache.pop(digest, None)
+                deleted_bytes += size_bytes
+            deleted_count += len(rows)
+
+        return deleted_count, deleted_bytes
+
+
+# 싱글톤 인스턴스
+block_store = BlockStore()
@@ -0,0 +1,42 @@
+"""
+문서 도메인 상수
+"""
+
+# 버전 저장: N 버전마다 전체 스냅샷(키프레임), 그 사이는 직전 버전 대비 구조적 델타
+VERSION_KEYFRAME_INTERVAL: int = 20
+
+# 델타 직렬화 크기가 전체 스냅샷의 이 비율 이상이면 델타 대신 키프레임으로 저장
+VERSION_DELTA_MAX_RATIO: float = 0.5
+
+# 같은 작성자의 자동 저장이 이 시간(초) 안에 이어지면 새 버전 대신 직전 자동 저장 버전을 갱신
+AUTOSAVE_COALESCE_SECONDS: int = 300
+
+# 자동 저장 버전 보존 정책 (수동 저장 버전과 문서별 최신 버전은 항상 보존)
+# - 최근 N 시간: 전부 보존
+# - 최근 N 일: 시간당 가장 마지막 버전 하나
+# - 최근 N 일: 일당 가장 마지막 버전 하나, 그 이전은 삭제
+VERSION_RETENTION_KEEP_ALL_HOURS: int = 1
+VERSION_RETENTION_HOURLY_DAYS: int = 1
+VERSION_RETENTION_DAILY_DAYS: int = 30
+# 정리 작업 한 트랜잭션에서 삭제할 버전 수
+VERSION_THINNING_BATCH_SIZE: int = 200
+
+# 버전 payload zstd 압축 (settings.VERSION_COMPRESSION_ENABLED 일 때)
+VERSION_COMPRESSION_LEVEL: int = 9
+# 공유 사전 크기 / 학습 표본 수 (scripts/db/compress_document_versions.py --train-dict)
+VERSION_COMPRESSION_DICT_SIZE: int = 32 * 1024
+VERSION_COMPRESSION_DICT_SAMPLES: int = 2000
+# 다른 프로세스가 새 사전을 학습했는지 확인하는 주기 (초)
+VERSION_COMPRESSION_DICT_REFRESH_SECONDS: int = 600
+# 저장 형식 변환 한 트랜잭션에서 처리할 버전 수
+VERSION_COMPRESSION_BATCH_SIZE: int = 500
+
+# 최근 복원(materialize)한 스냅샷 LRU 캐시 크기 (버전 수)
+VERSION_SNAPSHOT_CACHE_SIZE: int = 64
+
+# 블록 저장소: 최근 사용(버전 쓰기에서 재사용) 후 이 시간이 지나고 참조도 없는 블록만 GC
+BLOCK_GC_GRACE_HOURS: int = 24
+# GC 한 트랜잭션에서 검사/삭제할 블록 수
+BLOCK_GC_BATCH_SIZE: int = 1000
+# 해시 → 블록 내용 LRU (블록은 해시로 식별되므로 무효화 불필요)
+BLOCK_CACHE_SIZE: int = 20000
@@ -0,0 +1,96 @@
+"""
+문서 통계 (비정규화, 증분 유지)
+
+섹션 행은 자기 통계(블록/문자/단어/GRI 참조 코드 수)를, 문서 행은 섹션 수 + 섹션 통계 합계를 저장한다.
+섹션을 쓸 때마다 (새 섹션 통계 - 이전 섹션 통계) 만큼 문서 카운터를 SET x = x + delta 로 갱신하므로
+이전 blocks JSONB 를 다시 읽을 필요가 없고, 버전 저장/목록 조회는 문서 행 컬럼만 읽으면 된다.
+
+- 문자 수 = 블록 inline 텍스트 길이 (버전 비교의 chars_changed 와 같은 기준)
+- 단어 수 = 블록 inline 텍스트의 공백 구분 토큰 수
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from .models import Document
+from .version_diff import block_text
+
+# 섹션 행 통계 컬럼 (문서 행에는 같은 이름의 합계 컬럼 + section_count)
+SECTION_STAT_FIELDS = ("block_count", "char_count", "word_count", "gri_reference_count")
+DOCUMENT_STAT_FIELDS = ("section_count",) + SECTION_STAT_FIELDS
+
+
+def block_stats(blocks: Optional[List[Any]]) -> Dict[str, int]:
+    """블록 목록의 블록/문자/단어 수"""
+    blocks = blocks or []
+    chars = 0
+    words = 0
+    for block in blocks:
+        text = block_text(block)
+        chars += len(text)
+        words += len(text.split())
+    return {"block_count": len(blocks), "char_count": chars, "word_count": words}
+
+
+def gri_reference_count(gri_reference: Optional[List[Any]]) -> int:
+    """GRI/SASB/... 참조 코드 수 (참조마다 code 목록 길이 합)"""
+    count = 0
+    for ref in gri_reference or []:
+        if isinstance(ref, dict):
+            codes = ref.get("code")
+            count += len(codes) if isinstance(codes, list) else 1 if codes else 0
+    return count
+
+
+def section_stats(values: Dict[str, Any]) -> Dict[str, int]:
+    """Section 컬럼 값 (blocks, gri_reference) → 섹션 통계 컬럼 값"""
+    stats = block_stats(values.get("blocks"))
+    stats["gri_reference_count"] = gri_reference_count(values.get("gri_reference"))
+    return stats
+
+
+def updated_section_stats(old: Dict[str, int], changes: Dict[str, Any]) -> Dict[str, int]:
+    """이전 섹션 통계 + 변경 컬럼 값 → 새 섹션 통계 (바뀐 컬럼만 다시 계산)"""
+    stats = dict(old)
+    if "blocks" in changes:
+        stats.update(block_stats(changes["blocks"]))
+    if "gri_reference" in changes:
+        stats["gri_reference_count"] = gri_reference_count(changes["gri_reference"])
+    return stats
+
+
+def document_totals(sections: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """섹션 통계 목록 → 문서 통계 컬럼 값 (전체 재계산)"""
+    totals = dict.fromkeys(DOCUMENT_STAT_FIELDS, 0)
+    for stats in sections:
+        totals["section_count"] += 1
+        for field in SECTION_STAT_FIELDS:
+            totals[field] += stats.get(field) or 0
+    return totals
+
+
+class StatsDelta:
+    """문서 통계 증감 누적 (섹션 추가/변경/삭제)"""
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = dict.fromkeys(DOCUMENT_STAT_FIELDS, 0)
+
+    def add(self, stats: Dict[str, int]) -> None:
+        self.values["section_count"] += 1
+        self.change({}, stats)
+
+    def remove(self, stats: Dict[str, int]) -> None:
+        self.values["section_count"] -= 1
+        self.change(stats, {})
+
+    def change(self, old: Dict[str, int], new: Dict[str, int]) -> None:
+        for field in SECTION_STAT_FIELDS:
+            self.values[field] += (new.get(field) or 0) - (old.get(field) or 0)
+
+    def increments(self) -> Dict[str, Any]:
+        """update(Document).values(...) 용 SET x = x + delta (변화 없는 컬럼 제외)"""
+        return {
+            field: getattr(Document, field) + delta
+            for field, delta in self.values.items()
+            if delta
+        }
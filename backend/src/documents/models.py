@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, UniqueConstraint, Index, DateTime, LargeBinary
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.sql import func
 from src.shared.models import Base, TimestampMixin
 from src.auth.models import User
 
@@ -15,10 +16,22 @@ class Document(Base, TimestampMixin):
     is_public = Column(Boolean, default=False, nullable=False, index=True)
     is_template = Column(Boolean, default=False, nullable=False, index=True)
     
+    # ✅ 문서 통계 (섹션 쓰기 시 증분 갱신, document_stats.py) - 버전 저장/목록 조회는 컬럼만 읽음
+    section_count = Column(Integer, default=0, server_default="0", nullable=False)
+    block_count = Column(Integer, default=0, server_default="0", nullable=False)
+    char_count = Column(Integer, default=0, server_default="0", nullable=False)
+    word_count = Column(Integer, default=0, server_default="0", nullable=False)
+    gri_reference_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     user = relationship("User")
     sections = relationship("Section", back_populates="document", cascade="all, delete-orphan", order_by="Section.order")
     versions = relationship("DocumentVersion", back_populates="document", cascade="all, delete-orphan", order_by="desc(DocumentVersion.created_at)")
     
+    # 목록 키셋 페이지네이션: updated_at 최신순 + id
+    __table_args__ = (
+        Index('idx_documents_updated_at_id', 'updated_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Document(id={self.id}, title={self.title})>"
 
@@ -39,12 +52,45 @@ class Section(Base, TimestampMixin):
     # metadata는 SQLAlchemy 예약어이므로 section_metadata로 저장, Pydantic에서 alias 처리
     section_metadata = Column("metadata", JSONB, nullable=True)
     
+    # ✅ 섹션 통계 (문서 통계 증분 계산 시 이전 값으로 사용, blocks 를 다시 읽지 않음)
+    block_count = Column(Integer, default=0, server_default="0", nullable=False)
+    char_count = Column(Integer, default=0, server_default="0", nullable=False)
+    word_count = Column(Integer, default=0, server_default="0", nullable=False)
+    gri_reference_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     document = relationship("Document", back_populates="sections")
     
     def __repr__(self):
         return f"<Section(id={self.id}, title={self.title})>"
 
 
+class DocumentBlockText(Base):
+    """
+    블록 검색 텍스트 (블록당 한 행, inline 텍스트를 평탄화)
+
+    섹션 쓰기 시 해당 섹션 행만 증분 갱신하고 (search_index.py), 섹션/문서 삭제는 FK CASCADE 로 정리된다.
+    """
+    __tablename__ = "document_block_texts"
+    
+    section_id = Column(Integer, ForeignKey("sections.id", ondelete="CASCADE"), primary_key=True)
+    block_id = Column(String(255), primary_key=True)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
+    position = Column(Integer, nullable=False, default=0)  # 섹션 내 블록 위치
+    block_type = Column(String(50), nullable=True)
+    text = Column(Text, nullable=False)
+    
+    # 부분 문자열 검색 (ILIKE) - 한국어는 형태소 사전이 없어 tsvector 대신 트라이그램 사용
+    __table_args__ = (
+        Index(
+            'ix_document_block_texts_text_trgm', 'text',
+            postgresql_using='gin', postgresql_ops={'text': 'gin_trgm_ops'},
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<DocumentBlockText(section_id={self.section_id}, block_id={self.block_id})>"
+
+
 class DocumentVersion(Base, TimestampMixin):
     """문서 버전 스냅샷 테이블"""
     __tablename__ = "document_versions"
@@ -59,7 +105,22 @@ class DocumentVersion(Base, TimestampMixin):
     is_auto_saved = Column(Boolean, default=False, nullable=False, index=True)  # 자동/수동 저장 구분
     
     # 스냅샷 데이터 (JSONB for PostgreSQL 최적화)
-    snapshot_data = Column(JSONB, nullable=False)  # ✅ 전체 DocumentNode JSON
+    # ✅ 키프레임: snapshot_data 에 전체 DocumentNode JSON, base_version_number = NULL
+    # ✅ 델타: delta_data 에 base_version_number 버전 대비 섹션/블록 델타 (version_delta.py)
+    snapshot_data = Column(JSONB(none_as_null=True), nullable=True)
+    delta_data = Column(JSONB(none_as_null=True), nullable=True)
+    base_version_number = Column(Integer, nullable=True)
+    
+    # ✅ 압축 저장 형식 (version_compression.py): 키프레임/델타 payload 의 zstd 압축 정규 JSON
+    #    이 값이 있으면 snapshot_data / delta_data 는 비어 있고, 스냅샷 복원 시에만 해제한다
+    payload_zstd = Column(LargeBinary, nullable=True)
+    payload_dict_id = Column(Integer, ForeignKey("version_compression_dicts.id"), nullable=True)
+    
+    # ✅ 스냅샷/델타의 블록은 document_blocks 해시 참조 ({"$h": 해시}), 이 행이 참조하는 해시 목록 (GC 용)
+    block_hashes = Column(ARRAY(String(32)), nullable=True)
+    
+    # ✅ 섹션/블록 머클 해시 트리 (version_diff.py) - 버전 비교 시 동일 섹션은 해시만 비교
+    content_tree = Column(JSONB(none_as_null=True), nullable=True)
     
     # 변경 통계 (Optional, 성능 최적화용)
     sections_count = Column(Integer, default=0)
@@ -74,7 +135,42 @@ class DocumentVersion(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint('document_id', 'version_number', name='uq_document_version_number'),
         Index('idx_document_versions_document_created', 'document_id', 'created_at'),
+        Index('idx_document_versions_block_hashes', 'block_hashes', postgresql_using='gin'),
     )
     
     def __repr__(self):
         return f"<DocumentVersion(id={self.id}, doc_id={self.document_id}, v{self.version_number})>"
+
+
+class VersionCompressionDict(Base):
+    """버전 payload zstd 공유 사전 (가장 최근 사전으로 압축, 행마다 사용한 사전 ID 기록)"""
+    __tablename__ = "version_compression_dicts"
+    
+    id = Column(Integer, primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    sample_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<VersionCompressionDict(id={self.id}, size={self.size_bytes})>"
+
+
+class DocumentBlock(Base):
+    """
+    내용 주소 블록 저장소 (버전 스냅샷이 공유)
+
+    같은 블록(정규화 JSON 이 같은 블록)은 버전/문서가 달라도 한 행만 저장된다.
+    어떤 버전도 참조하지 않는 블록은 GC 작업이 삭제한다 (block_store.py).
+    """
+    __tablename__ = "document_blocks"
+    
+    hash = Column(String(32), primary_key=True)  # 정규화 JSON 의 BLAKE2b-128 (hex)
+    content = Column(JSONB, nullable=False)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # 마지막으로 버전 쓰기에서 재사용된 시각 (GC 유예 기간 판단)
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<DocumentBlock(hash={self.hash}, size={self.size_bytes})>"
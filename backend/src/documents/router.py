@@ -3,11 +3,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from src.core.database import get_db
+from src.shared.pagination import InvalidCursorError
 from .service import DocumentService
 from .schemas import (
     DocumentCreate, DocumentUpdate, DocumentResponse, DocumentListResponse,
     DocumentListPaginatedResponse,
     DocumentBulkUpdate, DocumentBulkUpdateResponse,
+    DocumentClone,
+    DocumentPatch, DocumentPatchResponse,
+    DocumentSearchResponse,
     SectionCreate, SectionUpdate, SectionResponse
 )
 
@@ -45,6 +49,7 @@ async def list_documents(
     is_public: Optional[bool] = Query(None, description="공개 문서만 조회"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 skip 무시)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -53,16 +58,21 @@ async def list_documents(
     - **user_id**: 특정 사용자의 문서만 조회
     - **is_template**: true면 템플릿만, false면 일반 문서만
     - **is_public**: true면 공개 문서만, false면 비공개 문서만
-    - 페이지네이션 메타데이터 포함 (total, skip, limit, has_next)
+    - **cursor**: 커서 페이지네이션 (updated_at 최신순)
+    - 페이지네이션 메타데이터 포함 (total, skip, limit, has_next, next_cursor)
     """
     service = DocumentService(db)
-    documents = await service.list_documents(
-        user_id=user_id,
-        is_template=is_template,
-        is_public=is_public,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        rows, has_next, next_cursor = await service.list_documents(
+            user_id=user_id,
+            is_template=is_template,
+            is_public=is_public,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     # 전체 문서 수 조회
     total = await service.count_documents(
@@ -71,31 +81,37 @@ async def list_documents(
         is_public=is_public
     )
     
-    # 섹션 개수 계산
-    result = []
-    for doc in documents:
-        doc_dict = {
-            "id": doc.id,
-            "user_id": doc.user_id,
-            "title": doc.title,
-            "description": doc.description,
-            "is_public": doc.is_public,
-            "is_template": doc.is_template,
-            "created_at": doc.created_at,
-            "updated_at": doc.updated_at,
-            "section_count": len(doc.sections) if hasattr(doc, 'sections') else 0
-        }
-        result.append(DocumentListResponse(**doc_dict))
-    
     return DocumentListPaginatedResponse(
-        documents=result,
+        documents=[DocumentListResponse.model_validate(row) for row in rows],
         total=total,
         skip=skip,
         limit=limit,
-        has_next=(skip + limit) < total
+        has_next=has_next,
+        next_cursor=next_cursor
     )
 
 
+@router.get("/search", response_model=DocumentSearchResponse)
+async def search_documents(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백 구분, 모두 포함)"),
+    user_id: Optional[int] = Query(None, description="사용자 ID 필터"),
+    is_template: Optional[bool] = Query(None, description="템플릿만 / 일반 문서만"),
+    is_public: Optional[bool] = Query(None, description="공개 문서만 / 비공개 문서만"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    문서 블록 본문 검색
+    
+    - **q**: 검색어 (예: "Scope 3"), 대소문자 무시 부분 일치
+    - 결과는 문서 / 섹션 / 블록 단위 히트 + 하이라이트 스니펫 (관련도 순)
+    - 섹션 저장 시 증분 갱신되는 검색 색인을 조회하므로 문서 본문을 읽지 않음
+    """
+    service = DocumentService(db)
+    return await service.search_blocks(q, user_id, is_template, is_public, skip, limit)
+
+
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: int,
@@ -183,6 +199,44 @@ async def bulk_update_document(
     )
 
 
+@router.post("/{document_id}/clone", response_model=DocumentListResponse, status_code=status.HTTP_201_CREATED)
+async def clone_document(
+    document_id: int,
+    data: DocumentClone,
+    user_id: Optional[int] = Query(None, description="새 문서 소유자 (OAuth 추후 구현)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    문서 복제 (템플릿으로 새 보고서 만들기)
+    
+    - **document_id**: 원본 문서(템플릿) ID
+    - **section_ids** / **categories**: 지정 시 해당 섹션만 복사 (E/S/G/General)
+    - 섹션/블록은 서버에서 행 단위로 복사하므로 클라이언트가 템플릿을 조회해 다시 보낼 필요 없음
+    - 응답은 새 문서 메타데이터 + 통계 (섹션 본문은 GET /documents/{id} 로 조회)
+    """
+    service = DocumentService(db)
+    row = await service.clone_document(document_id, user_id, data)
+    return DocumentListResponse.model_validate(row)
+
+
+@router.patch("/{document_id}/sections", response_model=DocumentPatchResponse)
+async def patch_document(
+    document_id: int,
+    data: DocumentPatch,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    문서 증분 저장 (바뀐 섹션/블록만 op 목록으로 전송)
+    
+    - **ops**: add_section / remove_section / move_section / update_section,
+      insert_block / update_block / remove_block / move_block (순서대로 단일 트랜잭션 적용)
+    - **expected_updated_at**: 섹션 op 에 지정하면 그 사이 다른 저장이 있었을 때 409
+    - 응답은 변경된 섹션 ID 와 updated_at 스탬프만 포함 (문서 전체 재조회 없음)
+    """
+    service = DocumentService(db)
+    return await service.patch_document(document_id, data)
+
+
 # ====================================
 # Section Endpoints
 # ====================================
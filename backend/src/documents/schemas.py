@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Literal, Union
+from typing import List, Optional, Dict, Any, Literal, Union, Annotated
 from datetime import datetime
 
 
@@ -168,6 +168,11 @@ class DocumentResponse(DocumentBase):
     sections: List[SectionResponse] = []
     created_at: datetime
     updated_at: datetime
+    section_count: int = 0
+    block_count: int = 0
+    char_count: int = 0
+    word_count: int = 0
+    gri_reference_count: int = 0
     
     class Config:
         from_attributes = True
@@ -179,7 +184,12 @@ class DocumentListResponse(DocumentBase):
     user_id: Optional[int]
     created_at: datetime
     updated_at: datetime
+    # 문서 통계 (documents 행 비정규화 컬럼)
     section_count: int = 0
+    block_count: int = 0
+    char_count: int = 0
+    word_count: int = 0
+    gri_reference_count: int = 0
     
     class Config:
         from_attributes = True
@@ -192,6 +202,7 @@ class DocumentListPaginatedResponse(BaseModel):
     skip: int
     limit: int
     has_next: bool
+    next_cursor: Optional[str] = None  # ✅ 키셋 페이지네이션 (updated_at, id)
 
 
 # ============================================
@@ -215,3 +226,138 @@ class DocumentBulkUpdateResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+# ============================================
+# Clone Schema (템플릿 → 문서, 서버 측 복사)
+# ============================================
+
+class DocumentClone(BaseModel):
+    """문서 복제 요청 (섹션/블록은 서버에서 행 단위 복사, 필터 미지정 시 전체 섹션)"""
+    title: Optional[str] = Field(None, min_length=1, max_length=255)  # 생략 시 원본 제목
+    description: Optional[str] = None  # 생략 시 원본 설명
+    is_public: bool = Field(default=False)
+    is_template: bool = Field(default=False)
+    section_ids: Optional[List[int]] = None  # 복사할 섹션 ID (원본 문서에 없는 ID 는 무시)
+    categories: Optional[List[Literal['E', 'S', 'G', 'General']]] = None  # 섹션 metadata.category 필터
+
+
+# ============================================
+# Patch Schema (증분 저장)
+# ============================================
+
+class _SectionPatchOpBase(BaseModel):
+    """기존 섹션 대상 op 공통 필드"""
+    section_id: int
+    # 클라이언트가 마지막으로 본 섹션 updated_at (다르면 409, 생략 시 검사 안 함)
+    expected_updated_at: Optional[datetime] = None
+
+
+class AddSectionOp(BaseModel):
+    """섹션 추가"""
+    op: Literal['add_section']
+    section: SectionCreate
+    client_id: Optional[str] = None  # 응답에서 새 섹션 ID 와 매칭용
+
+
+class RemoveSectionOp(_SectionPatchOpBase):
+    """섹션 삭제"""
+    op: Literal['remove_section']
+
+
+class MoveSectionOp(_SectionPatchOpBase):
+    """섹션 순서 변경"""
+    op: Literal['move_section']
+    order: int = Field(..., ge=0)
+
+
+class UpdateSectionOp(_SectionPatchOpBase):
+    """섹션 필드 변경 (changes.blocks 지정 시 블록 목록 전체 교체)"""
+    op: Literal['update_section']
+    changes: SectionUpdate
+
+
+class InsertBlockOp(_SectionPatchOpBase):
+    """블록 삽입 (index 생략 시 끝에 추가)"""
+    op: Literal['insert_block']
+    block: BlockNode
+    index: Optional[int] = Field(None, ge=0)
+
+
+class UpdateBlockOp(_SectionPatchOpBase):
+    """블록 교체 (block.id 로 대상 식별)"""
+    op: Literal['update_block']
+    block: BlockNode
+
+
+class RemoveBlockOp(_SectionPatchOpBase):
+    """블록 삭제"""
+    op: Literal['remove_block']
+    block_id: str
+
+
+class MoveBlockOp(_SectionPatchOpBase):
+    """블록 위치 변경 (같은 섹션 내)"""
+    op: Literal['move_block']
+    block_id: str
+    index: int = Field(..., ge=0)
+
+
+DocumentPatchOp = Annotated[
+    Union[
+        AddSectionOp, RemoveSectionOp, MoveSectionOp, UpdateSectionOp,
+        InsertBlockOp, UpdateBlockOp, RemoveBlockOp, MoveBlockOp,
+    ],
+    Field(discriminator='op')
+]
+
+
+class DocumentPatch(BaseModel):
+    """문서 증분 저장 (바뀐 섹션/블록만 op 목록으로 전송, 순서대로 적용)"""
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    is_public: Optional[bool] = None
+    is_template: Optional[bool] = None
+    ops: List[DocumentPatchOp] = Field(default_factory=list)
+
+
+class SectionStamp(BaseModel):
+    """변경된 섹션 ID + 버전 스탬프 (updated_at)"""
+    id: int
+    updated_at: datetime
+    client_id: Optional[str] = None  # add_section 으로 생성된 경우
+
+
+class DocumentPatchResponse(BaseModel):
+    """증분 저장 응답 (문서 전체 대신 변경된 섹션 스탬프만)"""
+    success: bool
+    document_id: int
+    updated_at: datetime
+    sections: List[SectionStamp] = []
+    removed_section_ids: List[int] = []
+
+
+# ============================================
+# Search Schema (블록 전문 검색)
+# ============================================
+
+class DocumentSearchHit(BaseModel):
+    """검색 결과 블록 (문서 / 섹션 / 블록 위치 + 하이라이트 스니펫)"""
+    document_id: int
+    document_title: str
+    section_id: int
+    section_title: str
+    block_id: str
+    block_type: Optional[str] = None
+    position: int
+    snippet: Optional[str] = None  # HTML 이스케이프 + <mark> 하이라이트
+    rank: float
+
+
+class DocumentSearchResponse(BaseModel):
+    """블록 검색 응답"""
+    query: str
+    hits: List[DocumentSearchHit]
+    skip: int
+    limit: int
+    has_next: bool
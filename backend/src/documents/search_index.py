@@ -0,0 +1,101 @@
+"""
+문서 블록 검색 색인 (document_block_texts)
+
+섹션 블록의 inline 텍스트(리스트 항목 포함)를 블록당 한 행으로 평탄화해 트라이그램 GIN 인덱스로 검색한다.
+섹션을 쓸 때 그 섹션의 행만 갱신하며, 문서 전체를 다시 색인하지 않는다.
+
+- 새 섹션: INSERT 만
+- 기존 섹션: INSERT ... ON CONFLICT DO UPDATE (텍스트/위치/타입이 같으면 갱신 생략 → 인덱스 쓰기 없음)
+  + 사라진 블록 행 DELETE
+- 섹션/문서 삭제: FK ON DELETE CASCADE
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import DocumentBlockText
+
+# 한 INSERT 문에 담을 행 수 (바인드 파라미터 수 제한 대비)
+_INSERT_CHUNK_SIZE = 1000
+
+
+def _inline_text(nodes: Any) -> str:
+    if not isinstance(nodes, list):
+        return ""
+    return "".join(node.get("text", "") for node in nodes if isinstance(node, dict))
+
+
+def block_search_text(block: Dict[str, Any]) -> str:
+    """블록 검색 텍스트: content inline 텍스트 + 리스트 항목 텍스트 (항목은 줄바꿈 구분)"""
+    parts = [_inline_text(block.get("content"))]
+    children = block.get("children")
+    if isinstance(children, list):
+        parts.extend(_inline_text(item.get("content")) for item in children if isinstance(item, dict))
+    return "\n".join(part for part in parts if part).strip()
+
+
+def section_search_rows(document_id: int, section_id: int, blocks: Iterable[Any]) -> List[Dict[str, Any]]:
+    """섹션 블록 → 검색 행 (텍스트 없는 블록 제외, 같은 블록 id 는 첫 블록만)"""
+    rows = []
+    seen = set()
+    for position, block in enumerate(blocks or []):
+        if not isinstance(block, dict):
+            continue
+        block_id = str(block.get("id") or f"#{position}")
+        text = block_search_text(block)
+        if not text or block_id in seen:
+            continue
+        seen.add(block_id)
+        rows.append({
+            "section_id": section_id,
+            "block_id": block_id,
+            "document_id": document_id,
+            "position": position,
+            "block_type": block.get("blockType"),
+            "text": text,
+        })
+    return rows
+
+
+async def index_sections(
+    db: AsyncSession,
+    document_id: int,
+    sections: Iterable[Tuple[int, List[Any]]],
+    replace: bool = True
+) -> None:
+    """
+    섹션 (ID, blocks) 목록의 검색 행 반영 (커밋은 호출자)
+
+    replace=False 는 방금 생성한 섹션 (기존 행 없음, 충돌/삭제 처리 생략)
+    """
+    rows: List[Dict[str, Any]] = []
+    for section_id, blocks in sections:
+        section_rows = section_search_rows(document_id, section_id, blocks)
+        rows.extend(section_rows)
+        if replace:
+            await db.execute(
+                delete(DocumentBlockText).where(
+                    DocumentBlockText.section_id == section_id,
+                    DocumentBlockText.block_id.not_in([row["block_id"] for row in section_rows])
+                )
+            )
+
+    for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+        stmt = pg_insert(DocumentBlockText).values(rows[start:start + _INSERT_CHUNK_SIZE])
+        if replace:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DocumentBlockText.section_id, DocumentBlockText.block_id],
+                set_={
+                    "position": stmt.excluded.position,
+                    "block_type": stmt.excluded.block_type,
+                    "text": stmt.excluded.text,
+                },
+                where=or_(
+                    DocumentBlockText.text.is_distinct_from(stmt.excluded.text),
+                    DocumentBlockText.position.is_distinct_from(stmt.excluded.position),
+                    DocumentBlockText.block_type.is_distinct_from(stmt.excluded.block_type),
+                )
+            )
+        await db.execute(stmt)
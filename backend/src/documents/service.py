@@ -1,14 +1,104 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import Boolean, Integer, String, Text, select, delete, func, insert, literal, true, update
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import HTTPException, status
 
-from .models import Document, Section
+from .document_stats import (
+    DOCUMENT_STAT_FIELDS, SECTION_STAT_FIELDS, StatsDelta, document_totals, section_stats, updated_section_stats
+)
+from .models import Document, DocumentBlockText, Section
 from .schemas import (
-    DocumentCreate, DocumentUpdate, DocumentBulkUpdate,
+    DocumentCreate, DocumentUpdate, DocumentBulkUpdate, DocumentClone, DocumentPatch,
     SectionCreate, SectionUpdate
 )
+from .search_index import index_sections
+from ..shared.pagination import decode_cursor, encode_cursor, keyset_condition, keyset_order
+from ..shared.utils import build_highlight, escape_like, split_search_terms
+
+# 목록 조회 컬럼 (섹션/블록 JSONB 제외)
+DOCUMENT_LIST_COLUMNS = (
+    Document.id,
+    Document.user_id,
+    Document.title,
+    Document.description,
+    Document.is_public,
+    Document.is_template,
+    Document.created_at,
+    Document.updated_at,
+    Document.section_count,
+    Document.block_count,
+    Document.char_count,
+    Document.word_count,
+    Document.gri_reference_count,
+)
+
+# 목록 커서 정렬 키
+_LIST_CURSOR_SORT = "updated_at"
+
+# blocks 를 읽어야 하는 patch op
+_BLOCK_OPS = frozenset({"insert_block", "update_block", "remove_block", "move_block"})
+
+
+def _section_values(data: SectionCreate) -> Dict[str, Any]:
+    """SectionCreate → Section 컬럼 값 (섹션 통계 포함)"""
+    values = {
+        "title": data.title,
+        "description": data.description,
+        "order": data.order,
+        "blocks": [block.model_dump() for block in data.blocks],
+        "gri_reference": [ref.model_dump() for ref in data.griReference] if data.griReference else None,
+        "section_metadata": data.metadata.model_dump() if data.metadata else None,
+    }
+    values.update(section_stats(values))
+    return values
+
+
+def _stats_of(section: Section) -> Dict[str, int]:
+    return {field: getattr(section, field) or 0 for field in SECTION_STAT_FIELDS}
+
+
+def _section_changes(data: SectionUpdate) -> Dict[str, Any]:
+    """SectionUpdate (부분 업데이트) → 변경할 Section 컬럼 값"""
+    update_data = data.model_dump(exclude_unset=True)
+    if "griReference" in update_data:
+        update_data["gri_reference"] = update_data.pop("griReference")
+    if "metadata" in update_data:
+        update_data["section_metadata"] = update_data.pop("metadata")
+    # NOT NULL 컬럼에 null 이 오면 변경하지 않는다
+    for key in ("title", "order", "blocks"):
+        if key in update_data and update_data[key] is None:
+            del update_data[key]
+    return update_data
+
+
+def _block_index(blocks: List[Any], block_id: str) -> int:
+    for i, block in enumerate(blocks):
+        if isinstance(block, dict) and block.get("id") == block_id:
+            return i
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Block {block_id} not found"
+    )
+
+
+def _apply_block_op(blocks: List[Any], op) -> None:
+    """블록 op 를 섹션 블록 목록에 제자리 적용"""
+    if op.op == "insert_block":
+        if any(isinstance(block, dict) and block.get("id") == op.block.id for block in blocks):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Block {op.block.id} already exists in section {op.section_id}"
+            )
+        index = len(blocks) if op.index is None else min(op.index, len(blocks))
+        blocks.insert(index, op.block.model_dump())
+    elif op.op == "update_block":
+        blocks[_block_index(blocks, op.block.id)] = op.block.model_dump()
+    elif op.op == "remove_block":
+        del blocks[_block_index(blocks, op.block_id)]
+    elif op.op == "move_block":
+        block = blocks.pop(_block_index(blocks, op.block_id))
+        blocks.insert(min(op.index, len(blocks)), block)
 
 
 class DocumentService:
@@ -27,27 +117,23 @@ class DocumentService:
         data: DocumentCreate
     ) -> Document:
         """문서 생성 (중첩 구조 지원)"""
+        section_values = [_section_values(section_data) for section_data in data.sections]
         document = Document(
             user_id=user_id,
             title=data.title,
             description=data.description,
             is_public=data.is_public,
-            is_template=data.is_template
+            is_template=data.is_template,
+            **document_totals(section_values)
         )
         
         # Section 생성 (blocks를 JSON으로 저장)
-        for section_data in data.sections:
-            section = Section(
-                title=section_data.title,
-                description=section_data.description,
-                order=section_data.order,
-                blocks=[block.model_dump() for block in section_data.blocks],
-                gri_reference=[ref.model_dump() for ref in section_data.griReference] if section_data.griReference else None,
-                section_metadata=section_data.metadata.model_dump() if section_data.metadata else None
-            )
-            document.sections.append(section)
+        for values in section_values:
+            document.sections.append(Section(**values))
         
         self.db.add(document)
+        await self.db.flush()
+        await index_sections(self.db, document.id, [(section.id, section.blocks) for section in document.sections], replace=False)
         await self.db.commit()
         await self.db.refresh(document)
         
@@ -66,29 +152,130 @@ class DocumentService:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def _document_filters(
+        user_id: Optional[int] = None,
+        is_template: Optional[bool] = None,
+        is_public: Optional[bool] = None
+    ) -> list:
+        conditions = []
+        if user_id is not None:
+            conditions.append(Document.user_id == user_id)
+        if is_template is not None:
+            conditions.append(Document.is_template == is_template)
+        if is_public is not None:
+            conditions.append(Document.is_public == is_public)
+        return conditions
+    
     async def list_documents(
         self,
         user_id: Optional[int] = None,
         is_template: Optional[bool] = None,
         is_public: Optional[bool] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Document]:
-        """문서 목록 조회"""
-        stmt = select(Document).options(selectinload(Document.sections))
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[list, bool, Optional[str]]:
+        """
+        문서 목록 조회 (문서 컬럼 + 섹션 수만, 섹션/블록 JSONB 는 읽지 않음)
         
-        # 필터링
-        if user_id is not None:
-            stmt = stmt.where(Document.user_id == user_id)
-        if is_template is not None:
-            stmt = stmt.where(Document.is_template == is_template)
-        if is_public is not None:
-            stmt = stmt.where(Document.is_public == is_public)
+        - updated_at 최신순, cursor 지정 시 (updated_at, id) 키셋 페이지네이션 (skip 무시)
+        - section_count 등 통계는 문서 행의 비정규화 컬럼 (섹션 테이블을 읽지 않음)
+        
+        Returns:
+            (행 목록, 다음 페이지 존재 여부, 다음 페이지 커서)
+        
+        Raises:
+            InvalidCursorError: 커서를 해석할 수 없을 때
+        """
+        stmt = (
+            select(*DOCUMENT_LIST_COLUMNS)
+            .where(*self._document_filters(user_id, is_template, is_public))
+            .order_by(*keyset_order(Document.updated_at, Document.id))
+        )
+        if cursor:
+            updated_at, document_id = decode_cursor(cursor, _LIST_CURSOR_SORT)
+            stmt = stmt.where(keyset_condition(Document.updated_at, Document.id, updated_at, document_id))
+        else:
+            stmt = stmt.offset(skip)
+        
+        # limit + 1 건 조회로 다음 페이지 존재 여부 판단
+        result = await self.db.execute(stmt.limit(limit + 1))
+        rows = result.all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        
+        next_cursor = None
+        if has_next and rows:
+            next_cursor = encode_cursor(_LIST_CURSOR_SORT, rows[-1].updated_at, rows[-1].id)
+        return rows, has_next, next_cursor
+    
+    async def search_blocks(
+        self,
+        query: str,
+        user_id: Optional[int] = None,
+        is_template: Optional[bool] = None,
+        is_public: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        블록 텍스트 검색 (document_block_texts 트라이그램 인덱스, 섹션 blocks JSONB 는 읽지 않음)
         
-        stmt = stmt.offset(skip).limit(limit).order_by(Document.updated_at.desc())
+        - 모든 검색어를 포함하는 블록 (대소문자 무시 부분 일치)
+        - word_similarity 관련도 순, 같으면 문서 / 섹션 / 블록 위치 순
+        - 블록 전체 텍스트 대신 검색어 하이라이트 스니펫만 반환
+        """
+        terms = split_search_terms(query)
+        if not terms:
+            return {"query": query, "hits": [], "skip": skip, "limit": limit, "has_next": False}
         
+        rank = func.word_similarity(query, DocumentBlockText.text).label("rank")
+        stmt = (
+            select(
+                DocumentBlockText.document_id,
+                Document.title.label("document_title"),
+                DocumentBlockText.section_id,
+                Section.title.label("section_title"),
+                DocumentBlockText.block_id,
+                DocumentBlockText.block_type,
+                DocumentBlockText.position,
+                DocumentBlockText.text,
+                rank,
+            )
+            .join(Document, Document.id == DocumentBlockText.document_id)
+            .join(Section, Section.id == DocumentBlockText.section_id)
+            .where(
+                *(DocumentBlockText.text.ilike(f"%{escape_like(term)}%", escape="\\") for term in terms),
+                *self._document_filters(user_id, is_template, is_public)
+            )
+            .order_by(
+                rank.desc(),
+                DocumentBlockText.document_id,
+                Section.order,
+                DocumentBlockText.position
+            )
+            .offset(skip)
+            .limit(limit + 1)
+        )
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        rows = result.all()
+        
+        hits = [
+            {
+                "document_id": row.document_id,
+                "document_title": row.document_title,
+                "section_id": row.section_id,
+                "section_title": row.section_title,
+                "block_id": row.block_id,
+                "block_type": row.block_type,
+                "position": row.position,
+                "snippet": build_highlight(row.text, terms),
+                "rank": row.rank,
+            }
+            for row in rows[:limit]
+        ]
+        return {"query": query, "hits": hits, "skip": skip, "limit": limit, "has_next": len(rows) > limit}
     
     async def count_documents(
         self,
@@ -97,16 +284,9 @@ class DocumentService:
         is_public: Optional[bool] = None
     ) -> int:
         """문서 개수 조회 (필터 적용)"""
-        stmt = select(func.count(Document.id))
-        
-        # 필터링
-        if user_id is not None:
-            stmt = stmt.where(Document.user_id == user_id)
-        if is_template is not None:
-            stmt = stmt.where(Document.is_template == is_template)
-        if is_public is not None:
-            stmt = stmt.where(Document.is_public == is_public)
-        
+        stmt = select(func.count(Document.id)).where(
+            *self._document_filters(user_id, is_template, is_public)
+        )
         result = await self.db.execute(stmt)
         return result.scalar_one()
     
@@ -174,25 +354,293 @@ class DocumentService:
             delete(Section).where(Section.document_id == document_id)
         )
         
-        # 새 섹션 생성
-        for section_data in data.sections:
-            section = Section(
-                document_id=document_id,
-                title=section_data.title,
-                description=section_data.description,
-                order=section_data.order,
-                blocks=[block.model_dump() for block in section_data.blocks],
-                gri_reference=[ref.model_dump() for ref in section_data.griReference] if section_data.griReference else None,
-                section_metadata=section_data.metadata.model_dump() if section_data.metadata else None
-            )
-            document.sections.append(section)
+        # 새 섹션 생성 (통계는 전체 재계산)
+        section_values = [_section_values(section_data) for section_data in data.sections]
+        for field, value in document_totals(section_values).items():
+            setattr(document, field, value)
+        new_sections = [Section(document_id=document_id, **values) for values in section_values]
+        document.sections.extend(new_sections)
         
+        # 기존 섹션 검색 행은 CASCADE 로 삭제됨
+        await self.db.flush()
+        await index_sections(self.db, document_id, [(section.id, section.blocks) for section in new_sections], replace=False)
         await self.db.commit()
         await self.db.refresh(document)
         
         # 관계 재로드
         return await self.get_document(document_id)
     
+    # ====================================
+    # Clone (서버 측 복사)
+    # ====================================
+    
+    async def clone_document(
+        self,
+        document_id: int,
+        user_id: Optional[int],
+        data: DocumentClone
+    ):
+        """
+        문서 복제 (템플릿 → 새 보고서): INSERT ... SELECT 3회, 단일 트랜잭션
+        
+        - 섹션 blocks / gri_reference / metadata JSONB 는 DB 안에서 그대로 복사 (애플리케이션으로 읽지 않음)
+        - section_ids / categories 지정 시 해당 섹션만 복사, order 는 0 부터 다시 매김
+        - 문서 통계는 복사되는 섹션의 통계 컬럼 합계, 검색 행도 원본 행에서 복사 (텍스트 재추출 없음)
+        
+        Returns:
+            새 문서 목록 행 (DOCUMENT_LIST_COLUMNS)
+        """
+        section_filters = [Section.document_id == document_id]
+        if data.section_ids is not None:
+            section_filters.append(Section.id.in_(data.section_ids))
+        if data.categories is not None:
+            section_filters.append(Section.section_metadata["category"].astext.in_(data.categories))
+        
+        # 1. 문서 행 복사 (통계 = 복사 대상 섹션 합계)
+        totals = (
+            select(
+                func.count(Section.id).label("section_count"),
+                *(func.coalesce(func.sum(getattr(Section, field)), 0).label(field) for field in SECTION_STAT_FIELDS)
+            )
+            .where(*section_filters)
+            .subquery()
+        )
+        source = (
+            select(
+                literal(user_id, Integer),
+                Document.title if data.title is None else literal(data.title, String),
+                Document.description if data.description is None else literal(data.description, Text),
+                literal(data.is_public, Boolean),
+                literal(data.is_template, Boolean),
+                *(totals.c[field] for field in DOCUMENT_STAT_FIELDS)
+            )
+            .select_from(Document)
+            .join(totals, true())
+            .where(Document.id == document_id)
+        )
+        result = await self.db.execute(
+            insert(Document)
+            .from_select(
+                [
+                    Document.user_id, Document.title, Document.description, Document.is_public, Document.is_template,
+                    *(getattr(Document, field) for field in DOCUMENT_STAT_FIELDS)
+                ],
+                source
+            )
+            .returning(*DOCUMENT_LIST_COLUMNS)
+        )
+        document = result.one_or_none()
+        if document is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Document {document_id} not found"
+            )
+        
+        # 2. 섹션 행 복사
+        columns = [
+            Section.title, Section.description, Section.blocks, Section.gri_reference, Section.section_metadata,
+            *(getattr(Section, field) for field in SECTION_STAT_FIELDS)
+        ]
+        source_sections = (
+            select(
+                Section.id.label("source_id"),
+                (func.row_number().over(order_by=(Section.order, Section.id)) - 1).label("new_order"),
+                *columns
+            )
+            .where(*section_filters)
+            .subquery()
+        )
+        await self.db.execute(
+            insert(Section).from_select(
+                [Section.document_id, Section.order, *columns],
+                select(
+                    literal(document.id, Integer),
+                    source_sections.c.new_order,
+                    *(source_sections.c[column.key] for column in columns)
+                )
+            )
+        )
+        
+        # 3. 검색 행 복사 (새 섹션은 order 로 원본 섹션과 대응)
+        await self.db.execute(
+            insert(DocumentBlockText).from_select(
+                [
+                    DocumentBlockText.section_id, DocumentBlockText.block_id, DocumentBlockText.document_id,
+                    DocumentBlockText.position, DocumentBlockText.block_type, DocumentBlockText.text
+                ],
+                select(
+                    Section.id,
+                    DocumentBlockText.block_id,
+                    literal(document.id, Integer),
+                    DocumentBlockText.position,
+                    DocumentBlockText.block_type,
+                    DocumentBlockText.text
+                )
+                .select_from(DocumentBlockText)
+                .join(source_sections, source_sections.c.source_id == DocumentBlockText.section_id)
+                .join(Section, (Section.document_id == document.id) & (Section.order == source_sections.c.new_order))
+            )
+        )
+        
+        await self.db.commit()
+        return document
+    
+    # ====================================
+    # Patch (증분 저장)
+    # ====================================
+    
+    async def patch_document(
+        self,
+        document_id: int,
+        data: DocumentPatch
+    ) -> Dict[str, Any]:
+        """
+        op 목록을 순서대로 적용하여 바뀐 섹션 행만 INSERT / UPDATE / DELETE (단일 트랜잭션)
+        
+        - 대상 섹션만 잠금 조회하고, blocks 는 블록 op 가 있는 섹션만 읽는다
+        - expected_updated_at 이 현재 섹션 updated_at 과 다르면 409 (다른 저장이 먼저 반영됨)
+        - 문서 전체를 다시 읽지 않고 변경된 섹션 ID 와 버전 스탬프(updated_at)만 반환
+        - 문서 통계는 잠금 조회한 이전 섹션 통계 대비 증감만 반영
+        """
+        # 1. 문서 행 갱신 (존재 확인 + 같은 문서 동시 저장 직렬화)
+        document_values = data.model_dump(
+            include={"title", "description", "is_public", "is_template"},
+            exclude_none=True
+        )
+        result = await self.db.execute(
+            update(Document)
+            .where(Document.id == document_id)
+            .values(**document_values, updated_at=func.now())
+            .returning(Document.updated_at)
+        )
+        document_updated_at = result.scalar_one_or_none()
+        if document_updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Document {document_id} not found"
+            )
+        
+        # 2. 대상 섹션 잠금 + 현재 스탬프/통계, 블록 op 대상 섹션만 blocks 조회
+        target_ids = {op.section_id for op in data.ops if op.op != "add_section"}
+        stamps: Dict[int, Any] = {}
+        old_stats: Dict[int, Dict[str, int]] = {}
+        if target_ids:
+            result = await self.db.execute(
+                select(Section.id, Section.updated_at, *(getattr(Section, field) for field in SECTION_STAT_FIELDS))
+                .where(Section.document_id == document_id, Section.id.in_(target_ids))
+                .with_for_update()
+            )
+            for section_id, updated_at, *counts in result.all():
+                stamps[section_id] = updated_at
+                old_stats[section_id] = dict(zip(SECTION_STAT_FIELDS, counts))
+            missing = target_ids - stamps.keys()
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Sections {sorted(missing)} not found in document {document_id}"
+                )
+        
+        blocks: Dict[int, List[Any]] = {}
+        block_section_ids = {op.section_id for op in data.ops if op.op in _BLOCK_OPS}
+        if block_section_ids:
+            result = await self.db.execute(
+                select(Section.id, Section.blocks).where(Section.id.in_(block_section_ids))
+            )
+            blocks = {section_id: list(section_blocks or []) for section_id, section_blocks in result.all()}
+        
+        # 3. op 적용 (메모리에서 섹션별 변경 컬럼 누적)
+        changes: Dict[int, Dict[str, Any]] = {}
+        removed: List[int] = []
+        added = []
+        for op in data.ops:
+            if op.op == "add_section":
+                added.append((op.client_id, _section_values(op.section)))
+                continue
+            
+            section_id = op.section_id
+            if section_id in removed:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Section {section_id} was removed by an earlier op"
+                )
+            if op.expected_updated_at is not None and op.expected_updated_at != stamps[section_id]:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Section {section_id} was modified at {stamps[section_id].isoformat()}"
+                )
+            
+            if op.op == "remove_section":
+                removed.append(section_id)
+                changes.pop(section_id, None)
+                continue
+            
+            values = changes.setdefault(section_id, {})
+            if op.op == "move_section":
+                values["order"] = op.order
+            elif op.op == "update_section":
+                section_changes = _section_changes(op.changes)
+                if "blocks" in section_changes:
+                    blocks[section_id] = section_changes["blocks"]
+                values.update(section_changes)
+            else:
+                _apply_block_op(blocks[section_id], op)
+                values["blocks"] = blocks[section_id]
+        
+        # 4. 바뀐 행만 반영 (섹션 통계는 blocks / gri_reference 가 바뀐 섹션만 재계산)
+        delta = StatsDelta()
+        if removed:
+            await self.db.execute(delete(Section).where(Section.id.in_(removed)))
+            for section_id in removed:
+                delta.remove(old_stats[section_id])
+        
+        section_stamps = []
+        for section_id, values in changes.items():
+            if not values:
+                continue
+            if "blocks" in values or "gri_reference" in values:
+                new_stats = updated_section_stats(old_stats[section_id], values)
+                delta.change(old_stats[section_id], new_stats)
+                values.update(new_stats)
+            result = await self.db.execute(
+                update(Section)
+                .where(Section.id == section_id)
+                .values(**values)
+                .returning(Section.updated_at)
+            )
+            section_stamps.append({"id": section_id, "updated_at": result.scalar_one()})
+        
+        # 검색 행: blocks 가 바뀐 섹션만 (삭제된 섹션은 CASCADE)
+        await index_sections(
+            self.db, document_id,
+            [(section_id, values["blocks"]) for section_id, values in changes.items() if "blocks" in values]
+        )
+        
+        if added:
+            result = await self.db.execute(
+                insert(Section).returning(Section.id, Section.updated_at, sort_by_parameter_order=True),
+                [{"document_id": document_id, **values} for _, values in added]
+            )
+            for (client_id, _), (section_id, updated_at) in zip(added, result.all()):
+                section_stamps.append({"id": section_id, "updated_at": updated_at, "client_id": client_id})
+            for _, values in added:
+                delta.add(values)
+            await index_sections(
+                self.db, document_id,
+                [(stamp["id"], values["blocks"]) for stamp, (_, values) in zip(section_stamps[-len(added):], added)],
+                replace=False
+            )
+        
+        await self._apply_stats_delta(document_id, delta)
+        await self.db.commit()
+        
+        return {
+            "success": True,
+            "document_id": document_id,
+            "updated_at": document_updated_at,
+            "sections": section_stamps,
+            "removed_section_ids": removed,
+        }
+    
     # ====================================
     # Section CRUD
     # ====================================
@@ -211,17 +659,15 @@ class DocumentService:
                 detail=f"Document {document_id} not found"
             )
         
-        section = Section(
-            document_id=document_id,
-            title=data.title,
-            description=data.description,
-            order=data.order,
-            blocks=[block.model_dump() for block in data.blocks],
-            gri_reference=[ref.model_dump() for ref in data.griReference] if data.griReference else None,
-            section_metadata=data.metadata.model_dump() if data.metadata else None
-        )
+        values = _section_values(data)
+        section = Section(document_id=document_id, **values)
         
         self.db.add(section)
+        await self.db.flush()
+        await index_sections(self.db, document_id, [(section.id, section.blocks)], replace=False)
+        delta = StatsDelta()
+        delta.add(values)
+        await self._apply_stats_delta(document_id, delta)
         await self.db.commit()
         await self.db.refresh(section)
         
@@ -233,7 +679,8 @@ class DocumentService:
         data: SectionUpdate
     ) -> Section:
         """섹션 업데이트"""
-        stmt = select(Section).where(Section.id == section_id)
+        # 통계 증감은 이전 섹션 통계 기준이므로 동시 수정이 같은 이전 값을 읽지 않도록 행 잠금
+        stmt = select(Section).where(Section.id == section_id).with_for_update()
         result = await self.db.execute(stmt)
         section = result.scalar_one_or_none()
         
@@ -243,30 +690,16 @@ class DocumentService:
                 detail=f"Section {section_id} not found"
             )
         
-        # 부분 업데이트
-        update_data = data.model_dump(exclude_unset=True)
-        
-        # blocks 처리
-        if 'blocks' in update_data and update_data['blocks'] is not None:
-            update_data['blocks'] = [
-                block.model_dump() if hasattr(block, 'model_dump') else block 
-                for block in update_data['blocks']
-            ]
-        
-        # griReference 처리
-        if 'griReference' in update_data and update_data['griReference'] is not None:
-            update_data['griReference'] = [
-                ref.model_dump() if hasattr(ref, 'model_dump') else ref
-                for ref in update_data['griReference']
-            ]
-        
-        # metadata 처리 (section_metadata로 변환)
-        if 'metadata' in update_data and update_data['metadata'] is not None:
-            if hasattr(update_data['metadata'], 'model_dump'):
-                update_data['section_metadata'] = update_data['metadata'].model_dump()
-            else:
-                update_data['section_metadata'] = update_data['metadata']
-            del update_data['metadata']
+        # 부분 업데이트 (griReference / metadata 는 컬럼명으로 변환)
+        update_data = _section_changes(data)
+        if "blocks" in update_data or "gri_reference" in update_data:
+            old_stats = _stats_of(section)
+            update_data.update(updated_section_stats(old_stats, update_data))
+            delta = StatsDelta()
+            delta.change(old_stats, update_data)
+            await self._apply_stats_delta(section.document_id, delta)
+        if "blocks" in update_data:
+            await index_sections(self.db, section.document_id, [(section.id, update_data["blocks"])])
         
         for key, value in update_data.items():
             setattr(section, key, value)
@@ -277,13 +710,24 @@ class DocumentService:
     
     async def delete_section(self, section_id: int) -> bool:
         """섹션 삭제"""
-        stmt = select(Section).where(Section.id == section_id)
+        stmt = select(Section).where(Section.id == section_id).with_for_update()
         result = await self.db.execute(stmt)
         section = result.scalar_one_or_none()
         
         if not section:
             return False
         
+        delta = StatsDelta()
+        delta.remove(_stats_of(section))
         await self.db.delete(section)
+        await self._apply_stats_delta(section.document_id, delta)
         await self.db.commit()
         return True
+    
+    async def _apply_stats_delta(self, document_id: int, delta: StatsDelta) -> None:
+        """문서 통계 증감 반영 (SET x = x + delta, 동시 섹션 쓰기끼리 덮어쓰지 않음)"""
+        increments = delta.increments()
+        if increments:
+            await self.db.execute(
+                update(Document).where(Document.id == document_id).values(**increments)
+            )
@@ -0,0 +1,121 @@
+"""
+버전 payload zstd 압축 저장 (선택 저장 형식)
+
+settings.VERSION_COMPRESSION_ENABLED 이면 버전 행의 payload(블록을 해시 참조로 바꾼 키프레임 스냅샷 또는 델타)를
+정규 JSON(키 정렬, 공백 없음)으로 직렬화해 zstd 로 압축한 뒤 payload_zstd(bytea)에 저장하고 JSONB 컬럼은 비운다.
+
+- block_hashes 는 그대로 기록하므로 블록 저장소 GC 는 압축 여부와 무관하다
+- 해제는 스냅샷을 복원할 때(VersionService._load_snapshot: get / restore / compare)만 하고, 목록 조회는 payload 를 읽지 않는다
+- 공유 사전(version_compression_dicts): 기존 payload 표본으로 학습한 zstd 사전. 가장 최근 사전으로 압축하고
+  행에 사전 ID 를 남기므로 이전 사전으로 압축된 행도 해제할 수 있다
+- zstandard 미설치 환경에서는 JSONB 형식으로 저장하며, 압축된 행을 읽으면 RuntimeError
+"""
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .constants import VERSION_COMPRESSION_DICT_REFRESH_SECONDS, VERSION_COMPRESSION_LEVEL
+from .models import VersionCompressionDict
+from ..core.config import settings
+
+try:
+    import zstandard
+    _zstd_available = True
+except ImportError:
+    zstandard = None
+    _zstd_available = False
+
+
+def canonical_json(payload: Dict[str, Any]) -> bytes:
+    """정규 JSON (키 정렬, 공백 없음) - 같은 payload 는 같은 바이트, 사전 학습 표본과도 같은 형태"""
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class VersionCompressor:
+    """payload 압축/해제 + 사전 관리 (사전 ID 별 압축기/해제기 캐시)"""
+
+    def __init__(
+        self,
+        level: int = VERSION_COMPRESSION_LEVEL,
+        dict_refresh_seconds: int = VERSION_COMPRESSION_DICT_REFRESH_SECONDS,
+    ):
+        self.level = level
+        self.dict_refresh_seconds = dict_refresh_seconds
+        # 사전 ID (None = 사전 없음) → 압축기 / 해제기. 사전 행은 수정되지 않으므로 무효화 불필요
+        self._compressors: Dict[Optional[int], Any] = {}
+        self._decompressors: Dict[Optional[int], Any] = {}
+        self._active_id: Optional[int] = None
+        self._active_checked_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """새로 쓰는 버전을 압축 형식으로 저장할지"""
+        return _zstd_available and settings.VERSION_COMPRESSION_ENABLED
+
+    async def _load_dictionary(self, db: AsyncSession, dict_id: Optional[int]):
+        if dict_id is None:
+            return None
+        result = await db.execute(
+            select(VersionCompressionDict.data).where(VersionCompressionDict.id == dict_id)
+        )
+        return zstandard.ZstdCompressionDict(result.scalar_one())
+
+    async def _active_dict_id(self, db: AsyncSession) -> Optional[int]:
+        """가장 최근 사전 ID (dict_refresh_seconds 마다 다시 확인)"""
+        now = time.monotonic()
+        if self._active_checked_at is None or now - self._active_checked_at >= self.dict_refresh_seconds:
+            result = await db.execute(select(func.max(VersionCompressionDict.id)))
+            self._active_id = result.scalar()
+            self._active_checked_at = now
+        return self._active_id
+
+    async def compress(self, db: AsyncSession, payload: Dict[str, Any]) -> Tuple[bytes, Optional[int]]:
+        """
+        payload → (압축 바이트, 사용한 사전 ID)
+        """
+        dict_id = await self._active_dict_id(db)
+        compressor = self._compressors.get(dict_id)
+        if compressor is None:
+            dictionary = await self._load_dictionary(db, dict_id)
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dictionary)
+            self._compressors[dict_id] = compressor
+        return compressor.compress(canonical_json(payload)), dict_id
+
+    async def decompress(self, db: AsyncSession, data: bytes, dict_id: Optional[int]) -> Dict[str, Any]:
+        """압축 바이트 → payload"""
+        if not _zstd_available:
+            raise RuntimeError("zstandard is required to read compressed document versions")
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            dictionary = await self._load_dictionary(db, dict_id)
+            decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+            self._decompressors[dict_id] = decompressor
+        return json.loads(decompressor.decompress(data))
+
+    async def train(self, db: AsyncSession, samples: List[Dict[str, Any]], dict_size: int) -> Tuple[int, int]:
+        """
+        payload 표본으로 사전 학습 후 저장 (이후 압축은 새 사전 사용, 커밋은 호출자)
+
+        Returns:
+            (사전 ID, 사전 크기)
+        """
+        if not _zstd_available:
+            raise RuntimeError("zstandard is required to train a compression dictionary")
+        dictionary = zstandard.train_dictionary(dict_size, [canonical_json(sample) for sample in samples])
+        data = dictionary.as_bytes()
+        row = VersionCompressionDict(data=data, size_bytes=len(data), sample_count=len(samples))
+        db.add(row)
+        await db.flush()
+
+        self._active_id = row.id
+        self._active_checked_at = time.monotonic()
+        logger.info(f"[VersionCompression] Trained dictionary {row.id} ({len(data):,} bytes, {len(samples)} samples)")
+        return row.id, len(data)
+
+
+# 싱글톤 인스턴스
+version_compressor = VersionCompressor()
@@ -0,0 +1,203 @@
+"""
+문서 버전 델타 인코딩
+
+연속된 버전 스냅샷은 대부분의 섹션/블록이 동일하므로, 키프레임 사이 버전은
+직전 버전 대비 섹션/블록 단위 구조적 델타로 저장한다.
+
+델타 형식:
+    {
+        "set":   {최상위 필드: 새 값},          # sections 제외, 바뀐 필드만
+        "unset": [삭제된 최상위 필드],
+        "sections": [                           # 대상 스냅샷의 섹션 순서 그대로
+            {"ref": id},                                    # 기준 섹션 그대로
+            {"ref": id, "set": {...}, "unset": [...],       # 섹션 필드 변경
+             "blocks": ["블록 id" | {블록 전체}, ...]},      # 블록 목록 변경 (문자열 = 기준 블록 재사용)
+            {"new": {섹션 전체}},                           # 새 섹션 (또는 기준에서 식별 불가)
+        ],
+    }
+
+복원된 스냅샷은 기준 스냅샷과 변경 없는 섹션/블록 객체를 공유하므로 읽기 전용으로 다룬다.
+"""
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import VERSION_DELTA_MAX_RATIO, VERSION_SNAPSHOT_CACHE_SIZE
+
+_MISSING = object()
+
+
+def json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str))
+
+
+def _index_by_id(items: List[Any]) -> Dict[Any, Dict[str, Any]]:
+    """id → 항목 (id 가 없거나 중복이면 해당 id 는 참조 대상에서 제외)"""
+    index: Dict[Any, Dict[str, Any]] = {}
+    duplicated = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id = item.get("id")
+        if item_id is None:
+            continue
+        if item_id in index:
+            duplicated.add(item_id)
+        index[item_id] = item
+    for item_id in duplicated:
+        del index[item_id]
+    return index
+
+
+def _field_changes(base: Dict[str, Any], target: Dict[str, Any], skip: str) -> Dict[str, Any]:
+    """skip 키를 제외한 필드 변경분 {"set": ..., "unset": ...} (변경 없으면 빈 dict)"""
+    changes: Dict[str, Any] = {}
+    changed = {
+        key: value for key, value in target.items()
+        if key != skip and base.get(key, _MISSING) != value
+    }
+    removed = [key for key in base if key != skip and key not in target]
+    if changed:
+        changes["set"] = changed
+    if removed:
+        changes["unset"] = removed
+    return changes
+
+
+def _apply_field_changes(base: Dict[str, Any], changes: Dict[str, Any], skip: str) -> Dict[str, Any]:
+    removed = set(changes.get("unset", ()))
+    result = {key: value for key, value in base.items() if key != skip and key not in removed}
+    result.update(changes.get("set", {}))
+    return result
+
+
+def _block_ops(base_blocks: List[Any], target_blocks: List[Any]) -> List[Any]:
+    """블록 목록 델타: 기준과 동일한 블록은 id 문자열, 나머지는 블록 전체"""
+    base_index = _index_by_id(base_blocks)
+    ops: List[Any] = []
+    for block in target_blocks:
+        block_id = block.get("id")
+        if isinstance(block_id, str) and base_index.get(block_id) == block:
+            ops.append(block_id)
+        else:
+            ops.append(block)
+    return ops
+
+
+def make_delta(base: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    """기준 스냅샷 → 대상 스냅샷 델타 생성"""
+    delta = _field_changes(base, target, skip="sections")
+    base_sections = _index_by_id(base.get("sections") or [])
+
+    sections: List[Dict[str, Any]] = []
+    for section in target.get("sections") or []:
+        section_id = section.get("id") if isinstance(section, dict) else None
+        base_section = base_sections.get(section_id) if section_id is not None else None
+        if base_section is None:
+            sections.append({"new": section})
+            continue
+        if base_section == section:
+            sections.append({"ref": section_id})
+            continue
+        if ("blocks" in base_section) != ("blocks" in section):
+            sections.append({"new": section})
+            continue
+
+        entry: Dict[str, Any] = {"ref": section_id, **_field_changes(base_section, section, skip="blocks")}
+        base_blocks = base_section.get("blocks") or []
+        target_blocks = section.get("blocks") or []
+        if base_blocks != target_blocks:
+            if all(isinstance(block, dict) for block in target_blocks):
+                entry["blocks"] = _block_ops(base_blocks, target_blocks)
+            else:
+                # 블록이 dict 가 아니면 참조(문자열)와 구분할 수 없으므로 전체 저장
+                entry = {"new": section}
+        sections.append(entry)
+
+    delta["sections"] = sections
+    return delta
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """기준 스냅샷에 델타를 적용하여 대상 스냅샷 복원 (기준 스냅샷은 변경하지 않음)"""
+    snapshot = _apply_field_changes(base, delta, skip="sections")
+    base_sections = _index_by_id(base.get("sections") or [])
+
+    sections: List[Any] = []
+    for entry in delta.get("sections", []):
+        if "new" in entry:
+            sections.append(entry["new"])
+            continue
+        base_section = base_sections[entry["ref"]]
+        if len(entry) == 1:
+            sections.append(base_section)
+            continue
+
+        section = _apply_field_changes(base_section, entry, skip="blocks")
+        if "blocks" in entry:
+            base_blocks = _index_by_id(base_section.get("blocks") or [])
+            section["blocks"] = [
+                base_blocks[op] if isinstance(op, str) else op
+                for op in entry["blocks"]
+            ]
+        elif "blocks" in base_section:
+            section["blocks"] = base_section["blocks"]
+        sections.append(section)
+
+    snapshot["sections"] = sections
+    return snapshot
+
+
+def encode_version(
+    base: Optional[Dict[str, Any]],
+    target: Dict[str, Any],
+    max_ratio: float = VERSION_DELTA_MAX_RATIO,
+) -> Optional[Dict[str, Any]]:
+    """
+    델타로 저장할 가치가 있으면 델타, 아니면 None (키프레임으로 저장)
+
+    구조가 크게 바뀐 버전은 델타가 전체 스냅샷과 비슷한 크기가 되므로 키프레임이 낫다.
+    """
+    if base is None:
+        return None
+    delta = make_delta(base, target)
+    if json_size(delta) >= json_size(target) * max_ratio:
+        return None
+    return delta
+
+
+class SnapshotCache:
+    """
+    최근 복원한 버전 스냅샷 LRU (버전 ID → (버전 행 updated_at, 스냅샷))
+
+    자동 저장 병합(coalesce)은 최신 버전 행의 payload 를 제자리에서 갱신하므로 버전 내용이 생성 후에도 바뀔 수 있다.
+    항목은 행의 updated_at 과 함께 저장하고 조회 시 일치할 때만 반환하므로, 다른 프로세스가 병합한 버전도
+    행을 다시 읽으면 오래된 스냅샷을 돌려주지 않는다. 삭제 시에는 discard 로 바로 제거한다.
+    """
+
+    def __init__(self, max_entries: int = VERSION_SNAPSHOT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, version_id: int, stamp: Any) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(version_id)
+        if entry is None:
+            return None
+        if entry[0] != stamp:
+            del self._entries[version_id]
+            return None
+        self._entries.move_to_end(version_id)
+        return entry[1]
+
+    def set(self, version_id: int, stamp: Any, snapshot: Dict[str, Any]) -> None:
+        self._entries[version_id] = (stamp, snapshot)
+        self._entries.move_to_end(version_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, version_id: int) -> None:
+        self._entries.pop(version_id, None)
+
+
+# 전역 캐시 인스턴스
+snapshot_cache = SnapshotCache()
@@ -0,0 +1,255 @@
+"""
+머클 해시 기반 버전 비교
+
+스냅샷 저장 시 섹션/블록 해시 트리(content tree)를 만들어 버전과 함께 저장한다.
+
+    {"root": 전체 섹션 해시, "sections": [[섹션 키, 제목, 섹션 해시, [블록 해시, ...], [블록 ID, ...]], ...]}
+
+- 블록 해시 = 블록 저장소 키 (block_store.block_hash) → 바뀐 블록 내용만 저장소에서 바로 조회
+- 섹션 해시 = 섹션 필드(블록 제외) + 블록 해시 목록의 해시, 루트 = 섹션 키/해시 목록의 해시
+
+비교는 루트가 같으면 O(1) 로 끝나고, 해시가 다른 섹션만 블록 ID 로 짝지어 비교하며
+(순서만 바뀐 블록은 변경 없음, ID 가 바뀐 블록은 추가 + 삭제), 수정된 블록은 단어 단위 텍스트 diff 를 만든다.
+블록 ID 가 없는 이전 형식 트리는 has_block_ids 가 False 이므로 호출자가 스냅샷에서 다시 계산한다.
+"""
+import hashlib
+import json
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Set, Tuple
+
+from .block_store import block_hash
+
+# 블록 텍스트 미리보기 길이
+_PREVIEW_LENGTH = 100
+
+_WORD_PATTERN = re.compile(r"\S+|\s+")
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def section_key(section: Dict[str, Any]) -> str:
+    """섹션 식별: id 우선, fallback 으로 title"""
+    return str(section.get("id") or section.get("title"))
+
+
+def block_text(block: Dict[str, Any]) -> str:
+    """블록의 inline 텍스트 연결"""
+    content = block.get("content", []) if isinstance(block, dict) else []
+    if not isinstance(content, list):
+        return ""
+    return "".join(item.get("text", "") for item in content if isinstance(item, dict))
+
+
+def count_block_chars(block: Dict[str, Any]) -> int:
+    """블록의 텍스트 문자 수"""
+    return len(block_text(block))
+
+
+def blocks_equal(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """두 블록이 동일한지 중요 필드만 비교 (blockType, content, 타입별 속성)"""
+    if a.get("blockType") != b.get("blockType"):
+        return False
+    if a.get("content") != b.get("content"):
+        return False
+    block_type = a.get("blockType")
+    if block_type == "heading":
+        return a.get("level") == b.get("level")
+    if block_type in ("list", "orderedList"):
+        return a.get("items") == b.get("items")
+    return True
+
+
+def _aligned_opcodes(a: List[str], b: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """
+    difflib opcodes (equal / replace / delete / insert)
+
+    공통 앞/뒤 구간은 정렬 대상에서 제외한다. 단어 몇 개만 바뀐 편집이 대부분이라
+    SequenceMatcher 는 바뀐 가운데 구간에만 적용된다.
+    """
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    a_end, b_end = len(a) - suffix, len(b) - suffix
+
+    opcodes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    matcher = SequenceMatcher(None, a[prefix:a_end], b[prefix:b_end], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", a_end, len(a), b_end, len(b)))
+    return opcodes
+
+
+def build_content_tree(snapshot: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    스냅샷 → 머클 트리
+
+    Returns:
+        (트리, {블록 해시: 블록})
+    """
+    blocks_by_hash: Dict[str, Dict[str, Any]] = {}
+    sections = []
+    for section in snapshot.get("sections") or []:
+        hashes = []
+        block_ids = []
+        for block in section.get("blocks") or []:
+            digest = block_hash(block)
+            blocks_by_hash[digest] = block
+            hashes.append(digest)
+            block_ids.append(block.get("id"))
+        fields = {key: value for key, value in section.items() if key != "blocks"}
+        fields_json = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+        section_hash = _digest(fields_json + "|" + ",".join(hashes))
+        sections.append([section_key(section), section.get("title"), section_hash, hashes, block_ids])
+
+    root = _digest("\n".join(f"{key}:{section_hash}" for key, _, section_hash, *_ in sections))
+    return {"root": root, "sections": sections}, blocks_by_hash
+
+
+def has_block_ids(tree: Dict[str, Any]) -> bool:
+    """블록 ID 목록이 있는 트리인지 (없으면 스냅샷에서 다시 계산해야 블록을 ID 로 짝지을 수 있다)"""
+    return all(len(entry) > 4 for entry in tree["sections"])
+
+
+class DiffPlan:
+    """트리 비교 결과 (블록 내용 없이 해시 수준에서 결정된 변경 목록)"""
+
+    __slots__ = ("sections_added", "sections_removed", "sections_changed", "needed")
+
+    def __init__(self):
+        # (제목, 블록 해시 목록)
+        self.sections_added: List[Tuple[str, List[str]]] = []
+        self.sections_removed: List[Tuple[str, List[str]]] = []
+        # (섹션 키, 제목, 추가 해시, 삭제 해시, [(이전 해시, 새 해시, 대상 위치)])
+        self.sections_changed: List[Tuple[str, str, List[str], List[str], List[Tuple[str, str, int]]]] = []
+        # 내용이 필요한 블록 해시
+        self.needed: Set[str] = set()
+
+
+def _blocks_by_id(hashes: List[str], block_ids: List[Any]) -> Dict[Any, Tuple[str, int]]:
+    """블록 ID → (해시, 위치). ID 가 중복되면 뒤의 블록"""
+    return {block_id: (digest, position) for position, (digest, block_id) in enumerate(zip(hashes, block_ids))}
+
+
+def plan_diff(source_tree: Dict[str, Any], target_tree: Dict[str, Any]) -> DiffPlan:
+    """
+    해시가 같은 섹션은 건너뛰고, 다른 섹션만 블록 ID 로 짝지어 해시 비교
+
+    ID 가 양쪽에 있고 해시가 다르면 수정 후보(중요 필드 비교는 render_diff), 한쪽에만 있으면 추가/삭제.
+    섹션 전체가 추가/삭제된 경우는 블록 수만 세므로 블록 내용을 조회하지 않는다.
+    """
+    plan = DiffPlan()
+    if source_tree["root"] == target_tree["root"]:
+        return plan
+
+    source_sections = {entry[0]: entry for entry in source_tree["sections"]}
+    target_keys = set()
+    for key, title, section_hash, target_hashes, target_ids in target_tree["sections"]:
+        target_keys.add(key)
+        source_entry = source_sections.get(key)
+        if source_entry is None:
+            plan.sections_added.append((title or key, target_hashes))
+            continue
+        if source_entry[2] == section_hash:
+            continue
+
+        source_blocks = _blocks_by_id(source_entry[3], source_entry[4])
+        target_blocks = _blocks_by_id(target_hashes, target_ids)
+        added = [digest for block_id, (digest, _) in target_blocks.items() if block_id not in source_blocks]
+        removed = [digest for block_id, (digest, _) in source_blocks.items() if block_id not in target_blocks]
+        modified: List[Tuple[str, str, int]] = []
+        for block_id, (new_hash, position) in target_blocks.items():
+            source_block = source_blocks.get(block_id)
+            if source_block is not None and source_block[0] != new_hash:
+                modified.append((source_block[0], new_hash, position))
+        plan.sections_changed.append((key, title or key, added, removed, modified))
+        plan.needed.update(added)
+        plan.needed.update(removed)
+        for old_hash, new_hash, _ in modified:
+            plan.needed.add(old_hash)
+            plan.needed.add(new_hash)
+
+    for key, title, _, source_hashes, _ in source_tree["sections"]:
+        if key not in target_keys:
+            plan.sections_removed.append((title or key, source_hashes))
+    return plan
+
+
+def word_diff(old_text: str, new_text: str) -> List[Dict[str, str]]:
+    """단어(공백 포함 토큰) 단위 텍스트 diff: [{"op": equal|delete|insert, "text": ...}]"""
+    old_tokens = _WORD_PATTERN.findall(old_text)
+    new_tokens = _WORD_PATTERN.findall(new_text)
+    ops: List[Dict[str, str]] = []
+    for tag, i1, i2, j1, j2 in _aligned_opcodes(old_tokens, new_tokens):
+        if tag == "equal":
+            ops.append({"op": "equal", "text": "".join(old_tokens[i1:i2])})
+            continue
+        if i2 > i1:
+            ops.append({"op": "delete", "text": "".join(old_tokens[i1:i2])})
+        if j2 > j1:
+            ops.append({"op": "insert", "text": "".join(new_tokens[j1:j2])})
+    return ops
+
+
+def render_diff(plan: DiffPlan, blocks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """계획 + 필요한 블록 내용 → VersionDiffResponse 형식 (버전 번호 제외)"""
+    def chars_of(hashes: List[str]) -> int:
+        return sum(count_block_chars(blocks[digest]) for digest in hashes)
+
+    # 섹션 전체 추가/삭제는 블록 수만 센다 (문자 수는 기존 섹션 안의 블록 변경만)
+    total_added = sum(len(hashes) for _, hashes in plan.sections_added)
+    total_removed = sum(len(hashes) for _, hashes in plan.sections_removed)
+    total_modified = 0
+    chars_changed = 0
+
+    sections_modified = []
+    for key, title, added, removed, modified in plan.sections_changed:
+        block_diffs = []
+        for old_hash, new_hash, position in modified:
+            old_block, new_block = blocks[old_hash], blocks[new_hash]
+            # 중요 필드가 같으면 (id/스타일 등만 변경) 수정으로 세지 않는다
+            if blocks_equal(old_block, new_block):
+                continue
+            old_text, new_text = block_text(old_block), block_text(new_block)
+            chars_changed += abs(len(new_text) - len(old_text))
+            block_diffs.append({
+                "index": position,
+                "block_id": new_block.get("id"),
+                "ops": word_diff(old_text, new_text),
+            })
+        chars_changed += chars_of(added) + chars_of(removed)
+        if not (added or removed or block_diffs):
+            continue
+
+        changed_blocks = [blocks[h] for h in added] + [blocks[new_hash] for _, new_hash, _ in modified]
+        preview = next((block_text(b) for b in changed_blocks if block_text(b)), None)
+        sections_modified.append({
+            "section_id": key,
+            "section_title": title,
+            "status": "modified",
+            "blocks_added": len(added),
+            "blocks_removed": len(removed),
+            "blocks_modified": len(block_diffs),
+            "preview": preview[:_PREVIEW_LENGTH] if preview else None,
+            "block_diffs": block_diffs,
+        })
+        total_added += len(added)
+        total_removed += len(removed)
+        total_modified += len(block_diffs)
+
+    return {
+        "sections_added": [title for title, _ in plan.sections_added],
+        "sections_removed": [title for title, _ in plan.sections_removed],
+        "sections_modified": sections_modified,
+        "blocks_added": total_added,
+        "blocks_removed": total_removed,
+        "blocks_modified": total_modified,
+        "chars_changed": chars_changed,
+    }
@@ -0,0 +1,139 @@
+"""
+자동 저장 버전 정리 (보존 정책 기반 thinning)
+
+수동 저장 버전과 문서별 최신 버전은 항상 남기고, 자동 저장 버전은 나이에 따라 솎아 낸다.
+
+- 최근 VERSION_RETENTION_KEEP_ALL_HOURS 시간: 전부 보존
+- 최근 VERSION_RETENTION_HOURLY_DAYS 일: 시간 구간마다 가장 마지막 버전 하나
+- 최근 VERSION_RETENTION_DAILY_DAYS 일: 일 구간마다 가장 마지막 버전 하나
+- 그 이전: 삭제
+
+구간의 마지막 버전이 수동 저장이면 그 구간의 자동 저장은 모두 삭제 대상이다.
+문서 묶음 단위로 후보를 계산하고 배치마다 커밋하므로 트랜잭션 크기는 batch_size 로 제한된다.
+삭제는 VersionService.prune_versions 를 거쳐 델타 의존 버전을 재기준화한다.
+"""
+from datetime import timedelta
+from typing import Dict, List
+
+from sqlalchemy import case, func, or_, select
+
+from .constants import (
+    VERSION_RETENTION_DAILY_DAYS,
+    VERSION_RETENTION_HOURLY_DAYS,
+    VERSION_RETENTION_KEEP_ALL_HOURS,
+    VERSION_THINNING_BATCH_SIZE,
+)
+from .models import DocumentVersion
+from .version_delta import snapshot_cache
+from .version_service import VersionService
+from ..core.database import AsyncSessionLocal
+
+
+class VersionRetention:
+    """자동 저장 버전 보존 정책 적용"""
+
+    def __init__(
+        self,
+        keep_all_hours: int = VERSION_RETENTION_KEEP_ALL_HOURS,
+        hourly_days: int = VERSION_RETENTION_HOURLY_DAYS,
+        daily_days: int = VERSION_RETENTION_DAILY_DAYS,
+    ):
+        self.keep_all = timedelta(hours=keep_all_hours)
+        self.hourly = timedelta(days=hourly_days)
+        self.daily = timedelta(days=daily_days)
+
+    def _thinnable(self, document_ids: List[int]):
+        """문서 묶음에서 정책상 삭제할 자동 저장 버전 (문서, 버전 번호 순)"""
+        now = func.now()
+        created_at = DocumentVersion.created_at
+        bucket = case(
+            (created_at >= now - self.hourly, func.date_trunc("hour", created_at)),
+            (created_at >= now - self.daily, func.date_trunc("day", created_at)),
+            else_=None,
+        )
+        ranked = (
+            select(
+                DocumentVersion.id,
+                DocumentVersion.document_id,
+                DocumentVersion.version_number,
+                DocumentVersion.is_auto_saved,
+                created_at,
+                bucket.label("bucket"),
+                func.row_number().over(
+                    partition_by=(DocumentVersion.document_id, bucket),
+                    order_by=DocumentVersion.version_number.desc()
+                ).label("bucket_rank"),
+                func.max(DocumentVersion.version_number).over(
+                    partition_by=DocumentVersion.document_id
+                ).label("latest_number"),
+            )
+            .where(DocumentVersion.document_id.in_(document_ids))
+            .subquery()
+        )
+        return (
+            select(ranked.c.id)
+            .where(
+                ranked.c.is_auto_saved == True,
+                ranked.c.version_number < ranked.c.latest_number,
+                ranked.c.created_at < now - self.keep_all,
+                or_(ranked.c.bucket.is_(None), ranked.c.bucket_rank > 1),
+            )
+            .order_by(ranked.c.document_id, ranked.c.version_number)
+        )
+
+    async def thin(self, batch_size: int = VERSION_THINNING_BATCH_SIZE) -> Dict[str, int]:
+        """
+        전체 문서에 보존 정책 적용 (문서 ID 순 묶음, 배치마다 커밋)
+
+        Returns:
+            {"documents": 정리한 문서 수, "versions": 삭제한 버전 수, "bytes": 회수한 바이트 수}
+            (버전에서만 참조되던 블록은 블록 저장소 GC 에서 따로 회수된다)
+        """
+        documents = 0
+        deleted = 0
+        reclaimed = 0
+        after = 0
+
+        while True:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(DocumentVersion.document_id)
+                    .where(
+                        DocumentVersion.document_id > after,
+                        DocumentVersion.is_auto_saved == True,
+                        DocumentVersion.created_at < func.now() - self.keep_all
+                    )
+                    .group_by(DocumentVersion.document_id)
+                    .order_by(DocumentVersion.document_id)
+                    .limit(batch_size)
+                )
+                document_ids = result.scalars().all()
+            if not document_ids:
+                break
+            after = document_ids[-1]
+
+            touched = set()
+            while True:
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(self._thinnable(document_ids).limit(batch_size))
+                    version_ids = result.scalars().all()
+                    if not version_ids:
+                        break
+                    result = await session.execute(
+                        select(DocumentVersion).where(DocumentVersion.id.in_(version_ids))
+                    )
+                    versions = result.scalars().all()
+                    reclaimed += await VersionService(session).prune_versions(versions)
+                    await session.commit()
+
+                for version in versions:
+                    snapshot_cache.discard(version.id)
+                    touched.add(version.document_id)
+                deleted += len(versions)
+            documents += len(touched)
+
+        return {"documents": documents, "versions": deleted, "bytes": reclaimed}
+
+
+# 싱글톤 인스턴스
+version_retention = VersionRetention()
@@ -92,6 +92,19 @@ class VersionRestoreResponse(BaseModel):
 # Version Diff (Optional - Phase 1.4)
 # ============================================
 
+class TextDiffOp(BaseModel):
+    """단어 단위 텍스트 diff 조각"""
+    op: str  # 'equal', 'delete', 'insert'
+    text: str
+
+
+class BlockDiff(BaseModel):
+    """수정된 블록의 텍스트 diff"""
+    index: int  # 대상 섹션 내 블록 위치
+    block_id: Optional[str] = None
+    ops: List[TextDiffOp] = []
+
+
 class SectionDiff(BaseModel):
     """섹션 차이점"""
     section_id: str
@@ -101,6 +114,7 @@ class SectionDiff(BaseModel):
     blocks_removed: int = 0
     blocks_modified: int = 0
     preview: Optional[str] = None  # 첫 100자 미리보기
+    block_diffs: List[BlockDiff] = []  # ✅ 수정된 블록별 단어 단위 diff
 
 
 class VersionDiffRequest(BaseModel):
@@ -5,11 +5,28 @@ Version Management Service
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, func
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
 from typing import List, Optional, Tuple, Dict, Any
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 
 from src.documents.models import Document, Section, DocumentVersion
 from .version_schemas import VersionCreate, VersionMetadata, VersionResponse
+from .version_delta import apply_delta, encode_version, json_size, make_delta, snapshot_cache
+from .block_store import block_store, pack_payload, unpack_payload
+from .version_diff import build_content_tree, has_block_ids, plan_diff, render_diff
+from .document_stats import document_totals, section_stats
+from .search_index import index_sections
+from .version_compression import version_compressor
+from .constants import AUTOSAVE_COALESCE_SECONDS, VERSION_KEYFRAME_INTERVAL
+
+
+def _payload_size(version: DocumentVersion) -> int:
+    """행에 저장된 payload(키프레임 스냅샷 또는 델타) 크기 (압축 행은 압축 바이트 수)"""
+    if version.payload_zstd is not None:
+        return len(version.payload_zstd)
+    return json_size(version.snapshot_data if version.base_version_number is None else version.delta_data)
 
 
 class VersionService:
@@ -22,7 +39,8 @@ class VersionService:
         self,
         document_id: int,
         author_id: Optional[int],
-        data: VersionCreate
+        data: VersionCreate,
+        coalesce: bool = True
     ) -> DocumentVersion:
         """
         문서 버전 스냅샷 생성
@@ -31,6 +49,7 @@ class VersionService:
             document_id: 문서 ID
             author_id: 작성자 ID (JWT에서 추출)
             data: 버전 생성 요청 데이터
+            coalesce: False 면 자동 저장이어도 직전 자동 저장 버전에 병합하지 않고 새 버전 생성
         
         Returns:
             생성된 DocumentVersion 객체
@@ -52,31 +71,23 @@ class VersionService:
         # 2. 문서의 sections 로드
         await self.db.refresh(document, ['sections'])
         
-        # 3. 다음 버전 번호 계산
-        stmt = select(func.max(DocumentVersion.version_number)).where(
-            DocumentVersion.document_id == document_id
+        # 3. 다음 버전 번호 계산 (직전 버전 = 델타 기준)
+        stmt = (
+            select(DocumentVersion)
+            .where(DocumentVersion.document_id == document_id)
+            .order_by(DocumentVersion.version_number.desc())
+            .limit(1)
         )
         result = await self.db.execute(stmt)
-        max_version = result.scalar() or 0
-        next_version = max_version + 1
+        previous = result.scalar_one_or_none()
+        next_version = previous.version_number + 1 if previous else 1
         
         # 4. 스냅샷 데이터 생성 (DocumentNode → JSON)
         snapshot_data = {
             "id": str(document.id),
             "title": document.title,
             "description": document.description,
-            "sections": [
-                {
-                    "id": str(section.id),
-                    "title": section.title,
-                    "description": section.description,
-                    "order": section.order,
-                    "blocks": section.blocks,
-                    "griReference": section.gri_reference,
-                    "metadata": section.section_metadata,
-                }
-                for section in document.sections
-            ],
+            "sections": [self._section_to_snapshot(section) for section in document.sections],
             "metadata": {
                 "createdAt": document.created_at.isoformat(),
                 "updatedAt": document.updated_at.isoformat(),
@@ -85,41 +96,218 @@ class VersionService:
             }
         }
         
-        # 5. 통계 계산 (안전한 키 접근)
-        sections_count = len(document.sections)
-        blocks_count = sum(len(s.blocks) for s in document.sections)
-        
-        # chars_count: 텍스트 블록만 카운트 (안전하게)
-        chars_count = 0
-        for section in document.sections:
-            for block in section.blocks:
-                if isinstance(block, dict):
-                    # content 배열의 text 필드 합산
-                    content = block.get("content", [])
-                    if isinstance(content, list):
-                        for inline in content:
-                            if isinstance(inline, dict):
-                                chars_count += len(inline.get("text", ""))
-        
-        # 6. 버전 생성
-        version = DocumentVersion(
-            document_id=document_id,
-            author_id=author_id,
-            version_number=next_version,
-            comment=data.comment,
-            is_auto_saved=data.is_auto_saved,
-            snapshot_data=snapshot_data,
-            sections_count=sections_count,
-            blocks_count=blocks_count,
-            chars_count=chars_count,
+        # 5. ✅ [Coalesce] 창 안에 이어진 자동 저장은 새 버전 대신 직전 자동 저장 버전을 갱신
+        base_number = None
+        if coalesce and self._can_coalesce(previous, author_id, data):
+            version = previous
+            base_number = previous.base_version_number
+            if data.comment is not None:
+                version.comment = data.comment
+        else:
+            version = DocumentVersion(
+                document_id=document_id,
+                author_id=author_id,
+                version_number=next_version,
+                comment=data.comment,
+                is_auto_saved=data.is_auto_saved,
+            )
+            # ✅ [Storage] 키프레임 간격 내이면 직전 버전 대비 델타로 저장
+            if previous is not None:
+                keyframe_number = await self._latest_keyframe_number(document_id)
+                if keyframe_number is not None and next_version - keyframe_number < VERSION_KEYFRAME_INTERVAL:
+                    base_number = previous.version_number
+        
+        delta = None
+        if base_number is not None:
+            base_version = await self._get_version_by_number(document_id, base_number)
+            delta = encode_version(await self._load_snapshot(base_version), snapshot_data)
+        
+        # 6. 버전 기록 (블록은 블록 저장소에, 행에는 해시 참조만)
+        # 통계는 섹션 쓰기 시 증분 갱신된 문서 행 값 (블록 순회 없음)
+        version.sections_count = document.section_count
+        version.blocks_count = document.block_count
+        version.chars_count = document.char_count
+        version.content_tree = build_content_tree(snapshot_data)[0]
+        await self._store_payload(
+            version,
+            snapshot_data if delta is None else delta,
+            base_version_number=base_number if delta is not None else None
         )
         
         self.db.add(version)
         await self.db.commit()
         await self.db.refresh(version)
         
+        # 응답/다음 델타 계산용으로 전체 스냅샷을 채워 둔다 (DB 에는 쓰지 않음)
+        snapshot_cache.set(version.id, version.updated_at, snapshot_data)
+        set_committed_value(version, "snapshot_data", snapshot_data)
+        
         return version
     
+    def _can_coalesce(
+        self,
+        previous: Optional[DocumentVersion],
+        author_id: Optional[int],
+        data: VersionCreate
+    ) -> bool:
+        """
+        최신 버전이 같은 작성자의 자동 저장이고 생성 후 AUTOSAVE_COALESCE_SECONDS 이내이면 병합
+        
+        창은 병합이 시작된 버전의 created_at 기준이므로 계속 편집해도 창마다 버전이 하나씩 남는다.
+        최신 버전은 다른 버전의 델타 기준이 아니므로 내용을 바꿔도 체인이 깨지지 않는다.
+        """
+        if not data.is_auto_saved or previous is None or not previous.is_auto_saved:
+            return False
+        if previous.author_id != author_id:
+            return False
+        window_start = datetime.now(timezone.utc) - timedelta(seconds=AUTOSAVE_COALESCE_SECONDS)
+        return previous.created_at >= window_start
+    
+    async def _store_payload(
+        self,
+        version: DocumentVersion,
+        payload: Dict[str, Any],
+        base_version_number: Optional[int] = None,
+        inline_blocks: bool = False
+    ) -> int:
+        """
+        버전 행에 키프레임(base_version_number=None) 또는 델타 기록
+        
+        블록은 내용 주소 블록 저장소에 저장하고 행에는 {"$h": 해시} 참조와 해시 목록만 남긴다.
+        (inline_blocks=True 면 블록을 행에 그대로 저장 - 블록 저장소 도입 이전 형식)
+        
+        Returns:
+            블록 저장소에 새로 저장된 바이트 수
+        """
+        if inline_blocks:
+            packed, blocks, inserted_bytes = payload, {}, 0
+        else:
+            packed, blocks = pack_payload(payload)
+            inserted_bytes = await block_store.save(self.db, blocks)
+        version.base_version_number = base_version_number
+        version.block_hashes = sorted(blocks) or None
+        await self._write_payload(version, packed, version_compressor.enabled)
+        return inserted_bytes
+    
+    async def _write_payload(self, version: DocumentVersion, packed: Dict[str, Any], compress: bool) -> None:
+        """
+        packed payload (블록 해시 참조 형태) → 행 컬럼
+        
+        compress 면 payload_zstd (JSONB 컬럼은 비움), 아니면 키프레임은 snapshot_data / 델타는 delta_data.
+        """
+        is_keyframe = version.base_version_number is None
+        if compress:
+            version.payload_zstd, version.payload_dict_id = await version_compressor.compress(self.db, packed)
+            version.snapshot_data = None
+            version.delta_data = None
+        else:
+            version.payload_zstd = None
+            version.payload_dict_id = None
+            version.snapshot_data = packed if is_keyframe else None
+            version.delta_data = None if is_keyframe else packed
+        # 조회 시 복원한 스냅샷을 committed 값으로 채워 두므로, 같은 값을 다시 쓰는 경우에도 UPDATE 되도록
+        flag_modified(version, "snapshot_data")
+        flag_modified(version, "delta_data")
+    
+    async def _read_payload(self, version: DocumentVersion) -> Dict[str, Any]:
+        """행의 packed payload (압축 행은 여기서만 해제)"""
+        if version.payload_zstd is not None:
+            return await version_compressor.decompress(self.db, version.payload_zstd, version.payload_dict_id)
+        return version.snapshot_data if version.base_version_number is None else version.delta_data
+    
+    async def convert_payload_storage(self, versions: List[DocumentVersion], compress: bool) -> Tuple[int, int]:
+        """
+        저장 형식만 변환 (JSONB ↔ zstd, 또는 최신 사전으로 재압축). 스냅샷 복원/블록 저장 없음, 커밋은 호출자
+        
+        Returns:
+            (변환 전 payload 바이트, 변환 후 payload 바이트)
+        """
+        bytes_before = bytes_after = 0
+        for version in versions:
+            packed = await self._read_payload(version)
+            bytes_before += _payload_size(version)
+            await self._write_payload(version, packed, compress)
+            bytes_after += _payload_size(version)
+        return bytes_before, bytes_after
+    
+    async def train_compression_dictionary(self, sample_size: int, dict_size: int) -> Tuple[int, int]:
+        """
+        임의 버전 payload 표본으로 zstd 공유 사전 학습 후 저장
+        
+        Returns:
+            (사전 ID, 사전 크기)
+        """
+        result = await self.db.execute(
+            select(DocumentVersion).order_by(func.random()).limit(sample_size)
+        )
+        samples = [await self._read_payload(version) for version in result.scalars().all()]
+        trained = await version_compressor.train(self.db, samples, dict_size)
+        await self.db.commit()
+        return trained
+    
+    async def _latest_keyframe_number(self, document_id: int, before: Optional[int] = None) -> Optional[int]:
+        """가장 최근 키프레임 버전 번호 (before 지정 시 그 번호 이하에서)"""
+        stmt = select(func.max(DocumentVersion.version_number)).where(
+            DocumentVersion.document_id == document_id,
+            DocumentVersion.base_version_number.is_(None)
+        )
+        if before is not None:
+            stmt = stmt.where(DocumentVersion.version_number <= before)
+        result = await self.db.execute(stmt)
+        return result.scalar()
+    
+    async def _load_snapshot(self, version: DocumentVersion) -> Dict[str, Any]:
+        """
+        버전의 전체 스냅샷 복원
+        
+        키프레임이면 블록 참조만 풀고, 델타면 가장 가까운 키프레임(또는 캐시된 버전)부터 델타 체인을 적용한다.
+        체인 구간과 필요한 블록은 각각 한 번의 쿼리로 읽고, 복원한 중간 버전도 모두 캐시한다.
+        반환값은 캐시와 공유되므로 읽기 전용으로 사용한다.
+        """
+        cached = snapshot_cache.get(version.id, version.updated_at)
+        if cached is not None:
+            return cached
+        
+        by_number: Dict[int, DocumentVersion] = {}
+        if version.base_version_number is not None:
+            keyframe_number = await self._latest_keyframe_number(version.document_id, before=version.version_number)
+            stmt = select(DocumentVersion).where(
+                DocumentVersion.document_id == version.document_id,
+                DocumentVersion.version_number >= (keyframe_number or 0),
+                DocumentVersion.version_number <= version.version_number
+            )
+            result = await self.db.execute(stmt)
+            by_number = {row.version_number: row for row in result.scalars().all()}
+        
+        # 대상 버전에서 기준 버전을 따라 내려가며 캐시 적중 또는 키프레임을 찾는다
+        chain: List[DocumentVersion] = []
+        snapshot = None
+        current = version
+        while True:
+            snapshot = snapshot_cache.get(current.id, current.updated_at)
+            if snapshot is not None:
+                break
+            chain.append(current)
+            if current.base_version_number is None:
+                break
+            base = by_number.get(current.base_version_number)
+            if base is None:
+                raise RuntimeError(
+                    f"Broken version chain: document {version.document_id} "
+                    f"v{current.version_number} → v{current.base_version_number}"
+                )
+            current = base
+        
+        blocks = await block_store.load(self.db, [h for row in chain for h in (row.block_hashes or [])])
+        for row in reversed(chain):
+            payload = unpack_payload(await self._read_payload(row), blocks)
+            if row.base_version_number is None:
+                snapshot = payload
+            else:
+                snapshot = apply_delta(snapshot, payload)
+            snapshot_cache.set(row.id, row.updated_at, snapshot)
+        return snapshot
+    
     async def list_versions(
         self,
         document_id: int,
@@ -128,13 +316,20 @@ class VersionService:
         include_auto_saved: bool = True
     ) -> Tuple[List[DocumentVersion], int, bool, bool]:
         """
-        버전 목록 조회
+        버전 목록 조회 (메타데이터만, payload / 블록 해시 / 트리 컬럼은 읽지 않음)
         
         Returns:
             (versions, total, has_next, has_prev)
         """
         stmt = (
             select(DocumentVersion)
+            .options(
+                defer(DocumentVersion.snapshot_data, raiseload=True),
+                defer(DocumentVersion.delta_data, raiseload=True),
+                defer(DocumentVersion.payload_zstd, raiseload=True),
+                defer(DocumentVersion.block_hashes, raiseload=True),
+                defer(DocumentVersion.content_tree, raiseload=True),
+            )
             .where(DocumentVersion.document_id == document_id)
             .order_by(DocumentVersion.created_at.desc())
         )
@@ -158,12 +353,28 @@ class VersionService:
         
         return versions, total, has_next, has_prev
     
-    async def get_version(self, version_id: int) -> Optional[DocumentVersion]:
-        """특정 버전 조회"""
+    async def _get_version_by_number(self, document_id: int, version_number: int) -> DocumentVersion:
+        stmt = select(DocumentVersion).where(
+            DocumentVersion.document_id == document_id,
+            DocumentVersion.version_number == version_number
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+    
+    async def _get_version_row(self, version_id: int) -> Optional[DocumentVersion]:
+        """버전 행 조회 (저장 형식 그대로: 블록 해시 참조, 델타 버전은 snapshot_data 가 비어 있음)"""
         stmt = select(DocumentVersion).where(DocumentVersion.id == version_id)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_version(self, version_id: int) -> Optional[DocumentVersion]:
+        """특정 버전 조회 (블록 참조/델타를 풀어 전체 스냅샷을 snapshot_data 에 채움)"""
+        version = await self._get_version_row(version_id)
+        if version is not None:
+            # DB 변경으로 추적되지 않도록 committed 값으로 설정
+            set_committed_value(version, "snapshot_data", await self._load_snapshot(version))
+        return version
+    
     async def restore_version(
         self,
         document_id: int,
@@ -186,24 +397,29 @@ class VersionService:
             }
         """
         # 1. 버전 조회
-        version = await self.get_version(version_id)
+        version = await self._get_version_row(version_id)
         if not version or version.document_id != document_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Version {version_id} not found"
             )
         
-        # 2. 현재 문서 상태를 새 버전으로 저장 (복원 전 자동 백업)
+        # 2. 스냅샷 데이터 추출 (델타 버전은 키프레임부터 복원, 백업 저장 전에 읽는다)
+        snapshot = await self._load_snapshot(version)
+        
+        # 3. 현재 문서 상태를 새 버전으로 저장 (복원 전 자동 백업)
+        # ✅ [Coalesce] 대상이 직전 자동 저장 버전이어도 병합하지 않는다 (병합하면 대상 내용이 현재 문서로 덮어써짐)
         backup_version = await self.create_version(
             document_id,
             author_id,
             VersionCreate(
                 comment=f"Auto-backup before restore to v{version.version_number}",
                 is_auto_saved=True
-            )
+            ),
+            coalesce=False
         )
         
-        # 3. 현재 문서 조회
+        # 4. 현재 문서 조회
         stmt = select(Document).where(Document.id == document_id)
         result = await self.db.execute(stmt)
         document = result.scalar_one_or_none()
@@ -216,25 +432,29 @@ class VersionService:
         
         await self.db.refresh(document, ['sections'])
         
-        # 4. 스냅샷 데이터 추출
-        snapshot = version.snapshot_data
-        
         # 5. 기존 섹션 삭제 (ORM cascade 활용)
         document.sections.clear()
         await self.db.flush()  # ✅ 명시적 flush로 삭제 반영
         
-        # 6. 스냅샷에서 섹션 복원
-        for section_data in snapshot.get("sections", []):
-            section = Section(
-                document_id=document_id,
-                title=section_data.get("title", ""),
-                description=section_data.get("description"),
-                order=section_data.get("order", 0),
-                blocks=section_data.get("blocks", []),
-                gri_reference=section_data.get("griReference"),
-                section_metadata=section_data.get("metadata"),
-            )
-            document.sections.append(section)
+        # 6. 스냅샷에서 섹션 복원 (문서 통계는 전체 재계산)
+        section_values = [
+            {
+                "title": section_data.get("title", ""),
+                "description": section_data.get("description"),
+                "order": section_data.get("order", 0),
+                "blocks": section_data.get("blocks", []),
+                "gri_reference": section_data.get("griReference"),
+                "section_metadata": section_data.get("metadata"),
+            }
+            for section_data in snapshot.get("sections", [])
+        ]
+        for values in section_values:
+            values.update(section_stats(values))
+            document.sections.append(Section(document_id=document_id, **values))
+        for field, value in document_totals(section_values).items():
+            setattr(document, field, value)
+        await self.db.flush()
+        await index_sections(self.db, document_id, [(section.id, section.blocks) for section in document.sections], replace=False)
         
         # 7. 문서 메타데이터 업데이트
         document.title = snapshot.get("title", document.title)
@@ -265,7 +485,7 @@ class VersionService:
         Returns:
             성공 여부
         """
-        version = await self.get_version(version_id)
+        version = await self._get_version_row(version_id)
         if not version:
             return False
         
@@ -285,10 +505,116 @@ class VersionService:
             # TODO: 관리자 권한 체크 (RBAC 적용 시)
             return False
         
-        await self.db.delete(version)
+        await self.prune_versions([version])
         await self.db.commit()
+        snapshot_cache.discard(version.id)
         return True
     
+    async def prune_versions(self, versions: List[DocumentVersion]) -> int:
+        """
+        버전 행 삭제 (델타 의존 버전은 재기준화, 커밋/캐시 정리는 호출자)
+        
+        삭제마다 flush 하여, 같은 트랜잭션에서 이어지는 재기준화가 갱신된 체인을 읽도록 한다.
+        
+        Returns:
+            회수한 바이트 수 (삭제 행 payload - 재기준화로 늘어난 payload/블록)
+        """
+        reclaimed = 0
+        for version in sorted(versions, key=lambda v: (v.document_id, v.version_number)):
+            reclaimed += _payload_size(version)
+            reclaimed -= await self._rebase_dependents(version)
+            await self.db.delete(version)
+            await self.db.flush()
+        return reclaimed
+    
+    async def compact_versions(
+        self,
+        document_id: int,
+        keyframe_interval: int = VERSION_KEYFRAME_INTERVAL,
+        inline_blocks: bool = False
+    ) -> Dict[str, int]:
+        """
+        문서의 기존 버전 전체를 키프레임 + 델타 체인 + 블록 참조로 다시 인코딩 (이전 형식 버전 정리용)
+        keyframe_interval=1, inline_blocks=True 이면 모든 버전을 블록이 포함된 전체 스냅샷으로 되돌린다.
+        
+        Returns:
+            {"versions": 버전 수, "bytes_before": 이전 JSON 크기, "bytes_after": 재인코딩 후 크기}
+        """
+        stmt = (
+            select(DocumentVersion)
+            .where(DocumentVersion.document_id == document_id)
+            .order_by(DocumentVersion.version_number)
+        )
+        result = await self.db.execute(stmt)
+        versions = result.scalars().all()
+        
+        # 재인코딩 전에 모든 스냅샷을 먼저 복원 (행을 고치는 동안 체인이 바뀌지 않도록)
+        snapshots = [await self._load_snapshot(version) for version in versions]
+        bytes_before = sum(_payload_size(v) for v in versions)
+        
+        bytes_after = 0
+        keyframe_number = None
+        previous_snapshot = None
+        previous_number = None
+        for version, snapshot in zip(versions, snapshots):
+            if version.content_tree is None or not has_block_ids(version.content_tree):
+                version.content_tree = build_content_tree(snapshot)[0]
+            delta = None
+            if keyframe_number is not None and version.version_number - keyframe_number < keyframe_interval:
+                delta = encode_version(previous_snapshot, snapshot)
+            if delta is None:
+                keyframe_number = version.version_number
+            # 블록 저장소에 새로 들어간 블록도 재인코딩 후 크기에 포함
+            bytes_after += await self._store_payload(
+                version,
+                snapshot if delta is None else delta,
+                base_version_number=None if delta is None else previous_number,
+                inline_blocks=inline_blocks
+            )
+            bytes_after += _payload_size(version)
+            previous_snapshot = snapshot
+            previous_number = version.version_number
+        
+        await self.db.commit()
+        return {"versions": len(versions), "bytes_before": bytes_before, "bytes_after": bytes_after}
+    
+    async def _rebase_dependents(self, version: DocumentVersion) -> int:
+        """
+        삭제될 버전을 기준으로 하는 델타 버전들을 삭제 버전의 기준 버전 대비 델타로 다시 인코딩
+        (삭제 버전이 키프레임이면 키프레임으로 승격). 커밋은 호출자가 한다.
+        
+        Returns:
+            재인코딩으로 늘어난 바이트 수 (payload 증가분 + 새로 저장된 블록)
+        """
+        stmt = select(DocumentVersion).where(
+            DocumentVersion.document_id == version.document_id,
+            DocumentVersion.base_version_number == version.version_number
+        )
+        result = await self.db.execute(stmt)
+        dependents = result.scalars().all()
+        if not dependents:
+            return 0
+        
+        base_snapshot = None
+        if version.base_version_number is not None:
+            base_version = await self._get_version_by_number(version.document_id, version.base_version_number)
+            base_snapshot = await self._load_snapshot(base_version)
+        
+        grown = 0
+        for dependent in dependents:
+            snapshot = await self._load_snapshot(dependent)
+            grown -= _payload_size(dependent)
+            if base_snapshot is None:
+                grown += await self._store_payload(dependent, snapshot)
+            else:
+                grown += await self._store_payload(
+                    dependent,
+                    make_delta(base_snapshot, snapshot),
+                    base_version_number=version.base_version_number
+                )
+            grown += _payload_size(dependent)
+        return grown
+    
     async def compare_versions(
         self,
         document_id: int,
@@ -306,28 +632,26 @@ class VersionService:
         Returns:
             차이점 정보 (VersionDiffResponse 형식)
         """
-        from sqlalchemy import select
-        from src.documents.models import Document
-        
         # 1. Source 버전 가져오기
-        source_version = await self.get_version(source_version_id)
+        source_version = await self._get_version_row(source_version_id)
         if not source_version or source_version.document_id != document_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Source version {source_version_id} not found"
             )
         
-        source_snapshot = source_version.snapshot_data
+        source_tree, blocks = await self._content_tree(source_version)
         
         # 2. Target 버전/문서 가져오기
+        target_version = None
         if target_version_id:
-            target_version = await self.get_version(target_version_id)
+            target_version = await self._get_version_row(target_version_id)
             if not target_version or target_version.document_id != document_id:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Target version {target_version_id} not found"
                 )
-            target_snapshot = target_version.snapshot_data
+            target_tree, target_blocks = await self._content_tree(target_version)
             target_version_number = target_version.version_number
         else:
             # 현재 문서 상태를 가져옴
@@ -346,11 +670,22 @@ class VersionService:
                 )
             
             # 현재 문서를 snapshot 형식으로 변환
-            target_snapshot = self._document_to_snapshot(document)
+            target_tree, target_blocks = build_content_tree(self._document_to_snapshot(document))
             target_version_number = None
-        
-        # 3. Diff 계산
-        diff_result = self._calculate_diff(source_snapshot, target_snapshot)
+        blocks.update(target_blocks)
+        
+        # 3. ✅ [Diff] 머클 트리 비교 - 해시가 같은 섹션은 건너뛰고, 바뀐 블록 내용만 블록 저장소에서 조회
+        plan = plan_diff(source_tree, target_tree)
+        missing = plan.needed - blocks.keys()
+        if missing:
+            blocks.update(await block_store.load(self.db, missing))
+            missing -= blocks.keys()
+        if missing:
+            # 블록 저장소 도입 이전(블록 인라인) 버전: 스냅샷을 복원해 블록을 얻는다
+            for version in (source_version, target_version):
+                if version is not None:
+                    blocks.update(build_content_tree(await self._load_snapshot(version))[1])
+        diff_result = render_diff(plan, blocks)
         
         return {
             "source_version": source_version.version_number,
@@ -358,196 +693,32 @@ class VersionService:
             **diff_result
         }
     
-    def _calculate_diff(self, source: Dict, target: Dict) -> Dict[str, Any]:
+    async def _content_tree(
+        self,
+        version: DocumentVersion
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
         """
-        두 스냅샷 간 차이 계산
+        버전의 머클 트리와 이미 알고 있는 블록 ({해시: 블록})
         
-        Args:
-            source: 비교 기준 스냅샷
-            target: 비교 대상 스냅샷
-        
-        Returns:
-            차이점 통계 및 상세 정보
+        저장된 트리가 있으면 스냅샷을 복원하지 않는다 (블록은 비교에 필요한 것만 나중에 조회).
+        트리가 없거나 블록 ID 가 없는 이전 형식 트리는 스냅샷에서 계산한다.
         """
-        # Section 식별: id 우선, fallback으로 title 사용
-        def make_section_key(section: Dict) -> str:
-            return str(section.get("id") or section.get("title"))
-        
-        source_sections = {make_section_key(s): s for s in source.get("sections", [])}
-        target_sections = {make_section_key(s): s for s in target.get("sections", [])}
-        
-        sections_added = []
-        sections_removed = []
-        sections_modified = []
-        
-        total_blocks_added = 0
-        total_blocks_removed = 0
-        total_blocks_modified = 0
-        total_chars_changed = 0
-        
-        # 섹션별 비교
-        all_section_titles = set(source_sections.keys()) | set(target_sections.keys())
-        
-        for title in all_section_titles:
-            source_section = source_sections.get(title)
-            target_section = target_sections.get(title)
-            
-            if not source_section:
-                # 새로 추가된 섹션
-                section_title = target_section.get("title", title) if target_section else title
-                sections_added.append(section_title)
-                if target_section:
-                    total_blocks_added += len(target_section.get("blocks", []))
-            elif not target_section:
-                # 삭제된 섹션
-                section_title = source_section.get("title", title)
-                sections_removed.append(section_title)
-                total_blocks_removed += len(source_section.get("blocks", []))
-            else:
-                # 변경된 섹션 검사
-                source_blocks = source_section.get("blocks", [])
-                target_blocks = target_section.get("blocks", [])
-                
-                section_diff = self._compare_blocks(source_blocks, target_blocks)
-                
-                if section_diff["has_changes"]:
-                    sections_modified.append({
-                        "section_id": target_section.get("id", title),
-                        "section_title": title,
-                        "changes": {
-                            "blocks_added": section_diff["blocks_added"],
-                            "blocks_removed": section_diff["blocks_removed"],
-                            "blocks_modified": section_diff["blocks_modified"],
-                        }
-                    })
-                    total_blocks_added += section_diff["blocks_added"]
-                    total_blocks_removed += section_diff["blocks_removed"]
-                    total_blocks_modified += section_diff["blocks_modified"]
-                    total_chars_changed += section_diff["chars_changed"]
-        
-        return {
-            "sections_added": sections_added,
-            "sections_removed": sections_removed,
-            "sections_modified": sections_modified,
-            "blocks_added": total_blocks_added,
-            "blocks_removed": total_blocks_removed,
-            "blocks_modified": total_blocks_modified,
-            "chars_changed": total_chars_changed,
-        }
+        if version.content_tree is not None and has_block_ids(version.content_tree):
+            return version.content_tree, {}
+        return build_content_tree(await self._load_snapshot(version))
     
-    def _compare_blocks(self, source_blocks: list, target_blocks: list) -> Dict[str, Any]:
-        """
-        블록 레벨 비교
-        
-        Args:
-            source_blocks: 원본 블록 리스트
-            target_blocks: 대상 블록 리스트
-        
-        Returns:
-            블록 변경 통계
-        """
-        # 성능 최적화: 동일한 경우 조기 종료
-        if len(source_blocks) == len(target_blocks) and source_blocks == target_blocks:
-            return {
-                "has_changes": False,
-                "blocks_added": 0,
-                "blocks_removed": 0,
-                "blocks_modified": 0,
-                "chars_changed": 0,
-            }
-        
-        source_block_ids = {b.get("id"): b for b in source_blocks}
-        target_block_ids = {b.get("id"): b for b in target_blocks}
-        
-        blocks_added = 0
-        blocks_removed = 0
-        blocks_modified = 0
-        chars_changed = 0
-        
-        all_block_ids = set(source_block_ids.keys()) | set(target_block_ids.keys())
-        
-        for block_id in all_block_ids:
-            source_block = source_block_ids.get(block_id)
-            target_block = target_block_ids.get(block_id)
-            
-            if not source_block:
-                blocks_added += 1
-                # 추가된 블록의 텍스트 길이
-                if target_block:
-                    chars_changed += self._count_block_chars(target_block)
-            elif not target_block:
-                blocks_removed += 1
-                # 삭제된 블록의 텍스트 길이
-                chars_changed += self._count_block_chars(source_block)
-            else:
-                # 블록 내용 비교 (중요 필드만)
-                if not self._blocks_equal(source_block, target_block):
-                    blocks_modified += 1
-                    # 변경된 텍스트 길이 근사치
-                    source_chars = self._count_block_chars(source_block)
-                    target_chars = self._count_block_chars(target_block)
-                    chars_changed += abs(target_chars - source_chars)
-        
-        has_changes = (blocks_added + blocks_removed + blocks_modified) > 0
-        
+    def _section_to_snapshot(self, section: Section) -> Dict[str, Any]:
+        """Section ORM 객체 → 스냅샷 섹션 (버전 스냅샷과 현재 문서 비교가 같은 해시를 내도록 공통 사용)"""
         return {
-            "has_changes": has_changes,
-            "blocks_added": blocks_added,
-            "blocks_removed": blocks_removed,
-            "blocks_modified": blocks_modified,
-            "chars_changed": chars_changed,
+            "id": str(section.id),
+            "title": section.title,
+            "description": section.description,
+            "order": section.order,
+            "blocks": section.blocks,
+            "griReference": section.gri_reference,
+            "metadata": section.section_metadata,
         }
     
-    def _blocks_equal(self, a: Dict, b: Dict) -> bool:
-        """
-        두 블록이 동일한지 중요 필드만 비교
-        
-        Args:
-            a: 블록 A
-            b: 블록 B
-        
-        Returns:
-            동일 여부
-        """
-        # blockType 비교
-        if a.get("blockType") != b.get("blockType"):
-            return False
-        
-        # content 비교 (핵심 내용)
-        if a.get("content") != b.get("content"):
-            return False
-        
-        # 블록 타입별 추가 속성 비교
-        block_type = a.get("blockType")
-        if block_type == "heading":
-            if a.get("level") != b.get("level"):
-                return False
-        elif block_type in ("list", "orderedList"):
-            if a.get("items") != b.get("items"):
-                return False
-        
-        return True
-    
-    def _count_block_chars(self, block: Dict) -> int:
-        """
-        블록의 텍스트 문자 수 계산
-        
-        Args:
-            block: 블록 객체
-        
-        Returns:
-            문자 수
-        """
-        content = block.get("content", [])
-        total_chars = 0
-        
-        for item in content:
-            if isinstance(item, dict):
-                text = item.get("text", "")
-                total_chars += len(text)
-        
-        return total_chars
-    
     def _document_to_snapshot(self, document) -> Dict[str, Any]:
         """
         Document 객체를 snapshot 형식으로 변환
@@ -560,16 +731,6 @@ class VersionService:
         """
         return {
             "title": document.title,
-            "sections": [
-                {
-                    "id": section.id,
-                    "title": section.title,
-                    "order": section.order,
-                    "blocks": section.blocks,
-                    "griReference": section.gri_reference,
-                    "metadata": section.section_metadata,
-                }
-                for section in document.sections
-            ]
+            "sections": [self._section_to_snapshot(section) for section in document.sections]
         }
 
@@ -0,0 +1,216 @@
+"""
+API 응답 캐시 (대시보드 조회 엔드포인트용)
+
+- 1차: 프로세스 내 LRU, 2차(선택): Redis (여러 워커가 같은 결과 공유)
+- 키에 '크롤 세대(generation)' 포함 → 기사 저장 시 세대만 올리면 이전 응답은 더 이상 조회되지 않음
+- 응답 본문 해시로 ETag 발급, If-None-Match 일치 시 304 (본문 전송 생략)
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from loguru import logger
+
+from ..core.config import settings
+from .responses import dumps_json
+
+try:
+    import redis.asyncio as aioredis
+    _redis_available = True
+except ImportError:
+    aioredis = None
+    _redis_available = False
+
+KEY_PREFIX = "esg:response_cache"
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+
+# Redis 오류 후 재시도까지 로컬 캐시만 사용하는 시간(초)
+REDIS_RETRY_SECONDS = 30.0
+
+# (본문 JSON 바이트, ETag)
+CachedBody = Tuple[bytes, str]
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 비교 (약한 비교, 다중 값 / '*' 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    크롤 세대 기반 응답 캐시
+
+    세대 번호는 Redis 사용 시 Redis 카운터(워커 간 공유), 아니면 프로세스 내 정수.
+    세대가 바뀐 항목은 지우지 않고 LRU / TTL 로 자연히 밀려나게 둔다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = settings.RESPONSE_CACHE_MAX_ENTRIES,
+        enabled: bool = settings.RESPONSE_CACHE_ENABLED,
+        redis_url: Optional[str] = settings.REDIS_URL if settings.RESPONSE_CACHE_USE_REDIS else None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, Tuple[float, CachedBody]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generation = 0
+        self._redis = None
+        self._redis_url = redis_url if _redis_available else None
+        self._redis_down_until = 0.0
+        if redis_url and not _redis_available:
+            logger.warning("RESPONSE_CACHE_USE_REDIS 설정됨, redis 패키지가 없어 로컬 캐시만 사용")
+
+    # ---------- Redis ----------
+
+    def _get_redis(self):
+        if not self._redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(self._redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        return self._redis
+
+    def _mark_redis_down(self, e: Exception) -> None:
+        logger.warning(f"응답 캐시 Redis 오류, {REDIS_RETRY_SECONDS:.0f}초간 로컬 캐시만 사용: {str(e)}")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    # ---------- 세대 ----------
+
+    async def get_generation(self) -> int:
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                value = await redis.get(GENERATION_KEY)
+                return int(value) if value is not None else 0
+            except Exception as e:
+                self._mark_redis_down(e)
+        return self._generation
+
+    async def bump_generation(self) -> None:
+        """크롤 세대 증가 (기사 저장 등 조회 결과가 바뀌는 쓰기 후 호출)"""
+        self._generation += 1
+        # 이전 세대 항목은 다시 조회되지 않으므로 로컬 메모리는 바로 비운다
+        self._entries.clear()
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                await redis.incr(GENERATION_KEY)
+            except Exception as e:
+                self._mark_redis_down(e)
+
+    # ---------- 조회 / 저장 ----------
+
+    @staticmethod
+    def make_key(namespace: str, params: Dict[str, Any], generation: int) -> str:
+        raw = json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+        return f"{KEY_PREFIX}:{namespace}:{generation}:{digest}"
+
+    def _get_local(self, key: str) -> Optional[CachedBody]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, cached = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return cached
+
+    def _set_local(self, key: str, cached: CachedBody) -> None:
+        self._entries[key] = (time.monotonic(), cached)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_remote(self, key: str) -> Optional[CachedBody]:
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            body = await redis.get(key)
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None
+        return (body, make_etag(body)) if body is not None else None
+
+    async def _set_remote(self, key: str, body: bytes) -> None:
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(key, body, ex=self.ttl_seconds)
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        params: Dict[str, Any],
+        producer: Callable[[], Awaitable[Any]],
+    ) -> CachedBody:
+        """캐시된 (본문, ETag) 반환, 없으면 producer 결과를 직렬화하여 저장"""
+        if not self.enabled:
+            body = dumps_json(await producer())
+            return body, make_etag(body)
+
+        key = self.make_key(namespace, params, await self.get_generation())
+        cached = self._get_local(key)
+        if cached is not None:
+            return cached
+
+        # 같은 키의 동시 미스는 한 번만 계산 (크롤 직후 대시보드 동시 접속 대비)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._get_local(key)
+                if cached is None:
+                    cached = await self._get_remote(key)
+                    if cached is None:
+                        body = dumps_json(await producer())
+                        cached = (body, make_etag(body))
+                        await self._set_remote(key, body)
+                    self._set_local(key, cached)
+                return cached
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                self._locks.pop(key, None)
+
+
+async def cached_response(
+    request: Request,
+    namespace: str,
+    params: Dict[str, Any],
+    producer: Callable[[], Awaitable[Any]],
+) -> Response:
+    """캐시된 JSON 응답 (ETag 포함, If-None-Match 일치 시 304)"""
+    body, etag = await response_cache.get_or_set(namespace, params, producer)
+    # no-cache: 브라우저는 저장하되 매번 ETag 로 재검증
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache()
@@ -0,0 +1,89 @@
+"""
+키셋(커서) 페이지네이션 공용 유틸리티
+(정렬 키, id) 복합 키 기준으로 다음 페이지를 조회하여 깊은 페이지도 첫 페이지와 같은 비용으로 처리한다.
+"""
+import base64
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, tuple_, literal
+from sqlalchemy.sql import ColumnElement
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 요청과 맞지 않는 커서"""
+    pass
+
+
+def encode_cursor(sort: str, value: Optional[datetime], row_id: int) -> str:
+    """(정렬 키 이름, 정렬 값, id) → 불투명 커서 문자열"""
+    payload = {"s": sort, "v": value.isoformat() if value is not None else None, "i": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Optional[datetime], int]:
+    """커서 문자열 → (정렬 값, id). 다른 정렬 기준으로 발급된 커서는 거부"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload.get("s") != sort:
+            raise InvalidCursorError(f"cursor was issued for sort={payload.get('s')}, not {sort}")
+        value = datetime.fromisoformat(payload["v"]) if payload.get("v") is not None else None
+        return value, int(payload["i"])
+    except InvalidCursorError:
+        raise
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+
+
+def keyset_order(sort_col, id_col, descending: bool = True) -> List[ColumnElement]:
+    """커서와 짝을 이루는 정렬 (NULL 은 항상 마지막)"""
+    if descending:
+        return [sort_col.desc().nulls_last(), id_col.desc()]
+    return [sort_col.asc().nulls_last(), id_col.asc()]
+
+
+def keyset_condition(sort_col, id_col, value: Optional[datetime], row_id: int, descending: bool = True) -> ColumnElement:
+    """커서 이후 행 조건 ((정렬 값, id) 행 비교, NULL 구간은 id 로만 진행)"""
+    if value is None:
+        # 이미 NULL 구간: 같은 NULL 구간 안에서 id 순으로만 진행
+        return and_(sort_col.is_(None), id_col < row_id if descending else id_col > row_id)
+    # 바인드 값은 컬럼 타입을 따르게 해 timestamptz 비교가 tz 정보를 잃지 않도록 한다
+    key = tuple_(sort_col, id_col)
+    bound = tuple_(literal(value, type_=sort_col.type), literal(row_id, type_=id_col.type))
+    after = key < bound if descending else key > bound
+    return or_(after, sort_col.is_(None))
+
+
+class CountCache:
+    """
+    총 개수 캐시 (TTL)
+
+    커서 페이지네이션에서는 페이지마다 count(*) 를 다시 돌리지 않고
+    필터 조합별로 잠시 캐시된 값을 총 개수 추정치로 사용한다.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if len(self._entries) >= self.max_entries:
+            # 가장 오래된 항목부터 제거
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            self._entries.pop(oldest, None)
+        self._entries[key] = (time.monotonic(), value)
@@ -0,0 +1,66 @@
+"""
+경량 JSON 응답 (orjson)
+
+목록 API 처럼 큰 응답에서 FastAPI 의 response_model 재검증 + jsonable_encoder 변환을 건너뛴다.
+서비스에서 model_construct 로 만든 응답 모델을 그대로 넘기면 orjson 이 직접 직렬화한다.
+orjson 미설치 환경에서는 표준 json 경로로 같은 방식(모델 → 필드 dict)으로 직렬화한다.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    orjson = None
+    _orjson_available = False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson 이 모르는 타입: Pydantic 모델은 필드 dict 로 (중첩 모델도 재귀적으로 여기로 옴)"""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    표준 json 경로의 default (orjson 경로와 같은 결과)
+
+    모델은 model_dump 를 거치지 않고 필드 dict 로 - model_construct 에 dict 항목을 넣은 응답도 경고 없이 직렬화.
+    UTC datetime 은 OPT_UTC_Z 와 같이 'Z' 표기, 그 외 타입은 jsonable_encoder.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    if isinstance(obj, datetime) and obj.utcoffset() == timedelta(0):
+        return obj.replace(tzinfo=None).isoformat() + "Z"
+    return jsonable_encoder(obj)
+
+
+def dumps_json(content: Any) -> bytes:
+    """응답 본문 직렬화 (UTC datetime 은 FastAPI 기본과 같이 'Z' 표기)"""
+    if _orjson_available:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        content,
+        default=_json_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class LeanJSONResponse(JSONResponse):
+    """검증 없이 바로 직렬화하는 JSON 응답 (라우터에서 서비스 결과를 그대로 감싸서 반환)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
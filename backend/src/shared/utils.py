@@ -0,0 +1,57 @@
+"""
+검색 유틸리티 (기사 / 문서 블록 검색 공용)
+검색어 분리, LIKE 이스케이프, 하이라이트 스니펫 생성
+"""
+import html
+import re
+from typing import List, Optional
+
+# 검색어 최대 토큰 수 (과도한 AND 조건 방지)
+MAX_SEARCH_TERMS = 5
+
+# 하이라이트 스니펫 길이 (매칭 위치 앞뒤 문자 수)
+SNIPPET_CONTEXT_CHARS = 40
+
+
+def split_search_terms(query: str) -> List[str]:
+    """공백 기준 검색어 분리 (중복 제거, 순서 유지)"""
+    terms: List[str] = []
+    for term in (query or "").split():
+        if term and term.lower() not in (t.lower() for t in terms):
+            terms.append(term)
+    return terms[:MAX_SEARCH_TERMS]
+
+
+def escape_like(term: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (escape 문자: 백슬래시)"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_highlight(text: Optional[str], terms: List[str], context: int = SNIPPET_CONTEXT_CHARS) -> Optional[str]:
+    """
+    첫 매칭 위치 주변 스니펫 생성, 검색어는 <mark> 로 감싼다
+
+    본문은 HTML 이스케이프되므로 프론트엔드에서 그대로 렌더링해도 안전하다.
+    """
+    if not text or not terms:
+        return None
+    pattern = re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    first = pattern.search(text)
+    if first is None:
+        return None
+
+    start = max(0, first.start() - context)
+    end = min(len(text), first.end() + context)
+    snippet = text[start:end]
+
+    parts: List[str] = []
+    cursor = 0
+    for match in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[cursor:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        cursor = match.end()
+    parts.append(html.escape(snippet[cursor:]))
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix